@@ -50,11 +50,67 @@ DATATYPE_REGISTER = {}
 NODE_REGISTER = {}
 FUNCTION_REGISTER = {}
 
+# ====== DATATYPE INDEXES ======== #
+# Updated on datatype registration
+RUNTIME_BASE_CLASSES = (luna_rig.Component, list, luna_rig.Control)
+DATATYPE_CLASS_INDEX = {}
+RUNTIME_DATATYPES = OrderedDict()
+RUNTIME_CLASSES = set()
+# Datatype compatibility, rebuilt after function registrations
+COMPATIBILITY_MATRIX = {}
+FUNCTION_DATATYPES_INDEX = {}
+# Datatype objects are reused between plugin reloads so existing sockets keep matching the register
+_INTERNED_DATATYPES = {}
+
 
 def instancer(cls):
     return cls()
 
 
+class DataTypeDesc(dict):
+    """Registered datatype. Keeps dict interface of datatype description, adds its register name and runtime flag."""
+
+    def __init__(self, name, type_dict):
+        super(DataTypeDesc, self).__init__(type_dict)
+        self.name = name
+        self.runtime = issubclass(self['class'], RUNTIME_BASE_CLASSES)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __eq__(self, other):
+        # Consistent with hash, datatypes are interned so descriptors of the same name are the same type
+        if self is other:
+            return True
+        return isinstance(other, DataTypeDesc) and self.name == other.name
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+def _add_datatype(type_name, type_dict):
+    desc = _INTERNED_DATATYPES.get(type_name)
+    if desc is None or not dict.__eq__(desc, type_dict):
+        desc = DataTypeDesc(type_name, type_dict)
+        _INTERNED_DATATYPES[type_name] = desc
+    DATATYPE_REGISTER[type_name] = desc
+    # First registered type of the class is used for lookups
+    DATATYPE_CLASS_INDEX.setdefault(desc['class'], desc)
+    if desc.runtime:
+        RUNTIME_DATATYPES[type_name] = desc
+        RUNTIME_CLASSES.add(desc['class'])
+    return desc
+
+
+def _clear_datatypes():
+    DATATYPE_REGISTER.clear()
+    DATATYPE_CLASS_INDEX.clear()
+    RUNTIME_DATATYPES.clear()
+    RUNTIME_CLASSES.clear()
+    COMPATIBILITY_MATRIX.clear()
+    FUNCTION_DATATYPES_INDEX.clear()
+
+
 @instancer
 class DataType(object):
 
@@ -110,7 +166,8 @@ class DataType(object):
     def _register_basic_types(cls):
         Logger.debug('Registering base datatypes')
         for type_name, type_dict in cls._basic_types():
-            DATATYPE_REGISTER[type_name] = type_dict
+            # Class attributes return registered objects
+            setattr(cls, type_name, _add_datatype(type_name, type_dict))
 
     @ classmethod
     def register_datatype(cls, type_name, type_class, color, label='custom_data', default_value=None):
@@ -122,20 +179,27 @@ class DataType(object):
                      'color': color if isinstance(color, QtGui.QColor) else QtGui.QColor(color),
                      'label': label,
                      'default': default_value}
-        DATATYPE_REGISTER[type_name.upper()] = type_dict
+        _add_datatype(type_name.upper(), type_dict)
 
     @classmethod
     def runtime_types(cls, names=False, classes=False):
-        result = []
-        for type_name, type_desc in DATATYPE_REGISTER.items():
-            if issubclass(type_desc['class'], (cls.COMPONENT['class'], cls.LIST['class'], cls.CONTROL['class'])):
-                if names:
-                    result.append(type_name)
-                elif classes:
-                    result.append(type_desc['class'])
-                else:
-                    result.append(DATATYPE_REGISTER[type_name])
-        return result
+        if names:
+            return list(RUNTIME_DATATYPES.keys())
+        elif classes:
+            return list(RUNTIME_CLASSES)
+        return list(RUNTIME_DATATYPES.values())
+
+    @classmethod
+    def is_runtime_type(cls, data_type):
+        """Check if values of datatype are only valid during build (components, controls, lists)."""
+        runtime = getattr(data_type, 'runtime', None)
+        if runtime is None:
+            runtime = issubclass(data_type['class'], RUNTIME_BASE_CLASSES)
+        return runtime
+
+    @classmethod
+    def is_runtime_class(cls, data_class):
+        return data_class in RUNTIME_CLASSES
 
     @classmethod
     def list_base_types(cls, of_type):
@@ -144,20 +208,46 @@ class DataType(object):
 
     @classmethod
     def get_type_from_dataclass(cls, dataclass):
-        for type_name, type_dict in DATATYPE_REGISTER.items():
-            if type_dict['class'] == dataclass:
-                return type_dict
+        if dataclass in DATATYPE_CLASS_INDEX:
+            return DATATYPE_CLASS_INDEX[dataclass]
         Logger.error('Failed to find registered data type for class {0}'.format(dataclass))
         raise ValueError
 
+    @classmethod
+    def find_registered(cls, data_type_dict):
+        """Registered datatype matching plain datatype dict by value.
+
+        :rtype: DataTypeDesc or None
+        """
+        for desc in DATATYPE_REGISTER.values():
+            if dict.__eq__(desc, data_type_dict):
+                return desc
+        return None
+
+    @classmethod
+    def resolve(cls, data_type):
+        """Interned datatype for type name, plain datatype dict or registered datatype.
+        Unregistered dicts are returned as is.
+
+        :rtype: DataTypeDesc or dict
+        """
+        if isinstance(data_type, str):
+            return cls.get_type(data_type)
+        if isinstance(data_type, DataTypeDesc):
+            return data_type
+        return cls.find_registered(data_type) or data_type
+
     @classmethod
     def get_type_name(cls, data_type_dict):
-        try:
-            type_name = [dt_name for dt_name, desc in DATATYPE_REGISTER.items() if desc == data_type_dict][0]
+        type_name = getattr(data_type_dict, 'name', None)
+        if type_name is not None and DATATYPE_REGISTER.get(type_name) is data_type_dict:
             return type_name
-        except IndexError:
-            Logger.exception('Failed to find datatype for class {0}'.format(data_type_dict['class']))
+        # Unregistered dict, compare by value
+        desc = cls.find_registered(data_type_dict)
+        if desc is None:
+            Logger.error('Failed to find datatype for class {0}'.format(data_type_dict['class']))
             raise IndexError
+        return desc.name
 
     @classmethod
     def get_type(cls, type_name):
@@ -179,6 +269,11 @@ def register_node(node_id, node_class):
 
 def _do_node_registrations():
     for node_id, node_class in NODES_QUEUE.items():
+        try:
+            node_class.build_socket_template()
+        except Exception:
+            Logger.exception('Failed to resolve socket schema of {0}'.format(node_class))
+            continue
         NODE_REGISTER[node_id] = node_class
         Logger.debug('Registered node {0}::{1}'.format(node_id, node_class))
     NODES_QUEUE.clear()
@@ -256,6 +351,7 @@ def _do_func_registrations():
             FUNCTION_REGISTER[dt_name][signature] = func_dict
             Logger.debug('Function registered {0}: {1}'.format(dt_name, signature))
     FUNCTIONS_QUEUE.clear()
+    _build_compatibility()
 
 
 def get_functions_map_from_datatype(datatype):
@@ -274,13 +370,59 @@ def get_class_name_from_signature(signature):
     return signature.split('.')[-2]
 
 
+# ========== COMPATIBILITY =========== #
+def _build_compatibility():
+    COMPATIBILITY_MATRIX.clear()
+    FUNCTION_DATATYPES_INDEX.clear()
+    data_classes = set([type_dict['class'] for type_dict in DATATYPE_REGISTER.values()])
+    for output_class in data_classes:
+        for input_class in data_classes:
+            COMPATIBILITY_MATRIX[(output_class, input_class)] = issubclass(output_class, input_class)
+
+    func_datatypes = [dt_name for dt_name in sorted(FUNCTION_REGISTER.keys()) if dt_name in DATATYPE_REGISTER]
+    for type_name, type_dict in DATATYPE_REGISTER.items():
+        FUNCTION_DATATYPES_INDEX[type_name] = [dt_name for dt_name in func_datatypes
+                                               if can_connect(type_dict['class'], DATATYPE_REGISTER[dt_name]['class'])]
+    Logger.debug('Built compatibility matrix for {0} datatype classes'.format(len(data_classes)))
+
+
+def can_connect(output_class, input_class):
+    """Check if value of output datatype class can be passed to input of another datatype class.
+
+    :param output_class: Source data class
+    :type output_class: type
+    :param input_class: Destination data class
+    :type input_class: type
+    :rtype: bool
+    """
+    key = (output_class, input_class)
+    if key not in COMPATIBILITY_MATRIX:
+        COMPATIBILITY_MATRIX[key] = issubclass(output_class, input_class)
+    return COMPATIBILITY_MATRIX[key]
+
+
+def list_function_datatypes(data_type):
+    """List function register datatypes that accept values of given datatype.
+
+    :param data_type: Registered datatype
+    :type data_type: dict
+    :return: Datatype names, unbound functions are not included.
+    :rtype: list
+    """
+    type_name = getattr(data_type, 'name', None)
+    if type_name in FUNCTION_DATATYPES_INDEX:
+        return FUNCTION_DATATYPES_INDEX[type_name]
+    return [dt_name for dt_name in sorted(FUNCTION_REGISTER.keys())
+            if dt_name in DATATYPE_REGISTER and can_connect(data_type['class'], DATATYPE_REGISTER[dt_name]['class'])]
+
+
 # ========== PLUGINS =========== #
 def load_plugins():
     Logger.info('Loading rig editor plugins...')
     # Clear queues and registers
     NODES_QUEUE.clear()
     FUNCTIONS_QUEUE.clear()
-    DATATYPE_REGISTER.clear()
+    _clear_datatypes()
     NODE_REGISTER.clear()
     FUNCTION_REGISTER.clear()
 
@@ -0,0 +1,268 @@
+"""Batch rig builds in a pool of mayapy worker processes.
+
+Usage:
+    python graph_batch.py jobs.json --workers 4 --report report.json
+
+Jobs file is a list of dicts with "project", "asset", "type" and "rig" keys.
+Each worker loads editor plugins once and builds its share of assets in headless scenes.
+"""
+import os
+import sys
+import json
+import timeit
+import argparse
+import datetime
+import threading
+import traceback
+import subprocess
+from collections import OrderedDict
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+from luna import Logger
+
+RESULT_PREFIX = 'LUNA_BATCH_RESULT:'
+READY_PREFIX = 'LUNA_BATCH_READY:'
+
+
+def default_mayapy():
+    if os.path.basename(sys.executable).lower().startswith('mayapy'):
+        return sys.executable
+    maya_location = os.environ.get('MAYA_LOCATION', '')
+    executable = 'mayapy.exe' if sys.platform == 'win32' else 'mayapy'
+    return os.path.join(maya_location, 'bin', executable)
+
+
+def load_jobs(file_path):
+    with open(file_path, 'r') as jobs_file:
+        jobs = json.load(jobs_file)
+    for job in jobs:
+        for key in ['project', 'asset', 'rig']:
+            if key not in job:
+                raise ValueError('Job {0} is missing "{1}" key'.format(job, key))
+        job.setdefault('type', 'character')
+    return jobs
+
+
+# ====== Worker side ====== #
+def emit(prefix, data):
+    # Leading newline keeps marker at line start after unterminated Maya output
+    sys.stdout.write('\n' + prefix + json.dumps(data) + '\n')
+    sys.stdout.flush()
+
+
+def build_asset(job, scene=None):
+    """Build single asset in the current Maya session.
+
+    :param job: Job data
+    :type job: dict
+    :param scene: Headless scene to load rig file into, new one is created if not specified.
+    :type scene: luna_builder.editor.node_scene.Scene
+    :return: Build status and error message
+    :rtype: tuple
+    """
+    import luna.workspace
+    import luna_builder.editor.node_scene as node_scene
+
+    try:
+        project = luna.workspace.Project.set(job['project'])
+        luna.workspace.Asset(project, job['asset'], job.get('type', 'character'))
+        if scene is None:
+            scene = node_scene.Scene(headless=True)
+        if not scene.load_from_file(job['rig']):
+            return 'failed', 'Failed to load {0}'.format(job['rig'])
+        if not scene.executor.execute_graph():
+            return 'failed', 'Build failed'
+        return 'success', None
+    except Exception:
+        Logger.exception('Failed to build {0}'.format(job['asset']))
+        return 'failed', traceback.format_exc()
+
+
+def run_worker():
+    """Worker loop. Reads jobs from stdin line by line and writes results to stdout."""
+    start_time = timeit.default_timer()
+    import maya.standalone
+    maya.standalone.initialize()
+    import luna_builder.editor.editor_conf as editor_conf
+    editor_conf.load_plugins()
+    emit(READY_PREFIX, {'startup_time': timeit.default_timer() - start_time})
+
+    for line in iter(sys.stdin.readline, ''):
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        start_time = timeit.default_timer()
+        status, error = build_asset(job)
+        emit(RESULT_PREFIX, {'status': status,
+                             'error': error,
+                             'time': timeit.default_timer() - start_time})
+
+
+# ====== Runner side ====== #
+class WorkerProcess(object):
+    """Handle to a mayapy worker. Output between results is collected as log of the current job."""
+
+    def __init__(self, mayapy):
+        self.mayapy = mayapy
+        self.process = None  # type: subprocess.Popen
+        self.startup_time = None
+
+    def start(self):
+        self.process = subprocess.Popen([self.mayapy, '-u', os.path.abspath(__file__), '--worker'],
+                                        stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT,
+                                        universal_newlines=True)
+        log_lines = []
+        ready = self.read_until(READY_PREFIX, log_lines)
+        if ready is None:
+            raise RuntimeError('Worker failed to start:\n{0}'.format(''.join(log_lines)))
+        self.startup_time = ready['startup_time']
+
+    def read_until(self, prefix, log_lines):
+        for line in iter(self.process.stdout.readline, ''):
+            index = line.find(prefix)
+            if index != -1:
+                if line[:index].strip():
+                    log_lines.append(line[:index] + '\n')
+                return json.loads(line[index + len(prefix):])
+            log_lines.append(line)
+        return None
+
+    def build(self, job):
+        log_lines = []
+        start_time = timeit.default_timer()
+        try:
+            self.process.stdin.write(json.dumps(job) + '\n')
+            self.process.stdin.flush()
+            result = self.read_until(RESULT_PREFIX, log_lines)
+        except (IOError, OSError):
+            result = None
+        if result is None:
+            self.process.wait()
+            result = {'status': 'crashed',
+                      'error': 'Worker exited with code {0}'.format(self.process.returncode),
+                      'time': timeit.default_timer() - start_time}
+            self.process = None
+        result['log'] = ''.join(log_lines)
+        return result
+
+    @property
+    def is_alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def stop(self):
+        if not self.is_alive:
+            return
+        self.process.stdin.close()
+        self.process.wait()
+
+
+class BatchRunner(object):
+    """Distributes build jobs between worker processes and collects results into a report."""
+
+    def __init__(self, jobs, workers=2, mayapy=None):
+        self.jobs = jobs
+        self.workers_count = max(1, min(workers, len(jobs)))
+        self.mayapy = mayapy or default_mayapy()
+        self.results = [None] * len(jobs)
+        self.workers_info = []
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+
+    def run(self):
+        start_time = timeit.default_timer()
+        for index, job in enumerate(self.jobs):
+            self._queue.put((index, job))
+
+        threads = [threading.Thread(target=self._worker_thread, args=(worker_index,)) for worker_index in range(self.workers_count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.create_report(timeit.default_timer() - start_time)
+
+    def _worker_thread(self, worker_index):
+        worker = None
+        while True:
+            try:
+                index, job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if worker is None or not worker.is_alive:
+                worker = WorkerProcess(self.mayapy)
+                try:
+                    worker.start()
+                    self._add_worker_info(worker_index, worker.startup_time)
+                except Exception as err:
+                    self._set_result(index, job, {'status': 'crashed', 'error': str(err), 'time': 0.0, 'log': ''})
+                    worker = None
+                    continue
+
+            self._set_result(index, job, worker.build(job))
+
+        if worker is not None:
+            worker.stop()
+
+    def _add_worker_info(self, worker_index, startup_time):
+        with self._lock:
+            self.workers_info.append(OrderedDict([('worker', worker_index), ('startup_time', startup_time)]))
+
+    def _set_result(self, index, job, result):
+        entry = OrderedDict([('asset', job['asset']),
+                             ('rig', job['rig']),
+                             ('status', result['status']),
+                             ('time', result['time']),
+                             ('error', result['error']),
+                             ('log', result['log'])])
+        with self._lock:
+            self.results[index] = entry
+            Logger.info('[{0}/{1}] {2}: {3} ({4:.2f}s)'.format(len([res for res in self.results if res]),
+                                                               len(self.jobs),
+                                                               job['asset'],
+                                                               result['status'],
+                                                               result['time']))
+
+    def create_report(self, total_time):
+        return OrderedDict([
+            ('date', datetime.datetime.now().isoformat()),
+            ('total_time', total_time),
+            ('succeeded', len([res for res in self.results if res['status'] == 'success'])),
+            ('failed', len([res for res in self.results if res['status'] != 'success'])),
+            ('workers', self.workers_info),
+            ('assets', self.results)
+        ])
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Build rigs for multiple assets in parallel mayapy processes.')
+    parser.add_argument('jobs', nargs='?', help='Json file with list of build jobs')
+    parser.add_argument('--workers', type=int, default=2, help='Number of worker processes')
+    parser.add_argument('--report', default='batch_report.json', help='Output report path')
+    parser.add_argument('--mayapy', default=None, help='Path to mayapy executable')
+    parser.add_argument('--worker', action='store_true', help=argparse.SUPPRESS)
+    parsed = parser.parse_args(args)
+
+    if parsed.worker:
+        run_worker()
+        return 0
+    if not parsed.jobs:
+        parser.error('Jobs file is required')
+
+    runner = BatchRunner(load_jobs(parsed.jobs), workers=parsed.workers, mayapy=parsed.mayapy)
+    report = runner.run()
+    with open(parsed.report, 'w') as report_file:
+        json.dump(report, report_file, indent=4)
+    Logger.info('Batch build finished in {0:.2f}s: {1} succeeded, {2} failed. Report: {3}'.format(report['total_time'],
+                                                                                                  report['succeeded'],
+                                                                                                  report['failed'],
+                                                                                                  parsed.report))
+    return 1 if report['failed'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,203 @@
+import os
+import json
+import hashlib
+import tempfile
+import importlib
+
+import pymel.core as pm
+from luna import Logger
+
+
+class CheckpointError(Exception):
+    pass
+
+
+# ====== Runtime values encoding ======== #
+def encode_value(value):
+    """Encode socket value to json compatible data. Rig objects are stored as class path and node name.
+
+    :raises CheckpointError: If value can't be restored from Maya scene.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    if isinstance(value, pm.PyNode):
+        return {'pynode': str(value)}
+    if hasattr(value, 'pynode'):
+        node = value.pynode
+    elif hasattr(value, 'transform'):
+        node = value.transform
+    else:
+        try:
+            json.dumps(value)
+            return value
+        except TypeError:
+            raise CheckpointError('Unsupported value: {0}'.format(value))
+    return {'class': '{0}.{1}'.format(value.__class__.__module__, value.__class__.__name__),
+            'node': str(node)}
+
+
+def decode_value(data):
+    if isinstance(data, list):
+        return [decode_value(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if 'pynode' in data:
+        return pm.PyNode(data['pynode'])
+    module_name, cls_name = data['class'].rsplit('.', 1)
+    cls = getattr(importlib.import_module(module_name), cls_name)
+    return cls(data['node'])
+
+
+class CheckpointCache(object):
+    """Maya scenes saved after checkpoint nodes, keyed by hash of the upstream graph.
+
+    Least recently used checkpoints are evicted once total size exceeds budget.
+    """
+
+    BUDGET_MB = 4096
+    SCENE_EXT = '.mb'
+    DATA_EXT = '.json'
+
+    def __init__(self, root_dir=None, budget_mb=None):
+        self.root_dir = root_dir or os.path.join(tempfile.gettempdir(), 'luna_checkpoints')
+        self.budget_mb = budget_mb or self.BUDGET_MB
+
+    def scene_path(self, key):
+        return os.path.join(self.root_dir, key + self.SCENE_EXT)
+
+    def data_path(self, key):
+        return os.path.join(self.root_dir, key + self.DATA_EXT)
+
+    def has(self, key):
+        return os.path.isfile(self.scene_path(key)) and os.path.isfile(self.data_path(key))
+
+    def save(self, key, data):
+        if not os.path.isdir(self.root_dir):
+            os.makedirs(self.root_dir)
+        with open(self.data_path(key), 'w') as data_file:
+            json.dump(data, data_file)
+        pm.exportAll(self.scene_path(key), force=True, type='mayaBinary', preserveReferences=True)
+        Logger.info('Saved build checkpoint {0}'.format(key))
+        self.evict()
+
+    def load(self, key):
+        with open(self.data_path(key), 'r') as data_file:
+            data = json.load(data_file)
+        pm.newFile(f=1)
+        pm.importFile(self.scene_path(key), defaultNamespace=True)
+        # Mark as recently used
+        os.utime(self.scene_path(key), None)
+        os.utime(self.data_path(key), None)
+        Logger.info('Restored build checkpoint {0}'.format(key))
+        return data
+
+    def list_entries(self):
+        """Checkpoint keys with last used time and size on disk.
+
+        :return: List of (key, mtime, size) tuples
+        :rtype: list
+        """
+        if not os.path.isdir(self.root_dir):
+            return []
+        entries = []
+        for file_name in os.listdir(self.root_dir):
+            if not file_name.endswith(self.SCENE_EXT):
+                continue
+            key = file_name[:-len(self.SCENE_EXT)]
+            size = 0
+            for path in [self.scene_path(key), self.data_path(key)]:
+                if os.path.isfile(path):
+                    size += os.path.getsize(path)
+            entries.append((key, os.path.getmtime(self.scene_path(key)), size))
+        return entries
+
+    def evict(self):
+        entries = sorted(self.list_entries(), key=lambda entry: entry[1])
+        total_size = sum([entry[2] for entry in entries])
+        budget = self.budget_mb * 1024 * 1024
+        while entries and total_size > budget:
+            key, mtime, size = entries.pop(0)
+            self.remove(key)
+            total_size -= size
+            Logger.debug('Evicted build checkpoint {0}'.format(key))
+
+    def remove(self, key):
+        for path in [self.scene_path(key), self.data_path(key)]:
+            if os.path.isfile(path):
+                os.remove(path)
+
+    def clear(self):
+        for key, mtime, size in self.list_entries():
+            self.remove(key)
+
+
+class ChainHasher(object):
+    """Computes rolling hashes of exec chain prefixes from node records and their input connections."""
+
+    IGNORED_KEYS = ('pos_x', 'pos_y', 'inputs', 'outputs', 'checkpoint')
+
+    def __init__(self, scene):
+        self.scene = scene
+
+    def node_record(self, node):
+        record = dict([(key, value) for key, value in node.serialize().items() if key not in self.IGNORED_KEYS])
+        # Own values of unconnected inputs, connected inputs are identified by their source
+        inputs = []
+        for socket in node.inputs:
+            sources = socket.list_connections()
+            if not sources:
+                inputs.append([socket.index, None if socket.is_runtime_data() else socket._value])
+                continue
+            inputs.append([socket.index, sources[0].uid])
+            # Include data only nodes feeding this node, they are not part of the chain
+            if not sources[0].node.IS_EXEC:
+                inputs.append(self.node_record(sources[0].node))
+        record['inputs'] = inputs
+        record['checkpoint_data'] = node.get_checkpoint_data()
+        return record
+
+    def chain_hashes(self, chain):
+        hashes = []
+        current = hashlib.sha1(json.dumps(self.scene.vars.serialize(), sort_keys=True, default=str).encode('utf-8'))
+        for node in chain:
+            records = [self.node_record(node)]
+            for body_node in node.scene.exec_plan.get_loop_body(node) if node.list_loop_outputs() else []:
+                records.append(self.node_record(body_node))
+            current.update(json.dumps(records, sort_keys=True, default=str).encode('utf-8'))
+            hashes.append(current.hexdigest())
+        return hashes
+
+
+def collect_values(scene, nodes):
+    """Encode output values of nodes and scene variables.
+
+    :raises CheckpointError: If any value can't be encoded.
+    """
+    values = {}
+    for node in nodes:
+        all_nodes = [node]
+        if node.list_loop_outputs():
+            all_nodes += list(scene.exec_plan.get_loop_body(node))
+        for each in all_nodes:
+            values[each.uid] = dict([(socket.index, encode_value(socket.value())) for socket in each.list_non_exec_outputs()])
+
+    scene_vars = {}
+    for var_name in scene.vars._vars.keys():
+        scene_vars[var_name] = encode_value(scene.vars.get_value(var_name))
+    return {'values': values, 'vars': scene_vars}
+
+
+def restore_values(scene, data):
+    for var_name, value in data.get('vars', {}).items():
+        if var_name in scene.vars._vars:
+            scene.vars.set_value(var_name, decode_value(value))
+
+    for node_uid, socket_values in data.get('values', {}).items():
+        node = scene.get_node(node_uid)
+        if not node:
+            continue
+        for socket in node.list_non_exec_outputs():
+            if str(socket.index) in socket_values:
+                socket.set_value(decode_value(socket_values[str(socket.index)]))
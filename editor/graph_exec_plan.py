@@ -0,0 +1,116 @@
+from collections import deque
+from collections import OrderedDict
+from luna import Logger
+
+
+class BranchStep(object):
+    """Plan step for a node which picks its exec outputs at runtime. Holds compiled segment for every output."""
+
+    def __init__(self, node, segments):
+        self.node = node
+        self.segments = segments  # type: OrderedDict
+
+
+class ExecPlan(object):
+    """Cache of flat execution segments compiled from the exec graph.
+
+    Each segment is a list of nodes and BranchSteps in execution order, compiled in one iterative pass.
+    Loop bodies are compiled as separate segments. Cache is invalidated when any exec edge changes.
+    """
+
+    def __init__(self, scene):
+        self.scene = scene
+        self._segments = {}
+        self._loop_segments = {}
+        # Nodes on exec path being compiled, across nested branch and loop segments
+        self._path = []
+        self._path_nodes = set()
+
+    def invalidate(self):
+        self._segments.clear()
+        self._loop_segments.clear()
+
+    def get_segment(self, start_node):
+        # Checked before cache so compiled segments never reference segments on their own path
+        if start_node in self._path_nodes:
+            Logger.warning('Exec cycle detected at {0}, skipping'.format(start_node.title))
+            return []
+        if start_node not in self._segments:
+            self._segments[start_node] = self.compile_segment(start_node)
+        return self._segments[start_node]
+
+    def compile_segment(self, start_node):
+        """Compile nodes reachable from start node. Node reached by several exec paths
+        is executed once for each of them, node reached from its own path is a cycle and is skipped.
+        """
+        steps = []
+        base_depth = len(self._path)
+        stack = [(start_node, base_depth)]
+        try:
+            while stack:
+                node, depth = stack.pop()
+                self._unwind_path(depth)
+                if node in self._path_nodes:
+                    Logger.warning('Exec cycle detected at {0}, skipping'.format(node.title))
+                    continue
+                self._path.append(node)
+                self._path_nodes.add(node)
+
+                # Loop bodies
+                for loop_socket in node.list_loop_outputs():
+                    connections = loop_socket.list_connections()
+                    self._loop_segments[node] = self.get_segment(connections[0].node) if connections else []
+
+                # Runtime branching
+                if node.BRANCHING:
+                    segments = OrderedDict()
+                    for exec_out in node.list_all_exec_outputs():
+                        connections = exec_out.list_connections()
+                        segments[exec_out] = self.get_segment(connections[0].node) if connections else []
+                    steps.append(BranchStep(node, segments))
+                    continue
+
+                steps.append(node)
+                for exec_out in reversed(node.list_exec_outputs()):
+                    connections = exec_out.list_connections()
+                    if connections:
+                        stack.append((connections[0].node, depth + 1))
+        finally:
+            self._unwind_path(base_depth)
+        return steps
+
+    def _unwind_path(self, depth):
+        while len(self._path) > depth:
+            self._path_nodes.discard(self._path.pop())
+
+    def flatten(self, segment):
+        """Resolve segment into exec queue, picking branch outputs with their current state.
+
+        :param segment: Compiled segment
+        :type segment: list
+        :return: Nodes in execution order
+        :rtype: deque
+        """
+        queue = deque()
+        iterators = [iter(segment)]
+        while iterators:
+            try:
+                step = next(iterators[-1])
+            except StopIteration:
+                iterators.pop()
+                continue
+            if isinstance(step, BranchStep):
+                queue.append(step.node)
+                for exec_out in reversed(step.node.list_exec_outputs()):
+                    iterators.append(iter(step.segments.get(exec_out, [])))
+            else:
+                queue.append(step)
+        return queue
+
+    def get_queue(self, start_node):
+        return self.flatten(self.get_segment(start_node))
+
+    def get_loop_body(self, loop_node):
+        if loop_node not in self._loop_segments:
+            self.get_segment(loop_node)
+        return self.flatten(self._loop_segments.get(loop_node, []))
@@ -1,17 +1,116 @@
 import timeit
+import itertools
 
 from collections import deque
+from PySide2 import QtCore
+import pymel.core as pm
+import maya.api.OpenMaya as om
 from luna import Logger
 import luna_builder.editor.editor_conf as editor_conf
+import luna_builder.editor.graph_profiler as graph_profiler
+import luna_builder.editor.graph_checkpoints as graph_checkpoints
+
+
+class NodeChangesTracker(object):
+    """Context manager recording changes made to Maya scene while active.
+
+    All changes are recorded in a named undo chunk, so node execution can be rolled back completely,
+    including edits of nodes created by other graph nodes (attributes, parenting, constraints, weights).
+    Handles to created DG nodes are collected as well to validate the results are still in the scene.
+    """
+
+    _chunk_ids = itertools.count()
+
+    def __init__(self):
+        self.handles = []
+        self.chunk_name = None
+        self._callback_id = None
+
+    def __enter__(self):
+        self.chunk_name = 'luna_exec_{0}'.format(next(self._chunk_ids))
+        pm.undoInfo(openChunk=True, chunkName=self.chunk_name)
+        self._callback_id = om.MDGMessage.addNodeAddedCallback(self._on_node_added, 'dependNode')
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        om.MMessage.removeCallback(self._callback_id)
+        self._callback_id = None
+        pm.undoInfo(closeChunk=True)
+
+    def _on_node_added(self, mobject, *args):
+        self.handles.append(om.MObjectHandle(mobject))
+
+    def all_valid(self):
+        return all([handle.isValid() for handle in self.handles])
+
+    def can_undo(self):
+        """Check if recorded changes are the last entry of Maya undo queue."""
+        if not self.chunk_name or not pm.undoInfo(q=True, state=True):
+            return False
+        return pm.undoInfo(q=True, undoName=True) == self.chunk_name
+
+    def undo(self):
+        """Revert all changes recorded by the tracker.
+
+        :return: If changes were reverted. Changes can't be reverted if undo is disabled,
+                 queue was flushed or other actions were recorded after the tracker.
+        :rtype: bool
+        """
+        if not self.can_undo():
+            return False
+        pm.undo()
+        self.chunk_name = None
+        self.handles = []
+        return True
+
+
+class BuildReport(object):
+    """Summary of an incremental build: which nodes were skipped, rolled back and executed and why."""
+
+    def __init__(self):
+        self.skipped = deque()
+        self.rolled_back = deque()
+        self.executed = deque()
+
+    def add_skipped(self, node, reason):
+        self.skipped.append((node, reason))
+
+    def add_rolled_back(self, node, reason):
+        self.rolled_back.append((node, reason))
+
+    def add_executed(self, node, reason):
+        self.executed.append((node, reason))
+
+    def log(self):
+        Logger.info('Incremental build report: {0} skipped, {1} rolled back, {2} executed'.format(len(self.skipped),
+                                                                                                  len(self.rolled_back),
+                                                                                                  len(self.executed)))
+        for label, entries in [('Skipped', self.skipped), ('Rolled back', self.rolled_back), ('Executed', self.executed)]:
+            for node, reason in entries:
+                Logger.info('  {0}: {1} - {2}'.format(label, node.title, reason))
+
+
+class ExecutorSignals(QtCore.QObject):
+    node_started = QtCore.Signal(object)
+    node_finished = QtCore.Signal(object, bool)
 
 
 class GraphExecutor(object):
     # TODO: Step by step execution
     def __init__(self, scene):
         self.scene = scene
+        self.signals = ExecutorSignals()
         self.step = 0
         self._exec_chain = deque()  # type: deque
         self._exec_set = set()  # type: set
+        # Top level nodes executed by the last build paired with the DG nodes they created
+        self._built_chain = deque()  # type: deque
+        self.last_report = None  # type: BuildReport
+        self.profiler = graph_profiler.GraphProfiler(scene)
+        # Checkpoints
+        self.use_checkpoints = False
+        self.checkpoints = graph_checkpoints.CheckpointCache()
+        self._chain_hashes = {}
 
     @property
     def exec_chain(self):
@@ -39,8 +138,9 @@ class GraphExecutor(object):
             Logger.warning('More than 1 input node in the scene. Only the first one added will be executed!')
         return input_nodes[0]
 
-    def ready_to_execute(self):
-        self.reset_nodes_compiled_state()
+    def ready_to_execute(self, reset_compiled=True):
+        if reset_compiled:
+            self.reset_nodes_compiled_state()
         input_node = self.find_input_node()
         if not input_node:
             return False
@@ -53,42 +153,202 @@ class GraphExecutor(object):
         return True
 
     def execute_graph(self):
+        """Build the whole graph.
+
+        :return: Build success status.
+        :rtype: bool
+        """
         self.reset_stepped_execution()
         if not self.ready_to_execute():
-            return
+            return False
 
         Logger.info('Initiating new build...')
+        self._built_chain.clear()
+        start_index = 0
+        if self.use_checkpoints:
+            self.update_chain_hashes()
+            start_index = self.restore_checkpoint()
+        return self.run_nodes(list(self.exec_chain)[start_index:])
+
+    def execute_incremental(self):
+        """Re-execute only dirty nodes and everything downstream of them, skipping the clean prefix of the chain.
+
+        Results of re-executed nodes are rolled back by undoing their undo chunks in reverse order, which also
+        reverts changes they made to nodes of the clean prefix. If any chunk can't be undone
+        (undo disabled or queue modified since the build) it falls back to full build.
+        Full build is also used when there is no previous build to resume from.
+
+        :return: Build success status.
+        :rtype: bool
+        """
+        self.reset_stepped_execution()
+        if not self.ready_to_execute(reset_compiled=False):
+            return False
+
+        if self.use_checkpoints:
+            self.update_chain_hashes()
+        report = BuildReport()
+        prefix_length, reason = self.find_clean_prefix()
+        if not prefix_length:
+            Logger.info('Nothing to resume from ({0}), running full build...'.format(reason))
+            return self.execute_graph()
+
+        # Skip clean prefix
+        for node in list(self.exec_chain)[:prefix_length]:
+            report.add_skipped(node, 'Up to date')
+
+        # Remove results of previously executed nodes that will be re-executed
+        while len(self._built_chain) > prefix_length:
+            node, tracker = self._built_chain.pop()
+            if not tracker.undo():
+                Logger.warning('Failed to roll back {0}: undo queue changed since last build, running full build...'.format(node.title))
+                return self.execute_graph()
+            report.add_rolled_back(node, 'Outdated results')
+
+        nodes_to_run = list(self.exec_chain)[prefix_length:]
+        if not nodes_to_run:
+            Logger.info('Build is up to date')
+            report.log()
+            self.last_report = report
+            return True
+
+        first_dirty = nodes_to_run[0]
+        report.add_executed(first_dirty, reason)
+        for node in nodes_to_run[1:]:
+            report.add_executed(node, 'Modified' if node.is_dirty() else 'Downstream of {0}'.format(first_dirty.title))
+        report.log()
+        self.last_report = report
+
+        Logger.info('Initiating incremental build from {0}...'.format(first_dirty.title))
+        return self.run_nodes(nodes_to_run)
+
+    def find_clean_prefix(self):
+        """Find number of nodes at the start of exec chain that can be reused from the previous build.
+
+        :return: Prefix length and reason the first node after prefix has to be executed.
+        :rtype: tuple
+        """
+        if not self._built_chain:
+            return 0, 'No previous build'
+
+        prefix_length = 0
+        reason = 'New node in chain'
+        for index, node in enumerate(self.exec_chain):
+            if index >= len(self._built_chain) or self._built_chain[index][0] is not node:
+                reason = 'New node in chain'
+                break
+            if node.is_dirty():
+                reason = 'Modified'
+                break
+            prefix_length += 1
+
+        for node, tracker in list(self._built_chain)[:prefix_length]:
+            if not tracker.all_valid():
+                return 0, 'Maya scene changed since last build'
+        return prefix_length, reason
+
+    # ====== Checkpoints ====== #
+    def update_chain_hashes(self):
+        hashes = graph_checkpoints.ChainHasher(self.scene).chain_hashes(self.exec_chain)
+        self._chain_hashes = dict(zip(self.exec_chain, hashes))
+
+    def restore_checkpoint(self):
+        """Open the latest checkpoint matching current chain.
+
+        :return: Index of the first node to execute after restored checkpoint.
+        :rtype: int
+        """
+        chain = list(self.exec_chain)
+        for index in reversed(range(len(chain))):
+            node = chain[index]
+            if not node.checkpoint or not self.checkpoints.has(self._chain_hashes[node]):
+                continue
+            try:
+                self.scene.is_executing = True
+                data = self.checkpoints.load(self._chain_hashes[node])
+                graph_checkpoints.restore_values(self.scene, data)
+            except Exception:
+                Logger.exception('Failed to restore checkpoint for {0}'.format(node.title))
+                return 0
+            finally:
+                self.scene.is_executing = False
+
+            for restored_node in chain[:index + 1]:
+                restored_node.set_compiled(True)
+                restored_node.set_invalid(False)
+                self._built_chain.append((restored_node, NodeChangesTracker()))
+            Logger.info('Resuming build after checkpoint {0}'.format(node.title))
+            return index + 1
+        return 0
+
+    def save_checkpoint(self, node):
+        key = self._chain_hashes.get(node)
+        if not key or self.checkpoints.has(key):
+            return
+        try:
+            data = graph_checkpoints.collect_values(self.scene, [built_node for built_node, tracker in self._built_chain])
+        except graph_checkpoints.CheckpointError as err:
+            Logger.warning('Skipped checkpoint for {0}: {1}'.format(node.title, err))
+            return
+        try:
+            self.checkpoints.save(key, data)
+        except Exception:
+            Logger.exception('Failed to save checkpoint for {0}'.format(node.title))
+
+    def run_nodes(self, nodes):
         start_time = timeit.default_timer()
         self.scene.is_executing = True
-        for node in self.exec_chain:
+        self.profiler.start_session()
+        for node in nodes:
             try:
-                node._exec()
+                self.exec_node(node)
+                if self.use_checkpoints and node.checkpoint:
+                    self.save_checkpoint(node)
             except Exception:
                 Logger.exception('Failed to execute {0}'.format(node.title))
+                self.profiler.end_session()
                 self.scene.is_executing = False
-                return
+                return False
 
+        self.profiler.end_session()
         Logger.info("Build finished in {0:.2f}s".format(timeit.default_timer() - start_time))
         self.scene.is_executing = False
+        return True
+
+    def exec_node(self, node):
+        tracker = NodeChangesTracker()
+        self._built_chain.append((node, tracker))
+        with tracker:
+            node._exec()
 
     def execute_step(self):
         if self.step == len(self.exec_chain):
             self.reset_stepped_execution()
 
-        if not self.exec_chain and not self.ready_to_execute():
-            return
+        if not self.exec_chain:
+            if not self.ready_to_execute():
+                return
+            self._built_chain.clear()
 
+        # Stepped build is profiled as a single session
+        if self.step == 0:
+            self.profiler.start_session()
         try:
             self.scene.is_executing = True
             node = self.exec_chain[self.step]
-            node._exec()
+            self.exec_node(node)
             self.step += 1
+            self.scene.is_executing = False
         except Exception:
             Logger.exception('Failed to execute {0}'.format(node.title))
+            self.profiler.end_session()
             self.scene.is_executing = False
             return
+        if self.step == len(self.exec_chain):
+            self.profiler.end_session()
 
     def reset_stepped_execution(self):
+        self.profiler.end_session()
         self.step = 0
         self.exec_chain.clear()
         self.exec_set.clear()
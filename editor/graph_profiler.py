@@ -0,0 +1,289 @@
+import time
+import timeit
+import contextlib
+from collections import OrderedDict
+from PySide2 import QtCore
+from PySide2 import QtWidgets
+
+import maya.api.OpenMaya as om
+from luna import Logger
+import luna.utils.fileFn as fileFn
+
+try:
+    cpu_timer = time.process_time
+except AttributeError:
+    cpu_timer = time.clock
+
+
+class ProfilerSignals(QtCore.QObject):
+    session_finished = QtCore.Signal()
+
+
+class ProfileRecord(object):
+    """Timings of a single Node._exec call. Nested calls (loop bodies) are stored as children."""
+
+    def __init__(self, node, parent=None):
+        self.title = node.title
+        self.node_class = node.__class__.__name__
+        self.func_signature = getattr(node, 'func_signature', None)
+        self.parent = parent  # type: ProfileRecord
+        self.children = []
+
+        self.start_time = 0.0
+        self.wall_time = 0.0
+        self.cpu_time = 0.0
+        self.dg_nodes = 0
+        self._cpu_start = 0.0
+        self._dg_start = 0
+
+    @property
+    def self_wall_time(self):
+        return self.wall_time - sum([child.wall_time for child in self.children])
+
+    @property
+    def self_cpu_time(self):
+        return self.cpu_time - sum([child.cpu_time for child in self.children])
+
+    @property
+    def self_dg_nodes(self):
+        return self.dg_nodes - sum([child.dg_nodes for child in self.children])
+
+    def start(self, profiler):
+        self.start_time = timeit.default_timer() - profiler.session_start
+        self._cpu_start = cpu_timer()
+        self._dg_start = profiler.dg_count
+
+    def stop(self, profiler):
+        self.wall_time = timeit.default_timer() - profiler.session_start - self.start_time
+        self.cpu_time = cpu_timer() - self._cpu_start
+        self.dg_nodes = profiler.dg_count - self._dg_start
+
+    def walk(self):
+        yield self
+        for child in self.children:
+            for record in child.walk():
+                yield record
+
+
+class GraphProfiler(object):
+    """Records wall time, CPU time and number of created DG nodes for every executed node."""
+
+    def __init__(self, scene):
+        self.scene = scene
+        self.signals = ProfilerSignals()
+        self.enabled = False
+        self.records = []
+        self.session_start = 0.0
+        self.session_time = 0.0
+        self.dg_count = 0
+
+        self._stack = []
+        self._callback_id = None
+
+    @property
+    def is_recording(self):
+        return self._callback_id is not None
+
+    def start_session(self):
+        if not self.enabled or self.is_recording:
+            return
+        self.records = []
+        self._stack = []
+        self.dg_count = 0
+        self.session_start = timeit.default_timer()
+        self._callback_id = om.MDGMessage.addNodeAddedCallback(self._on_node_added, 'dependNode')
+
+    def end_session(self):
+        if not self.is_recording:
+            return
+        om.MMessage.removeCallback(self._callback_id)
+        self._callback_id = None
+        self.session_time = timeit.default_timer() - self.session_start
+        self.signals.session_finished.emit()
+
+    def _on_node_added(self, *args):
+        self.dg_count += 1
+
+    @contextlib.contextmanager
+    def record(self, node):
+        if not self.is_recording:
+            yield None
+            return
+
+        record = ProfileRecord(node, parent=self._stack[-1] if self._stack else None)
+        self._stack.append(record)
+        record.start(self)
+        try:
+            yield record
+        finally:
+            record.stop(self)
+            self._stack.pop()
+            if record.parent:
+                record.parent.children.append(record)
+            else:
+                self.records.append(record)
+
+    def walk(self):
+        for record in self.records:
+            for nested in record.walk():
+                yield nested
+
+    def aggregate(self, by_signature=False):
+        """Sum self timings of records grouped by node class or function signature.
+
+        :param by_signature: Group function nodes by their signature instead of class name.
+        :type by_signature: bool
+        :return: Group name -> dict with calls, wall, cpu and dg_nodes
+        :rtype: OrderedDict
+        """
+        result = OrderedDict()
+        for record in self.walk():
+            key = record.func_signature if by_signature and record.func_signature else record.node_class
+            if key not in result:
+                result[key] = {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'dg_nodes': 0}
+            result[key]['calls'] += 1
+            result[key]['wall'] += record.self_wall_time
+            result[key]['cpu'] += record.self_cpu_time
+            result[key]['dg_nodes'] += record.self_dg_nodes
+        return result
+
+    def as_chrome_trace(self):
+        events = []
+        for record in self.walk():
+            events.append(OrderedDict([
+                ('name', record.title),
+                ('cat', record.node_class),
+                ('ph', 'X'),
+                ('ts', record.start_time * 1000000.0),
+                ('dur', record.wall_time * 1000000.0),
+                ('pid', 1),
+                ('tid', 1),
+                ('args', OrderedDict([
+                    ('cpu_time', record.cpu_time),
+                    ('dg_nodes', record.dg_nodes),
+                    ('func_signature', record.func_signature)
+                ]))
+            ]))
+        return OrderedDict([('traceEvents', events), ('displayTimeUnit', 'ms')])
+
+    def export_chrome_trace(self, file_path):
+        try:
+            fileFn.write_json(file_path, data=self.as_chrome_trace(), sort_keys=False)
+            Logger.info('Exported build profile {0}'.format(file_path))
+        except Exception:
+            Logger.exception('Failed to export build profile')
+
+
+class QLNumericTableItem(QtWidgets.QTableWidgetItem):
+
+    def __init__(self, value, precision=3):
+        text = '{0:.{1}f}'.format(value, precision) if isinstance(value, float) else str(value)
+        super(QLNumericTableItem, self).__init__(text)
+        self.setData(QtCore.Qt.UserRole, value)
+        self.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+
+    def __lt__(self, other):
+        return self.data(QtCore.Qt.UserRole) < other.data(QtCore.Qt.UserRole)
+
+
+class ProfilerWidget(QtWidgets.QWidget):
+
+    COLUMNS = ['Name', 'Calls', 'Wall (s)', 'CPU (s)', 'DG Nodes']
+
+    def __init__(self, main_window, parent=None):
+        super(ProfilerWidget, self).__init__(parent)
+        self.main_window = main_window
+        self._profiler = None  # type: GraphProfiler
+
+        self.create_widgets()
+        self.create_layouts()
+        self.create_connections()
+
+    @property
+    def profiler(self):
+        if not self.main_window.current_editor:
+            return None
+        return self.main_window.current_editor.scene.executor.profiler
+
+    def create_widgets(self):
+        self.enabled_checkbox = QtWidgets.QCheckBox('Profile builds')
+        self.group_combobox = QtWidgets.QComboBox()
+        self.group_combobox.addItems(['Node class', 'Function'])
+        self.export_btn = QtWidgets.QPushButton('Export trace...')
+        self.total_label = QtWidgets.QLabel()
+
+        self.table = QtWidgets.QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.setSortingEnabled(True)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().hide()
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+
+    def create_layouts(self):
+        options_layout = QtWidgets.QHBoxLayout()
+        options_layout.setContentsMargins(0, 0, 0, 0)
+        options_layout.addWidget(self.enabled_checkbox)
+        options_layout.addWidget(self.group_combobox)
+        options_layout.addStretch()
+        options_layout.addWidget(self.export_btn)
+
+        self.main_layout = QtWidgets.QVBoxLayout()
+        self.main_layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self.main_layout)
+        self.main_layout.addLayout(options_layout)
+        self.main_layout.addWidget(self.table)
+        self.main_layout.addWidget(self.total_label)
+
+    def create_connections(self):
+        self.enabled_checkbox.toggled.connect(self.on_enabled_toggled)
+        self.group_combobox.currentIndexChanged.connect(lambda index: self.populate())
+        self.export_btn.clicked.connect(self.export_trace)
+
+    def on_enabled_toggled(self, state):
+        if self.profiler:
+            self.profiler.enabled = state
+
+    def update_profiler(self):
+        if self._profiler:
+            try:
+                self._profiler.signals.session_finished.disconnect(self.populate)
+            except RuntimeError:
+                pass
+        self._profiler = self.profiler
+        if self._profiler:
+            self._profiler.signals.session_finished.connect(self.populate)
+            self.enabled_checkbox.setChecked(self._profiler.enabled)
+        self.populate()
+
+    def populate(self):
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        self.total_label.clear()
+        if not self.profiler or not self.profiler.records:
+            self.table.setSortingEnabled(True)
+            return
+
+        aggregated = self.profiler.aggregate(by_signature=self.group_combobox.currentIndex() == 1)
+        self.table.setRowCount(len(aggregated))
+        for row, (name, stats) in enumerate(aggregated.items()):
+            self.table.setItem(row, 0, QtWidgets.QTableWidgetItem(name))
+            self.table.setItem(row, 1, QLNumericTableItem(stats['calls']))
+            self.table.setItem(row, 2, QLNumericTableItem(stats['wall']))
+            self.table.setItem(row, 3, QLNumericTableItem(stats['cpu']))
+            self.table.setItem(row, 4, QLNumericTableItem(stats['dg_nodes']))
+        self.table.setSortingEnabled(True)
+        self.table.sortItems(2, QtCore.Qt.DescendingOrder)
+
+        nodes_time = sum([record.wall_time for record in self.profiler.records])
+        self.total_label.setText('Build: {0:.2f}s, nodes: {1:.2f}s, overhead: {2:.2f}s'.format(self.profiler.session_time,
+                                                                                              nodes_time,
+                                                                                              self.profiler.session_time - nodes_time))
+
+    def export_trace(self):
+        if not self.profiler or not self.profiler.records:
+            Logger.warning('No build profile to export')
+            return
+        file_path = QtWidgets.QFileDialog.getSaveFileName(self, 'Export build profile', '', 'Chrome Trace (*.json)')[0]
+        if not file_path:
+            return
+        self.profiler.export_chrome_trace(file_path)
@@ -0,0 +1,176 @@
+"""Warm build server. Keeps Maya, luna and editor plugins loaded between builds.
+
+Usage:
+    mayapy graph_server.py serve --port 7345
+    python graph_server.py build --project <path> --asset <name> --rig <file>
+
+Protocol is newline separated json over a local TCP socket.
+Client sends a single request: {"command": "build" | "reload" | "ping" | "shutdown", ...job keys}
+Server streams events back until "finished" event and closes the connection.
+"""
+import sys
+import json
+import socket
+import timeit
+import argparse
+
+from luna import Logger
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 7345
+
+
+class BuildServer(object):
+    """Serves build requests one at a time. Each build runs in a new Maya scene and headless graph scene."""
+
+    def __init__(self, port=DEFAULT_PORT):
+        self.port = port
+        self.running = False
+        self._connection = None  # type: socket.socket
+
+    def initialize(self):
+        start_time = timeit.default_timer()
+        import maya.standalone
+        maya.standalone.initialize()
+        import luna_builder.editor.editor_conf as editor_conf
+        editor_conf.load_plugins()
+        Logger.info('Build server initialized in {0:.2f}s'.format(timeit.default_timer() - start_time))
+
+    def serve(self):
+        self.initialize()
+        server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server_socket.bind((DEFAULT_HOST, self.port))
+        server_socket.listen(5)
+        Logger.info('Build server listening on {0}:{1}'.format(DEFAULT_HOST, self.port))
+
+        self.running = True
+        try:
+            while self.running:
+                self._connection, address = server_socket.accept()
+                try:
+                    request = json.loads(self._connection.makefile('r').readline())
+                    self.handle_request(request)
+                except Exception as err:
+                    Logger.exception('Failed to handle build request')
+                    self.send_event('finished', status='failed', error=str(err))
+                finally:
+                    self._connection.close()
+                    self._connection = None
+        finally:
+            server_socket.close()
+
+    def send_event(self, event, **data):
+        data['event'] = event
+        try:
+            self._connection.sendall((json.dumps(data) + '\n').encode('utf-8'))
+        except (IOError, OSError):
+            Logger.debug('Client disconnected, dropped event {0}'.format(event))
+
+    def handle_request(self, request):
+        command = request.get('command', 'build')
+        if command == 'ping':
+            self.send_event('finished', status='success')
+        elif command == 'shutdown':
+            self.running = False
+            self.send_event('finished', status='success')
+        elif command == 'reload':
+            import luna_builder.editor.editor_conf as editor_conf
+            editor_conf.load_plugins()
+            self.send_event('finished', status='success')
+        elif command == 'build':
+            self.build(request)
+        else:
+            self.send_event('finished', status='failed', error='Unknown command: {0}'.format(command))
+
+    def build(self, job):
+        import pymel.core as pm
+        import luna_builder.editor.node_scene as node_scene
+        import luna_builder.editor.graph_batch as graph_batch
+
+        start_time = timeit.default_timer()
+        self.send_event('started', asset=job.get('asset'), rig=job.get('rig'))
+        pm.newFile(f=1)
+        scene = node_scene.Scene(headless=True)
+        node_times = {}
+
+        def on_node_started(node):
+            node_times[node] = timeit.default_timer()
+            self.send_event('node_started', title=node.title, node_class=node.__class__.__name__)
+
+        def on_node_finished(node, success):
+            self.send_event('node_finished',
+                            title=node.title,
+                            status='success' if success else 'failed',
+                            time=timeit.default_timer() - node_times.pop(node, start_time))
+
+        scene.executor.signals.node_started.connect(on_node_started)
+        scene.executor.signals.node_finished.connect(on_node_finished)
+        status, error = graph_batch.build_asset(job, scene=scene)
+        self.send_event('finished', status=status, error=error, time=timeit.default_timer() - start_time)
+
+
+class BuildClient(object):
+    """Sends requests to a running build server and yields streamed events."""
+
+    def __init__(self, port=DEFAULT_PORT, timeout=None):
+        self.port = port
+        self.timeout = timeout
+
+    def request(self, command, **data):
+        data['command'] = command
+        connection = socket.create_connection((DEFAULT_HOST, self.port), timeout=self.timeout)
+        try:
+            connection.sendall((json.dumps(data) + '\n').encode('utf-8'))
+            for line in iter(connection.makefile('r').readline, ''):
+                event = json.loads(line)
+                yield event
+                if event['event'] == 'finished':
+                    break
+        finally:
+            connection.close()
+
+    def build(self, project, asset, rig, asset_type='character'):
+        return self.request('build', project=project, asset=asset, rig=rig, type=asset_type)
+
+    def is_running(self):
+        try:
+            return list(self.request('ping'))[-1]['status'] == 'success'
+        except (IOError, OSError):
+            return False
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Luna warm build server.')
+    parser.add_argument('command', choices=['serve', 'build', 'reload', 'ping', 'shutdown'])
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--project', help='Project path')
+    parser.add_argument('--asset', help='Asset name')
+    parser.add_argument('--type', default='character', help='Asset type')
+    parser.add_argument('--rig', help='Rig build file')
+    parsed = parser.parse_args(args)
+
+    if parsed.command == 'serve':
+        BuildServer(port=parsed.port).serve()
+        return 0
+
+    client = BuildClient(port=parsed.port)
+    if parsed.command == 'build':
+        if not all([parsed.project, parsed.asset, parsed.rig]):
+            parser.error('--project, --asset and --rig are required for build')
+        events = client.build(parsed.project, parsed.asset, parsed.rig, asset_type=parsed.type)
+    else:
+        events = client.request(parsed.command)
+
+    status = 'failed'
+    for event in events:
+        if event['event'] == 'node_finished':
+            Logger.info('  {0}: {1} ({2:.2f}s)'.format(event['title'], event['status'], event['time']))
+        elif event['event'] == 'finished':
+            status = event['status']
+            Logger.info('{0}: {1}{2}'.format(parsed.command, status, ' - {0}'.format(event['error']) if event.get('error') else ''))
+    return 0 if status == 'success' else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,8 +14,17 @@ class QLCutLine(QtWidgets.QGraphicsItem):
 
         self.setZValue(2)
 
+    def add_point(self, point):
+        self.prepareGeometryChange()
+        self.line_points.append(point)
+
+    def clear(self):
+        self.prepareGeometryChange()
+        self.line_points = []
+
     def boundingRect(self):
-        return self.shape().boundingRect()
+        margin = self._pen.widthF()
+        return self.shape().boundingRect().adjusted(-margin, -margin, margin, margin)
 
     def shape(self):
 
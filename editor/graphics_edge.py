@@ -3,6 +3,7 @@ from PySide2 import QtGui
 from PySide2 import QtWidgets
 
 from luna import Logger
+import luna_builder.editor.graphics_lod as graphics_lod
 
 
 class QLGraphicsEdge(QtWidgets.QGraphicsPathItem):
@@ -10,6 +11,7 @@ class QLGraphicsEdge(QtWidgets.QGraphicsPathItem):
     MAX_WIDTH = 6.0
     MIN_WIDTH = 2.0
     WIDTH = 2.0
+    SELECTED_COLOR = "#00ff00"
 
     def __init__(self, edge, parent=None):
         super(QLGraphicsEdge, self).__init__(parent)
@@ -20,6 +22,10 @@ class QLGraphicsEdge(QtWidgets.QGraphicsPathItem):
         # Init variables
         self.source_position = [0, 0]
         self.destination_position = [200, 100]
+        self.lod = graphics_lod.FULL
+        # Geometry cache, rebuilt only when end points change
+        self._path = None
+        self._bounding_rect = None
 
         self.init_assets()
         self.init_ui()
@@ -31,7 +37,7 @@ class QLGraphicsEdge(QtWidgets.QGraphicsPathItem):
     def init_assets(self):
         # Colors and pens
         self._color = QtGui.QColor("#001000")
-        self._color_selected = QtGui.QColor("#00ff00")
+        self._color_selected = QtGui.QColor(self.SELECTED_COLOR)
         self._pen = QtGui.QPen(self._color)
         self._pen_selected = QtGui.QPen(self._color_selected)
         self._pen_dragging = QtGui.QPen(self._color)
@@ -47,19 +53,55 @@ class QLGraphicsEdge(QtWidgets.QGraphicsPathItem):
     # ======== Methods ======= #
 
     def set_source(self, x, y):
-        self.source_position = [x, y]
+        if self.source_position != [x, y]:
+            self.source_position = [x, y]
+            self.invalidate_path()
 
     def set_destination(self, x, y):
-        self.destination_position = [x, y]
+        if self.destination_position != [x, y]:
+            self.destination_position = [x, y]
+            self.invalidate_path()
+
+    def invalidate_path(self):
+        """Drop cached geometry. Path is recalculated on next paint or scene query."""
+        self.prepareGeometryChange()
+        hidden = not self.isVisible() and self.scene() is not None
+        if hidden:
+            # Old line area, drawn by scene background
+            self.scene().update(self.sceneBoundingRect())
+        self._path = None
+        self._bounding_rect = None
+        if hidden:
+            self.scene().update(self.sceneBoundingRect())
+
+    def refresh(self):
+        """Schedule repaint of the edge. Hidden edges are drawn by scene background in overview tier."""
+        if self.isVisible():
+            self.update()
+        elif self.scene() is not None:
+            self.scene().update(self.sceneBoundingRect())
+
+    def path(self):
+        if self._path is None:
+            self._path = self.calc_path()
+        return self._path
 
     def boundingRect(self):
-        return self.shape().boundingRect()
+        if self._bounding_rect is None:
+            # Include pen width so thick selected edges are repainted fully
+            margin = self.MAX_WIDTH * 0.5
+            self._bounding_rect = self.path().boundingRect().adjusted(-margin, -margin, margin, margin)
+        return self._bounding_rect
 
     def shape(self):
-        return self.calc_path()
+        return self.path()
+
+    def set_lod(self, tier):
+        """Connected edges are drawn by scene in overview tier."""
+        self.lod = tier
+        self.setVisible(tier < graphics_lod.OVERVIEW or not self.edge.start_socket or not self.edge.end_socket)
 
     def paint(self, painter, widget=None, options=None):
-        self.setPath(self.calc_path())
         self._pen.setWidthF(self.WIDTH)
 
         if self.edge.end_socket and self.edge.start_socket:
@@ -79,8 +121,7 @@ class QLGraphicsEdge(QtWidgets.QGraphicsPathItem):
     def intersects_with(self, pt1, pt2):
         cutpath = QtGui.QPainterPath(pt1)
         cutpath.lineTo(pt2)
-        path = self.calc_path()
-        return cutpath.intersects(path)
+        return cutpath.intersects(self.path())
 
 
 class QLGraphicsEdgeDirect(QLGraphicsEdge):
@@ -0,0 +1,49 @@
+"""Level of detail tiers of graph rendering.
+
+FULL - everything is drawn.
+REDUCED - node titles, status icons and socket labels are hidden.
+OVERVIEW - nodes are flat rects, sockets are hidden and connected edges are drawn by scene as straight lines batched by color.
+"""
+
+FULL = 0
+REDUCED = 1
+OVERVIEW = 2
+
+
+class LevelOfDetail(object):
+    """Tracks current tier of view zoom level.
+
+    Each tier is entered at one zoom level and left at a higher one,
+    so tiers don't flicker while zooming around the threshold.
+    """
+
+    # Tier: (zoom to enter tier, zoom to go back to finer tier)
+    THRESHOLDS = {REDUCED: (2, 4),
+                  OVERVIEW: (-2, 0)}
+
+    def __init__(self, zoom=None):
+        self.tier = FULL
+        if zoom is not None:
+            self.update(zoom)
+
+    def tier_for_zoom(self, zoom):
+        tier = self.tier
+        while tier < OVERVIEW and zoom <= self.THRESHOLDS[tier + 1][0]:
+            tier += 1
+        while tier > FULL and zoom >= self.THRESHOLDS[tier][1]:
+            tier -= 1
+        return tier
+
+    def update(self, zoom):
+        """Update tier for new zoom level.
+
+        :param zoom: View zoom level
+        :type zoom: float
+        :return: If tier has changed
+        :rtype: bool
+        """
+        tier = self.tier_for_zoom(zoom)
+        if tier == self.tier:
+            return False
+        self.tier = tier
+        return True
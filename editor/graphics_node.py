@@ -5,6 +5,8 @@ from PySide2 import QtCore
 from PySide2 import QtGui
 from PySide2 import QtWidgets
 
+import luna_builder.editor.graphics_lod as graphics_lod
+
 
 class QLGraphicsTitle(QtWidgets.QGraphicsTextItem):
 
@@ -40,9 +42,86 @@ class QLGraphicsTitle(QtWidgets.QGraphicsTextItem):
         self.gr_node.node.signals.title_edited.emit(new_text)
 
 
+class NodeStyle(object):
+    """Pens, brushes, fonts and outline paths shared by all graphics nodes.
+
+    Paths are cached by node geometry so nodes of the same size reuse them.
+    """
+
+    MAX_CACHED_SHAPES = 1024
+    _instance = None  # type: NodeStyle
+
+    def __init__(self):
+        # Fonts colors
+        self.title_text_color = QtCore.Qt.white
+        self.title_font = QtGui.QFont(*Config.get(BuilderVars.title_font, default=['Roboto', 10], cached=True))
+        self.title_font.setBold(True)
+
+        # Pens, Brushes
+        self.pen_default = QtGui.QPen(QtGui.QColor("#7F000000"))
+        self.pen_selected = QtGui.QPen(QtGui.QColor("#FFA637"))
+        self.brush_background = QtGui.QBrush(QtGui.QColor("#E3212121"))
+        self._title_brushes = {}
+        self._shapes = {}
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def title_brush(self, color):
+        """Shared brush for title color.
+
+        :param color: Title color
+        :type color: QtGui.QColor
+        :rtype: QtGui.QBrush
+        """
+        brush = self._title_brushes.get(color.rgba())
+        if brush is None:
+            brush = self._title_brushes[color.rgba()] = QtGui.QBrush(color)
+        return brush
+
+    def node_shapes(self, width, height, title_height, roundness):
+        """Title, content and outline paths for node of given size.
+
+        :rtype: tuple(QtGui.QPainterPath, QtGui.QPainterPath, QtGui.QPainterPath)
+        """
+        key = (width, height, title_height, roundness)
+        shapes = self._shapes.get(key)
+        if shapes is None:
+            if len(self._shapes) >= self.MAX_CACHED_SHAPES:
+                self._shapes.clear()
+            shapes = self._shapes[key] = self.build_node_shapes(width, height, title_height, roundness)
+        return shapes
+
+    @staticmethod
+    def build_node_shapes(width, height, title_height, roundness):
+        # title
+        path_title = QtGui.QPainterPath()
+        path_title.setFillRule(QtCore.Qt.WindingFill)
+        path_title.addRoundedRect(0, 0, width, title_height, roundness, roundness)
+        path_title.addRect(0, title_height - roundness, roundness, roundness)
+        path_title.addRect(width - roundness, title_height - roundness, roundness, roundness)
+
+        # content
+        path_content = QtGui.QPainterPath()
+        path_content.setFillRule(QtCore.Qt.WindingFill)
+        path_content.addRoundedRect(0, title_height, width, height - title_height, roundness, roundness)
+        path_content.addRect(0, title_height, roundness, roundness)
+        path_content.addRect(width - roundness, title_height, roundness, roundness)
+
+        # outline
+        path_outline = QtGui.QPainterPath()
+        path_outline.addRoundedRect(-1, -1, width + 2, height + 2, roundness, roundness)
+        return path_title.simplified(), path_content.simplified(), path_outline.simplified()
+
+
 class QLGraphicsNode(QtWidgets.QGraphicsItem):
 
-    TEXT_ZOOM_OUT_LIMIT = 2
+    # Coarsest level of detail title is drawn at
+    TITLE_LOD = graphics_lod.FULL
+    OUTLINE_MARGIN = 2.0
 
     def __init__(self, node, parent=None):
         super(QLGraphicsNode, self).__init__(parent)
@@ -50,11 +129,13 @@ class QLGraphicsNode(QtWidgets.QGraphicsItem):
 
         # Init flags
         self._was_moved = False
+        self.lod = graphics_lod.FULL
 
         self.init_sizes()
         self.init_assets()
 
         self.init_ui()
+        self.set_lod(self.node.scene.lod_tier)
 
     def init_ui(self):
         self.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable)
@@ -94,16 +175,16 @@ class QLGraphicsNode(QtWidgets.QGraphicsItem):
         self.lower_padding = 8.0
 
     def init_assets(self):
+        self._style = NodeStyle.get()
         # Fonts colors
-        self._title_color = QtCore.Qt.white
-        self._title_font = QtGui.QFont(*Config.get(BuilderVars.title_font, default=['Roboto', 10], cached=True))
-        self._title_font.setBold(True)
+        self._title_color = self._style.title_text_color
+        self._title_font = self._style.title_font
 
         # Pens, Brushes
-        self._pen_default = QtGui.QPen(QtGui.QColor("#7F000000"))
-        self._pen_selected = QtGui.QPen(QtGui.QColor("#FFA637"))
-        self._brush_background = QtGui.QBrush(QtGui.QColor("#E3212121"))
-        self._brush_title = QtGui.QBrush(self.title_color)
+        self._pen_default = self._style.pen_default
+        self._pen_selected = self._style.pen_selected
+        self._brush_background = self._style.brush_background
+        self._brush_title = self._style.title_brush(self.title_color)
 
     def init_title(self):
         self.title_item = QLGraphicsTitle(self, is_editable=self.node.TITLE_EDITABLE)
@@ -114,47 +195,61 @@ class QLGraphicsNode(QtWidgets.QGraphicsItem):
     def init_content(self):
         pass
 
+    def set_lod(self, tier):
+        """Show or hide title and sockets for level of detail tier.
+
+        :param tier: Level of detail tier
+        :type tier: int
+        """
+        self.lod = tier
+        self.title_item.setVisible(tier <= self.TITLE_LOD)
+        for socket in self.node.inputs + self.node.outputs:
+            if socket.gr_socket is not None:
+                socket.gr_socket.set_lod(tier)
+
     def paint(self, painter, option, widget=None):
-        self.title_item.setVisible(self.node.scene.view.zoom > self.TEXT_ZOOM_OUT_LIMIT)
+        if self.lod == graphics_lod.OVERVIEW:
+            self.paint_overview(painter)
+            return
 
+        path_title, path_content, path_outline = self._style.node_shapes(self.width, self.height, self.title_height, self.edge_roundness)
         # title
-        path_title = QtGui.QPainterPath()
-        path_title.setFillRule(QtCore.Qt.WindingFill)
-        path_title.addRoundedRect(0, 0, self.width, self.title_height, self.edge_roundness, self.edge_roundness)
-        path_title.addRect(0, self.title_height - self.edge_roundness, self.edge_roundness, self.edge_roundness)
-        path_title.addRect(self.width - self.edge_roundness, self.title_height - self.edge_roundness, self.edge_roundness, self.edge_roundness)
         painter.setPen(QtCore.Qt.NoPen)
         painter.setBrush(self._brush_title)
-        painter.drawPath(path_title.simplified())
+        painter.drawPath(path_title)
 
         # content
-        path_content = QtGui.QPainterPath()
-        path_content.setFillRule(QtCore.Qt.WindingFill)
-        path_content.addRoundedRect(0, self.title_height, self.width, self.height - self.title_height, self.edge_roundness, self.edge_roundness)
-        path_content.addRect(0, self.title_height, self.edge_roundness, self.edge_roundness)
-        path_content.addRect(self.width - self.edge_roundness, self.title_height, self.edge_roundness, self.edge_roundness)
-        painter.setPen(QtCore.Qt.NoPen)
         painter.setBrush(self._brush_background)
-        painter.drawPath(path_content.simplified())
+        painter.drawPath(path_content)
 
         # outline
         # TODO: Paint prominent outline if exec input is connected
-        path_outline = QtGui.QPainterPath()
-        path_outline.addRoundedRect(-1, -1, self.width + 2, self.height + 2, self.edge_roundness, self.edge_roundness)
         painter.setPen(self._pen_default if not self.isSelected() else self._pen_selected)
         painter.setBrush(QtCore.Qt.NoBrush)
-        painter.drawPath(path_outline.simplified())
+        painter.drawPath(path_outline)
+
+    def paint_overview(self, painter):
+        painter.setPen(self._pen_selected if self.isSelected() else QtCore.Qt.NoPen)
+        painter.setBrush(self._brush_title)
+        painter.drawRect(0, 0, self.width, self.height)
+
+    def node_rect(self):
+        return QtCore.QRectF(0, 0, self.width, self.height).normalized()
 
     def boundingRect(self):
-        return QtCore.QRectF(0,
-                             0,
-                             self.width,
-                             self.height).normalized()
+        # Outline is drawn outside of node rect
+        return self.node_rect().adjusted(-self.OUTLINE_MARGIN, -self.OUTLINE_MARGIN, self.OUTLINE_MARGIN, self.OUTLINE_MARGIN)
+
+    def shape(self):
+        path = QtGui.QPainterPath()
+        path.addRect(self.node_rect())
+        return path
 
     # Events
     def mouseMoveEvent(self, event):
         super(QLGraphicsNode, self).mouseMoveEvent(event)
         for node in self.scene().scene.selected_nodes:
+            node.invalidate_serialized()
             node.update_connected_edges()
         self._was_moved = True
 
@@ -162,4 +257,5 @@ class QLGraphicsNode(QtWidgets.QGraphicsItem):
         super(QLGraphicsNode, self).mouseReleaseEvent(event)
         if self._was_moved:
             self._was_moved = False
-            self.node.scene.history.store_history('Node moved', set_modified=True)
+            moved_nodes = tuple(sorted([node.uid for node in self.node.scene.selected_nodes]))
+            self.node.scene.history.store_history('Node moved', set_modified=True, coalesce_key=('move', moved_nodes))
@@ -3,8 +3,16 @@ from PySide2 import QtCore
 from PySide2 import QtGui
 from PySide2 import QtWidgets
 
+import luna_builder.editor.graphics_lod as graphics_lod
+import luna_builder.editor.graphics_edge as graphics_edge
+
 
 class QLGraphicsScene(QtWidgets.QGraphicsScene):
+
+    # Grid tile resolution range as powers of two of view scale
+    MIN_TILE_SCALE_POWER = -3
+    MAX_TILE_SCALE_POWER = 3
+
     def __init__(self, scene, parent=None):
         super(QLGraphicsScene, self).__init__(parent)
         self.scene = scene
@@ -22,6 +30,10 @@ class QLGraphicsScene(QtWidgets.QGraphicsScene):
         self._pen_dark = QtGui.QPen(self._color_dark)
         self._pen_dark.setWidth(2)
 
+        self._edge_pens = {}
+        self._grid_tile_key = None
+        self._grid_tile_brush = None
+
         self.setBackgroundBrush(self._color_background)
 
     # ======== Events ========= #
@@ -34,32 +46,88 @@ class QLGraphicsScene(QtWidgets.QGraphicsScene):
     def set_scene_size(self, width, height):
         self.setSceneRect(-width // 2, -height // 2, width, height)
 
-    def drawBackground(self, painter, rect):
-        super(QLGraphicsScene, self).drawBackground(painter, rect)
-        left = int(math.floor(rect.left()))
-        right = int(math.ceil(rect.right()))
-        top = int(math.floor(rect.top()))
-        bottom = int(math.ceil(rect.bottom()))
-
-        firt_left = left - (left % self.grid_size)
-        first_top = top - (top % self.grid_size)
-
-        # Compute line drawing
-        lines_light, lines_dark = [], []
-        for x in range(firt_left, right, self.grid_size):
-            if (x % (self.grid_size * self.grid_squares)):
-                lines_light.append(QtCore.QLine(x, top, x, bottom))
-            else:
-                lines_dark.append(QtCore.QLine(x, top, x, bottom))
+    def grid_tile_brush(self, scale):
+        """Texture brush with one major grid cell, regenerated only when grid settings or zoom tier change.
 
-        for y in range(first_top, bottom, self.grid_size):
-            if (y % (self.grid_size * self.grid_squares)):
-                lines_light.append(QtCore.QLine(left, y, right, y))
-            else:
-                lines_dark.append(QtCore.QLine(left, y, right, y))
+        :param scale: View scale, tile is rendered at the nearest power of two
+        :type scale: float
+        :rtype: QtGui.QBrush
+        """
+        tier_scale = 2.0 ** max(self.MIN_TILE_SCALE_POWER, min(self.MAX_TILE_SCALE_POWER, int(math.ceil(math.log(max(scale, 1e-6), 2)))))
+        key = (self.grid_size,
+               self.grid_squares,
+               tier_scale,
+               self._color_background.rgba(),
+               self._color_light.rgba(),
+               self._color_dark.rgba())
+        if key == self._grid_tile_key:
+            return self._grid_tile_brush
 
-        # Draw lines
+        tile_size = self.grid_size * self.grid_squares
+        pixel_size = max(1, int(round(tile_size * tier_scale)))
+        pixmap = QtGui.QPixmap(pixel_size, pixel_size)
+        pixmap.fill(self._color_background)
+        painter = QtGui.QPainter(pixmap)
+        painter.scale(float(pixel_size) / tile_size, float(pixel_size) / tile_size)
         painter.setPen(self._pen_light)
-        painter.drawLines(lines_light)
+        for step in range(1, self.grid_squares):
+            painter.drawLine(step * self.grid_size, 0, step * self.grid_size, tile_size)
+            painter.drawLine(0, step * self.grid_size, tile_size, step * self.grid_size)
+        # Dark lines are on tile border, half of their width on each side
         painter.setPen(self._pen_dark)
-        painter.drawLines(lines_dark)
+        for offset in [0, tile_size]:
+            painter.drawLine(offset, 0, offset, tile_size)
+            painter.drawLine(0, offset, tile_size, offset)
+        painter.end()
+
+        brush = QtGui.QBrush(pixmap)
+        brush.setTransform(QtGui.QTransform.fromScale(float(tile_size) / pixel_size, float(tile_size) / pixel_size))
+        self._grid_tile_key = key
+        self._grid_tile_brush = brush
+        return brush
+
+    def drawBackground(self, painter, rect):
+        # Tiles are aligned to scene origin, same as major grid lines
+        painter.setBrushOrigin(0, 0)
+        painter.fillRect(rect, self.grid_tile_brush(painter.worldTransform().m11()))
+
+        view = self.scene.view
+        if view is not None and view.lod.tier == graphics_lod.OVERVIEW:
+            self.draw_overview_edges(painter, rect)
+
+    def get_edge_pen(self, color):
+        pen = self._edge_pens.get(color.rgba())
+        if pen is None:
+            pen = self._edge_pens[color.rgba()] = QtGui.QPen(color)
+            pen.setCosmetic(True)
+        return pen
+
+    def draw_overview_edges(self, painter, rect):
+        """Draw connected edges as straight lines, one draw call per color.
+
+        :param painter: Background painter
+        :type painter: QtGui.QPainter
+        :param rect: Exposed scene rect
+        :type rect: QtCore.QRectF
+        """
+        batches = {}
+        selected = []
+        for edge in self.scene.edges:
+            gr_edge = edge.gr_edge
+            if gr_edge is None or not edge.start_socket or not edge.end_socket:
+                continue
+            if not rect.intersects(gr_edge.boundingRect()):
+                continue
+            line = QtCore.QLineF(QtCore.QPointF(*gr_edge.source_position), QtCore.QPointF(*gr_edge.destination_position))
+            if gr_edge.isSelected():
+                selected.append(line)
+            else:
+                color = edge.start_socket.gr_socket._color_background
+                batches.setdefault(color.rgba(), (color, []))[1].append(line)
+
+        for color, lines in batches.values():
+            painter.setPen(self.get_edge_pen(color))
+            painter.drawLines(lines)
+        if selected:
+            painter.setPen(self.get_edge_pen(QtGui.QColor(graphics_edge.QLGraphicsEdge.SELECTED_COLOR)))
+            painter.drawLines(selected)
@@ -5,20 +5,24 @@ from PySide2 import QtCore
 from luna import Logger
 from luna import Config
 from luna import BuilderVars
+import luna_builder.editor.graphics_lod as graphics_lod
 
 
 class QLGraphicsSocket(QtWidgets.QGraphicsItem):
 
-    TEXT_ZOOM_OUT_LIMIT = 2
-    SOCKET_ZOOM_OUT_LIMIT = 2
+    # Coarsest levels of detail label and socket are drawn at
+    LABEL_LOD = graphics_lod.FULL
+    SOCKET_LOD = graphics_lod.REDUCED
 
     def __init__(self, socket):
         self.socket = socket
         super(QLGraphicsSocket, self).__init__(socket.node.gr_node)
+        self.lod = graphics_lod.FULL
 
         self.init_sizes()
         self.init_assets()
         self.init_inner_classes()
+        self.set_lod(self.parentItem().lod)
 
     def init_sizes(self):
         self.radius = 6.0
@@ -45,10 +49,12 @@ class QLGraphicsSocket(QtWidgets.QGraphicsItem):
         if self.socket.node_position in [self.socket.Position.RIGHT_TOP, self.socket.Position.RIGHT_BOTTOM]:
             self.align_text_right()
 
+    def set_lod(self, tier):
+        self.lod = tier
+        self.setVisible(tier <= self.SOCKET_LOD)
+        self.text_item.setVisible(tier <= self.LABEL_LOD)
+
     def paint(self, painter, option=None, widget=None):
-        self.text_item.setVisible(self.socket.node.scene.view.zoom > self.TEXT_ZOOM_OUT_LIMIT)
-        if self.socket.node.scene.view.zoom < self.SOCKET_ZOOM_OUT_LIMIT:
-            return
         # Update background color
         self._brush.setColor(self._color_background)
 
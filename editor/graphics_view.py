@@ -11,6 +11,7 @@ import luna_builder.editor.node_socket as node_socket
 import luna_builder.editor.graphics_socket as graphics_socket
 import luna_builder.editor.graphics_node as graphics_node
 import luna_builder.editor.graphics_edge as graphics_edge
+import luna_builder.editor.graphics_lod as graphics_lod
 import luna_builder.editor.graphics_cutline as graphics_cutline
 imp.reload(node_socket)
 
@@ -38,6 +39,7 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
         self.zoom = 10
         self.zoom_step = 1
         self.zoom_range = (-5.0, 10.0)
+        self.lod = graphics_lod.LevelOfDetail(self.zoom)
 
         self.last_lmb_click_pos = QtCore.QPointF(0.0, 0.0)
         self.last_scene_mouse_pos = QtCore.QPointF(0.0, 0.0)
@@ -56,7 +58,7 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
         self.update_edge_width()
 
     def init_ui(self):
-        self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
+        self.update_viewport_update_mode()
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setTransformationAnchor(QtWidgets.QGraphicsView.AnchorUnderMouse)
@@ -70,7 +72,9 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
         return self.gr_scene.scene
 
     def update_render_hints(self):
-        if self.zoom > self.HIGH_QUALITY_ZOOM:
+        if self.lod.tier == graphics_lod.OVERVIEW:
+            self.setRenderHints(QtGui.QPainter.TextAntialiasing)
+        elif self.zoom > self.HIGH_QUALITY_ZOOM:
             self.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.HighQualityAntialiasing | QtGui.QPainter.TextAntialiasing | QtGui.QPainter.SmoothPixmapTransform)
         else:
             self.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.TextAntialiasing | QtGui.QPainter.SmoothPixmapTransform)
@@ -123,6 +127,7 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
         if not clamped or not self.zoom_clamp:
             self.scale(zoom_factor, zoom_factor)
             self.update_edge_width()
+            self.update_lod()
             self.update_render_hints()
 
     def mouseMoveEvent(self, event):
@@ -136,8 +141,7 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
                 self.dragging.update_positions(pos.x(), pos.y())
 
             if self.edge_mode == QLGraphicsView.EdgeMode.CUT and self.cutline is not None:
-                self.cutline.line_points.append(scene_pos)
-                self.cutline.update()
+                self.cutline.add_point(scene_pos)
 
         except Exception:
             Logger.exception('mouseMoveEvent exception')
@@ -197,8 +201,7 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
 
             if self.edge_mode == QLGraphicsView.EdgeMode.CUT:
                 self.cut_intersecting_edges()
-                self.cutline.line_points = []
-                self.cutline.update()
+                self.cutline.clear()
                 self.edge_mode = QLGraphicsView.EdgeMode.NOOP
                 return
 
@@ -233,6 +236,28 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
     def reset_edge_mode(self):
         self.edge_mode = QLGraphicsView.EdgeMode.NOOP
 
+    def update_lod(self):
+        """Switch level of detail of graph items if zoom crossed tier threshold."""
+        if not self.lod.update(self.zoom):
+            return
+        for node in self.scene.nodes:
+            if node.gr_node is not None:
+                node.gr_node.set_lod(self.lod.tier)
+        for edge in self.scene.edges:
+            if edge.gr_edge is not None:
+                edge.gr_edge.set_lod(self.lod.tier)
+        self.update_viewport_update_mode()
+        self.gr_scene.update()
+
+    def update_viewport_update_mode(self):
+        """Repaint only changed regions, items report exact bounds.
+        In overview tier edges are drawn by scene background and have no item bounds to track, whole viewport is repainted.
+        """
+        if self.lod.tier == graphics_lod.OVERVIEW:
+            self.setViewportUpdateMode(QtWidgets.QGraphicsView.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QtWidgets.QGraphicsView.SmartViewportUpdate)
+
     def update_edge_width(self):
         graphics_edge.QLGraphicsEdge.WIDTH = ((self.zoom - self.zoom_range[0]) / (self.zoom_range[1] - self.zoom_range[0])) * \
             (graphics_edge.QLGraphicsEdge.MIN_WIDTH - graphics_edge.QLGraphicsEdge.MAX_WIDTH) + graphics_edge.QLGraphicsEdge.MAX_WIDTH
@@ -292,6 +317,18 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
             for edge in self.gr_scene.scene.edges:
                 Logger.debug('    {0}'.format(edge))
 
+    def edges_in_rect(self, rect):
+        """Graphics edges with bounding rect intersecting given scene rect.
+
+        :param rect: Scene rect
+        :type rect: QtCore.QRectF
+        :rtype: list[graphics_edge.QLGraphicsEdge]
+        """
+        if self.lod.tier == graphics_lod.OVERVIEW:
+            # Connected edges are hidden and not reported by scene index
+            return [edge.gr_edge for edge in self.scene.edges if edge.gr_edge is not None and rect.intersects(edge.gr_edge.boundingRect())]
+        return [item for item in self.gr_scene.items(rect, QtCore.Qt.IntersectsItemBoundingRect) if isinstance(item, graphics_edge.QLGraphicsEdge)]
+
     def debug_modifiers(self, event):
         """Helper function get string if we hold Ctrl, Shift or Alt modifier keys"""
         out = "MODS: "
@@ -304,15 +341,27 @@ class QLGraphicsView(QtWidgets.QGraphicsView):
         Logger.debug(out)
 
     def cut_intersecting_edges(self):
-        cut_result = False
-        for ix in range(len(self.cutline.line_points) - 1):
-            pt1 = self.cutline.line_points[ix]
-            pt2 = self.cutline.line_points[ix + 1]
-
-            # TODO: Should be optimized as gets slow with large scenes
-            for edge in self.scene.edges[:]:
-                if edge.gr_edge.intersects_with(pt1, pt2):
-                    edge.remove()
-                    cut_result = True
-        if cut_result:
+        points = self.cutline.line_points
+        if len(points) < 2:
+            return
+
+        segments = []
+        for ix in range(len(points) - 1):
+            pt1 = points[ix]
+            pt2 = points[ix + 1]
+            # Pad rect so horizontal and vertical segments are not empty
+            segments.append((pt1, pt2, QtCore.QRectF(pt1, pt2).normalized().adjusted(-1.0, -1.0, 1.0, 1.0)))
+
+        # Query edges index once for the whole cut line, exact test only where bounds overlap
+        cut_edges = []
+        for gr_edge in self.edges_in_rect(QtGui.QPolygonF(points).boundingRect().adjusted(-1.0, -1.0, 1.0, 1.0)):
+            edge_rect = gr_edge.boundingRect()
+            for pt1, pt2, segment_rect in segments:
+                if edge_rect.intersects(segment_rect) and gr_edge.intersects_with(pt1, pt2):
+                    cut_edges.append(gr_edge)
+                    break
+
+        for gr_edge in cut_edges:
+            gr_edge.edge.remove()
+        if cut_edges:
             self.scene.history.store_history('Edges cut', set_modified=True)
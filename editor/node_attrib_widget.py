@@ -77,11 +77,19 @@ class AttribWidget(QtWidgets.QGroupBox):
 
             # Setable types
             if isinstance(widget, QtWidgets.QLineEdit):
-                widget.textChanged.connect(socket.set_value)
+                widget.textChanged.connect(lambda value, sock=socket: self.on_field_edited(sock, value))
             elif isinstance(widget, QtWidgets.QAbstractSpinBox):
-                widget.valueChanged.connect(socket.set_value)
+                widget.valueChanged.connect(lambda value, sock=socket: self.on_field_edited(sock, value))
             elif isinstance(widget, QtWidgets.QCheckBox):
-                widget.toggled.connect(socket.set_value)
+                widget.toggled.connect(lambda value, sock=socket: self.on_field_edited(sock, value))
+
+    def on_field_edited(self, socket, value):
+        if socket.value() == value:
+            return
+        socket.set_value(value)
+        # Typing and spinbox scrubbing are merged into single history entry
+        self.node.scene.history.store_history('{0}: {1} changed'.format(self.node.title, socket.label),
+                                              coalesce_key=('value', socket.uid))
 
     def update_widget_value(self, socket, widget):
         try:
@@ -15,18 +15,22 @@ class NodeContextMenu(QtWidgets.QMenu):
         self.cut_action = QtWidgets.QAction("&Cut", self)
         self.paste_action = QtWidgets.QAction("&Paste", self)
         self.delete_action = QtWidgets.QAction("&Delete", self)
+        self.toggle_checkpoint_action = QtWidgets.QAction("Toggle Checkpoint", self)
 
     def create_connections(self):
         self.copy_action.triggered.connect(self.on_copy)
         self.cut_action.triggered.connect(self.on_cut)
         self.paste_action.triggered.connect(self.on_paste)
         self.delete_action.triggered.connect(self.on_delete)
+        self.toggle_checkpoint_action.triggered.connect(self.on_toggle_checkpoint)
 
     def populate(self):
         self.addAction(self.copy_action)
         self.addAction(self.cut_action)
         self.addAction(self.paste_action)
         self.addSeparator()
+        self.addAction(self.toggle_checkpoint_action)
+        self.addSeparator()
         self.addAction(self.delete_action)
 
     def on_copy(self):
@@ -44,3 +48,7 @@ class NodeContextMenu(QtWidgets.QMenu):
     def on_delete(self):
         if self.scene:
             self.scene.delete_selected()
+
+    def on_toggle_checkpoint(self):
+        if self.scene:
+            self.scene.toggle_selected_checkpoints()
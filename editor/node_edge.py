@@ -25,6 +25,8 @@ class Edge(node_serializable.Serializable):
         super(Edge, self).__init__()
         self._start_socket = None
         self._end_socket = None
+        self.gr_edge = None
+        self._serialized = None
         self.scene = scene
 
         self.set_start_socket(start_socket, silent=silent)
@@ -64,11 +66,15 @@ class Edge(node_serializable.Serializable):
             Logger.error('Invalid edge type value: {0}'.format(value))
             self._edge_type = Edge.Type.BEZIER
 
-        if hasattr(self, 'gr_edge') and self.gr_edge is not None:
+        if self.gr_edge is not None:
             self.scene.gr_scene.removeItem(self.gr_edge)
+            self.gr_edge = None
+        if not self.scene.has_graphics:
+            return
 
         self.gr_edge = self._edge_type.value(self)
         self.scene.gr_scene.addItem(self.gr_edge)
+        self.update_lod()
         if self.start_socket or self.end_socket:
             self.update_positions()
 
@@ -80,9 +86,13 @@ class Edge(node_serializable.Serializable):
         if self._start_socket is not None:
             self._start_socket.remove_edge(self, silent=silent)
 
+        if (value and value.is_exec()) or (self._start_socket and self._start_socket.is_exec()):
+            self.scene.exec_plan.invalidate()
         self._start_socket = value
+        self.invalidate_serialized()
         if self._start_socket is not None:
             self._start_socket.set_connected_edge(self, silent=silent)
+        self.update_lod()
 
     def set_end_socket(self, value, silent=False):
         if value is not None and not isinstance(value, node_socket.Socket):
@@ -92,34 +102,48 @@ class Edge(node_serializable.Serializable):
         if self._end_socket is not None:
             self._end_socket.remove_edge(self, silent=silent)
 
+        if (value and value.is_exec()) or (self._end_socket and self._end_socket.is_exec()):
+            self.scene.exec_plan.invalidate()
         self._end_socket = value
+        self.invalidate_serialized()
         if self._end_socket is not None:
             self._end_socket.set_connected_edge(self, silent=silent)
+        self.update_lod()
+
+    def update_lod(self):
+        """Connected edges are hidden in overview tier, visibility follows socket changes."""
+        if self.gr_edge is not None:
+            self.gr_edge.set_lod(self.scene.lod_tier)
 
     def update_edge_graphics_type(self):
         self.edge_type = self.scene.edge_type
 
+    def init_graphics(self):
+        """Create graphics item for edge created in headless scene."""
+        if self.gr_edge is None:
+            self.update_edge_graphics_type()
+
     def update_positions(self):
-        if not hasattr(self, 'gr_edge'):
+        if self.gr_edge is None:
             return
 
         if self.start_socket is not None:
             source_pos = self.start_socket.get_position()
-            source_pos[0] += self.start_socket.node.gr_node.pos().x()
-            source_pos[1] += self.start_socket.node.gr_node.pos().y()
+            source_pos[0] += self.start_socket.node.position.x()
+            source_pos[1] += self.start_socket.node.position.y()
             self.gr_edge.set_source(*source_pos)
 
         if self.end_socket is not None:
             end_pos = self.end_socket.get_position()
-            end_pos[0] += self.end_socket.node.gr_node.pos().x()
-            end_pos[1] += self.end_socket.node.gr_node.pos().y()
+            end_pos[0] += self.end_socket.node.position.x()
+            end_pos[1] += self.end_socket.node.position.y()
             self.gr_edge.set_destination(*end_pos)
 
         if not self.start_socket:
             self.gr_edge.set_source(*end_pos)
         if not self.end_socket:
             self.gr_edge.set_destination(*source_pos)
-        self.gr_edge.update()
+        self.gr_edge.refresh()
 
     def remove_from_sockets(self, silent=False):
         self.set_start_socket(None, silent=silent)
@@ -127,7 +151,9 @@ class Edge(node_serializable.Serializable):
 
     def remove(self, silent=False):
         self.remove_from_sockets(silent=silent)
-        self.scene.gr_scene.removeItem(self.gr_edge)
+        if self.gr_edge is not None:
+            self.gr_edge.refresh()
+            self.scene.gr_scene.removeItem(self.gr_edge)
         self.gr_edge = None
         if self in self.scene.edges:
             self.scene.remove_edge(self)
@@ -148,12 +174,21 @@ class Edge(node_serializable.Serializable):
         else:
             return self.end_socket
 
+    def on_uid_changed(self, old_uid):
+        self.scene.reindex(self, old_uid)
+        self.invalidate_serialized()
+
+    def invalidate_serialized(self):
+        self._serialized = None
+
     def serialize(self):
-        return OrderedDict([
-            ('id', self.uid),
-            ('start', self.start_socket.uid),
-            ('end', self.end_socket.uid)
-        ])
+        if self._serialized is None:
+            self._serialized = OrderedDict([
+                ('id', self.uid),
+                ('start', self.start_socket.uid),
+                ('end', self.end_socket.uid)
+            ])
+        return self._serialized
 
     def deserialize(self, data, hashmap, restore_id=True):
         if restore_id:
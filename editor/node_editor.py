@@ -23,9 +23,10 @@ class EditorSignals(QtCore.QObject):
 
 class NodeEditor(QtWidgets.QWidget):
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, scene=None):
         super(NodeEditor, self).__init__(parent)
         self.signals = EditorSignals()
+        self.scene = scene  # type: node_scene.Scene
         self.init_ui()
         self.scene.set_history_init_point()
 
@@ -43,21 +44,38 @@ class NodeEditor(QtWidgets.QWidget):
 
     def create_widgets(self):
         # Graphics scene
-        self.scene = node_scene.Scene()
+        if self.scene is None:
+            self.scene = node_scene.Scene()
+        else:
+            self.scene.attach_graphics()
 
         # Graphics view
         self.gr_view = graphics_view.QLGraphicsView(self.scene.gr_scene, self)
 
+        # Loading progress
+        self.load_progress_bar = QtWidgets.QProgressBar()
+        self.load_progress_bar.setFormat('Loading %v/%m')
+        self.load_cancel_button = QtWidgets.QPushButton('Cancel')
+        self.load_progress_widget = QtWidgets.QWidget()
+        self.load_progress_widget.hide()
+
     def create_layouts(self):
         self.main_layout = QtWidgets.QVBoxLayout()
         self.setLayout(self.main_layout)
         self.main_layout.addWidget(self.gr_view)
 
+        progress_layout = QtWidgets.QHBoxLayout(self.load_progress_widget)
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+        progress_layout.addWidget(self.load_progress_bar)
+        progress_layout.addWidget(self.load_cancel_button)
+        self.main_layout.addWidget(self.load_progress_widget)
+
     def create_conections(self):
         self.scene.signals.file_name_changed.connect(self.update_title)
         self.scene.signals.modified.connect(self.update_title)
         self.scene.signals.item_drag_entered.connect(self.on_item_drag_enter)
         self.scene.signals.item_dropped.connect(self.on_item_drop)
+        self.load_cancel_button.clicked.connect(self.on_load_cancel)
 
     # ======== Properties ======== #
     @property
@@ -81,6 +99,8 @@ class NodeEditor(QtWidgets.QWidget):
     # ======== Events ======== #
     def closeEvent(self, event):
         self.signals.about_to_close.emit(self, event)
+        if event.isAccepted() and self.scene.is_loading:
+            self.scene.loader.cancel()
 
     def contextMenuEvent(self, event):
         if self.gr_view.is_view_dragging:
@@ -198,6 +218,7 @@ class NodeEditor(QtWidgets.QWidget):
             return self.on_build_save()
         if res == QtWidgets.QMessageBox.Cancel:
             return False
+        self.scene.journal.discard()
         return True
 
     def on_build_new(self):
@@ -216,13 +237,44 @@ class NodeEditor(QtWidgets.QWidget):
         file_path = QtWidgets.QFileDialog.getOpenFileName(self, "Open rig build scene", Asset.get().build, rig_filter)[0]
         if not file_path:
             return False
-        self.scene.load_from_file(file_path)
+        if self.scene.journal.has_recovery(file_path):
+            res = QtWidgets.QMessageBox.question(self, 'Unsaved changes found',
+                                                 'Build has unsaved changes from previous session. Recover them?')
+            if res == QtWidgets.QMessageBox.Yes:
+                self.scene.recover_from_journal(file_path)
+                return True
+
+        loader = self.scene.load_from_file_async(file_path)
+        if not loader:
+            return False
+        # Graph is viewable but not editable until loaded
+        self.gr_view.setInteractive(False)
+        self.load_progress_bar.setRange(0, 0)
+        self.load_progress_widget.show()
+        loader.signals.progress.connect(self.on_load_progress)
+        loader.signals.finished.connect(self.on_load_finished)
         return True
 
+    def on_load_progress(self, loaded, total):
+        if total:
+            self.load_progress_bar.setRange(0, total)
+        self.load_progress_bar.setValue(loaded)
+
+    def on_load_finished(self, success):
+        self.load_progress_widget.hide()
+        self.gr_view.setInteractive(True)
+
+    def on_load_cancel(self):
+        if self.scene.is_loading:
+            self.scene.loader.cancel()
+
     def on_build_save(self):
         if not Asset.get():
             Logger.warning('Asset is not set')
             return
+        if self.scene.is_loading:
+            Logger.warning('Build is still loading')
+            return False
 
         res = True
         if self.scene.file_name:
@@ -235,10 +287,18 @@ class NodeEditor(QtWidgets.QWidget):
         if not Asset.get():
             Logger.warning('Asset is not set')
             return
+        if self.scene.is_loading:
+            Logger.warning('Build is still loading')
+            return False
 
-        rig_filter = "Rig Build (*.rig)"
-        file_path = QtWidgets.QFileDialog.getSaveFileName(self, 'Save build graph to file', Asset.get().new_build_path, rig_filter)[0]
+        json_filter = "Rig Build (*.rig)"
+        compact_filter = "Compact Rig Build (*.rig)"
+        file_path, selected_filter = QtWidgets.QFileDialog.getSaveFileName(self,
+                                                                           'Save build graph to file',
+                                                                           Asset.get().new_build_path,
+                                                                           ';;'.join([json_filter, compact_filter]),
+                                                                           compact_filter if self.scene.compact_format else json_filter)
         if not file_path:
             return False
-        self.scene.save_to_file(file_path)
+        self.scene.save_to_file(file_path, compact=selected_filter == compact_filter)
         return True
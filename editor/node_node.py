@@ -1,4 +1,5 @@
 import imp
+import contextlib
 from PySide2 import QtCore
 from collections import deque
 from collections import OrderedDict
@@ -7,6 +8,7 @@ from luna import Logger
 import luna_builder.editor.editor_conf as editor_conf
 import luna_builder.editor.graphics_node as graphics_node
 import luna_builder.editor.node_socket as node_socket
+import luna_builder.editor.node_socket_schema as node_socket_schema
 import luna_builder.editor.node_serializable as node_serializable
 import luna_builder.editor.node_attrib_widget as node_attrib_widget
 imp.reload(graphics_node)
@@ -27,6 +29,7 @@ class Node(node_serializable.Serializable):
     ID = None
     IS_EXEC = True
     AUTO_INIT_EXECS = True
+    BRANCHING = False
     DEFAULT_TITLE = 'Custom Node'
     TITLE_EDITABLE = False
     TITLE_COLOR = '#FF313131'
@@ -45,14 +48,22 @@ class Node(node_serializable.Serializable):
         super(Node, self).__init__()
         self.scene = scene
         self.signals = NodeSignals()
+        self._serialized = None
         self._title = None
+        self._position = [0.0, 0.0]
+        self._tooltip = ''
+        self.gr_node = None
         self.inputs = []
         self.outputs = []
         self._required_inputs = deque()
+        # Deferred relayout
+        self._bulk_depth = 0
+        self._sockets_changed_pending = False
 
         # Evaluation
         self._is_compiled = False
         self._is_invalid = False
+        self._checkpoint = False
 
         # Members init
         self.init_settings()
@@ -61,10 +72,12 @@ class Node(node_serializable.Serializable):
 
         # Add to the scene
         self.scene.add_node(self)
-        self.scene.gr_scene.addItem(self.gr_node)
+        if self.gr_node is not None:
+            self.scene.gr_scene.addItem(self.gr_node)
         # Sockets
         self.signals.num_sockets_changed.connect(self.on_num_sockets_changed)
-        self.init_sockets()
+        with self.bulk_sockets():
+            self.init_sockets()
         self.create_connections()
 
     def init_settings(self):
@@ -72,7 +85,21 @@ class Node(node_serializable.Serializable):
 
     def init_inner_classes(self):
         # Setup graphics
+        if self.scene.has_graphics:
+            self.gr_node = self.__class__.GRAPHICS_CLASS(self)
+
+    def init_graphics(self):
+        """Create graphics items for node created in headless scene."""
+        if self.gr_node is not None:
+            return
         self.gr_node = self.__class__.GRAPHICS_CLASS(self)
+        self.gr_node.title = self._title
+        self.gr_node.setToolTip(self._tooltip)
+        self.gr_node.setPos(*self._position)
+        self.scene.gr_scene.addItem(self.gr_node)
+        for socket in self.inputs + self.outputs:
+            socket.init_graphics()
+        self.update_size()
 
     def init_sockets(self, reset=True):
         self._required_inputs.clear()
@@ -81,30 +108,97 @@ class Node(node_serializable.Serializable):
             self.remove_existing_sockets()
 
         # Create new sockets
-        if self.__class__.IS_EXEC and self.__class__.AUTO_INIT_EXECS:
-            self.exec_in_socket = self.add_input(editor_conf.DataType.EXEC)
-            self.exec_out_socket = self.add_output(editor_conf.DataType.EXEC, max_connections=1)
+        self.create_template_sockets()
+
+    # ======= Socket schema ======= #
+    @classmethod
+    def define_sockets(cls, schema):
+        """Declare sockets every instance of the class is created with.
+        Called once per class, sockets that depend on instance state should be added in init_sockets.
+
+        :param schema: Schema to add, remove or override socket specs of
+        :type schema: node_socket_schema.SocketSchema
+        """
+        if cls.IS_EXEC and cls.AUTO_INIT_EXECS:
+            schema.add_input('exec_in_socket', editor_conf.DataType.EXEC)
+            schema.add_output('exec_out_socket', editor_conf.DataType.EXEC, max_connections=1)
+
+    @classmethod
+    def build_socket_template(cls):
+        schema = node_socket_schema.SocketSchema()
+        cls.define_sockets(schema)
+        cls._socket_template = schema.resolve()
+        return cls._socket_template
+
+    @classmethod
+    def get_socket_template(cls):
+        """Resolved socket schema of the class. Can be used to get socket metadata without creating a node.
+
+        :rtype: node_socket_schema.SocketSchema
+        """
+        # Template of the base class is not shared
+        template = cls.__dict__.get('_socket_template')
+        if template is None:
+            template = cls.build_socket_template()
+        return template
+
+    def create_template_sockets(self):
+        template = self.get_socket_template()
+        sockets = {}
+        for spec in template.inputs.values():
+            sockets[spec.attr] = self.add_input(spec.data_type, spec.label, value=spec.value)
+            if spec.required:
+                self.mark_input_as_required(sockets[spec.attr])
+        for spec in template.outputs.values():
+            sockets[spec.attr] = self.add_output(spec.data_type, spec.label, max_connections=spec.max_connections, value=spec.value)
+
+        for attr, socket in sockets.items():
+            # None value overrides datatype default
+            if socket.value() is not None and template.get(attr).value is None:
+                socket.set_value(None)
+            setattr(self, attr, socket)
+        for spec in template.inputs.values():
+            for output_attr in spec.affects:
+                sockets[spec.attr].affects(sockets[output_attr])
 
     def create_connections(self):
         self.signals.compiled_changed.connect(self.on_compiled_change)
         self.signals.invalid_changed.connect(self.on_invalid_change)
         self.signals.title_edited.connect(self.on_title_edited)
+        self.signals.num_sockets_changed.connect(self.invalidate_serialized)
 
     def remove_existing_sockets(self):
         if hasattr(self, 'inputs') and hasattr(self, 'outputs'):
             for socket in self.inputs + self.outputs:
-                self.scene.gr_scene.removeItem(socket.gr_socket)
+                self.scene.remove_socket(socket)
+                if socket.gr_socket is not None:
+                    self.scene.gr_scene.removeItem(socket.gr_socket)
             self.inputs = []
             self.outputs = []
+            self.scene.exec_plan.invalidate()
 
     # ======= Properties ======= #
 
+    @property
+    def checkpoint(self):
+        return self._checkpoint
+
+    @checkpoint.setter
+    def checkpoint(self, value):
+        self._checkpoint = value
+        self.invalidate_serialized()
+
     @property
     def position(self):
+        if self.gr_node is None:
+            return QtCore.QPointF(*self._position)
         return self.gr_node.pos()
 
     def set_position(self, x, y):
-        self.gr_node.setPos(x, y)
+        self.invalidate_serialized()
+        self._position = [x, y]
+        if self.gr_node is not None:
+            self.gr_node.setPos(x, y)
 
     @property
     def title(self):
@@ -112,6 +206,10 @@ class Node(node_serializable.Serializable):
 
     @title.setter
     def title(self, value):
+        self.invalidate_serialized()
+        if self.gr_node is None:
+            self._title = value
+            return
         old_height = self.gr_node.title_height
         old_width = self.gr_node.title_width
         self._title = value
@@ -191,7 +289,12 @@ class Node(node_serializable.Serializable):
 
     # ======== Update methods ========= #
     def append_tooltip(self, text):
-        self.gr_node.setToolTip(self.gr_node.toolTip() + text)
+        self.set_tooltip(self._tooltip + text)
+
+    def set_tooltip(self, text):
+        self._tooltip = text
+        if self.gr_node is not None:
+            self.gr_node.setToolTip(text)
 
     def update_connected_edges(self):
         for socket in self.inputs + self.outputs:
@@ -202,6 +305,12 @@ class Node(node_serializable.Serializable):
             socket.update_positions()
 
     def update_size(self):
+        if self.gr_node is None:
+            return
+        if self.is_layout_deferred:
+            self._set_sockets_changed_pending()
+            return
+        self.gr_node.prepareGeometryChange()
         self.recalculate_width()
         self.recalculate_height()
         self.update_socket_positions()
@@ -210,11 +319,50 @@ class Node(node_serializable.Serializable):
     def on_num_sockets_changed(self):
         self.update_size()
 
+    # ======== Bulk socket changes ========= #
+    @property
+    def is_layout_deferred(self):
+        return bool(self._bulk_depth) or self.scene.is_layout_deferred
+
+    @contextlib.contextmanager
+    def bulk_sockets(self):
+        """Add, remove or change multiple sockets with a single num_sockets_changed signal and relayout at the end."""
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self._sockets_changed_pending:
+                if self.scene.is_layout_deferred:
+                    self.scene.defer_node_layout(self)
+                else:
+                    self.flush_sockets_changed()
+
+    def notify_sockets_changed(self):
+        if self.is_layout_deferred:
+            self._set_sockets_changed_pending()
+        else:
+            self.signals.num_sockets_changed.emit()
+
+    def flush_sockets_changed(self):
+        if not self._sockets_changed_pending:
+            return
+        self._sockets_changed_pending = False
+        self.signals.num_sockets_changed.emit()
+
+    def _set_sockets_changed_pending(self):
+        self._sockets_changed_pending = True
+        if not self._bulk_depth:
+            self.scene.defer_node_layout(self)
+
     def remove(self, silent=False):
         try:
             self.remove_all_connections(include_exec=True, silent=silent)
-            self.scene.gr_scene.removeItem(self.gr_node)
+            if self.gr_node is not None:
+                self.scene.gr_scene.removeItem(self.gr_node)
             self.gr_node = None
+            for socket in self.inputs + self.outputs:
+                self.scene.remove_socket(socket)
             self.scene.remove_node(self)
         except Exception:
             Logger.exception('Failed to delete node {0}'.format(self))
@@ -235,6 +383,9 @@ class Node(node_serializable.Serializable):
         self._is_compiled = value
         self.signals.compiled_changed.emit(self._is_compiled)
 
+    def is_dirty(self):
+        return not self._is_compiled or self._is_invalid
+
     def on_compiled_change(self, state):
         self.mark_children_compiled(state)
 
@@ -259,11 +410,15 @@ class Node(node_serializable.Serializable):
         return True
 
     def verify(self):
-        self.gr_node.setToolTip('')
+        self.set_tooltip('')
         result = self.verify_inputs()
 
         return result
 
+    def get_checkpoint_data(self):
+        """Extra data affecting node result that is not stored in the graph (e.g. external files)."""
+        return None
+
     def on_invalid_change(self, state):
         if state:
             Logger.debug('{0} marked invalid'.format(self))
@@ -277,7 +432,7 @@ class Node(node_serializable.Serializable):
 
     # ========= Interaction methods ========== #
     def edit_title(self):
-        if self.TITLE_EDITABLE:
+        if self.TITLE_EDITABLE and self.gr_node is not None:
             self.gr_node.title_item.edit()
         else:
             Logger.warning('Title for node {0} is not editable'.format(self.title))
@@ -297,24 +452,49 @@ class Node(node_serializable.Serializable):
     def post_deserilization(self, data):
         pass
 
+    def on_uid_changed(self, old_uid):
+        self.scene.reindex(self, old_uid)
+        self.invalidate_serialized()
+
+    def invalidate_serialized(self):
+        self._serialized = None
+
     def serialize(self):
+        """Node record. Cached until node or any of its sockets changes, returned record should not be modified.
+        Nodes with mutable socket values are not cached.
+        """
+        if self._serialized is not None:
+            return self._serialized
+
         inputs, outputs = [], []
+        cacheable = True
         for socket in self.inputs:
             inputs.append(socket.serialize())
+            cacheable = cacheable and not socket.has_mutable_value()
         for socket in self.outputs:
             outputs.append(socket.serialize())
+            cacheable = cacheable and not socket.has_mutable_value()
 
-        return OrderedDict([
+        result = OrderedDict([
             ('id', self.uid),
             ('node_id', self.__class__.ID),
             ('title', self.title),
-            ('pos_x', self.gr_node.scenePos().x()),
-            ('pos_y', self.gr_node.scenePos().y()),
+            ('pos_x', self.position.x()),
+            ('pos_y', self.position.y()),
             ('inputs', inputs),
             ('outputs', outputs)
         ])
+        if self.checkpoint:
+            result['checkpoint'] = True
+        if cacheable:
+            self._serialized = result
+        return result
 
     def deserialize(self, data, hashmap, restore_id=True):
+        with self.bulk_sockets():
+            self._deserialize(data, hashmap, restore_id=restore_id)
+
+    def _deserialize(self, data, hashmap, restore_id=True):
         # Pre
         self.pre_deserilization(data)
 
@@ -325,13 +505,14 @@ class Node(node_serializable.Serializable):
 
         self.set_position(data['pos_x'], data['pos_y'])
         self.title = data.get('title')
+        self.checkpoint = data.get('checkpoint', False)
 
         # Sockets
-        data['inputs'].sort(key=lambda socket: socket['index'] + socket['position'] * 10000)
-        data['outputs'].sort(key=lambda socket: socket['index'] + socket['position'] * 10000)
+        inputs_data = sorted(data['inputs'], key=lambda socket: socket['index'] + socket['position'] * 10000)
+        outputs_data = sorted(data['outputs'], key=lambda socket: socket['index'] + socket['position'] * 10000)
 
         # Deserialize sockets
-        for socket_data in data.get('inputs'):
+        for socket_data in inputs_data:
             found = None  # type: node_socket.Socket
             for socket in self.inputs:
                 if socket.index == socket_data['index']:
@@ -345,7 +526,7 @@ class Node(node_serializable.Serializable):
                 found = self.add_input(data_type, socket_data['label'], value=value)
             found.deserialize(socket_data, hashmap, restore_id)
 
-        for socket_data in data.get('outputs'):
+        for socket_data in outputs_data:
             found = None
             for socket in self.outputs:
                 if socket.index == socket_data['index']:
@@ -359,7 +540,7 @@ class Node(node_serializable.Serializable):
                 value = socket_data.get('value', data_type['default'])
                 found = self.add_output(data_type, socket_data['label'], value=value)
             found.deserialize(socket_data, hashmap, restore_id)
-        self.signals.num_sockets_changed.emit()
+        self.notify_sockets_changed()
         # Post
         self.post_deserilization(data)
 
@@ -376,10 +557,11 @@ class Node(node_serializable.Serializable):
                                          *args,
                                          **kwargs)
         self.inputs.append(socket)
-        self.signals.num_sockets_changed.emit()
+        self.notify_sockets_changed()
         return socket
 
     def add_output(self, data_type, label=None, max_connections=0, value=None, *args, **kwargs):
+        data_type = editor_conf.DataType.resolve(data_type)
         if data_type == editor_conf.DataType.EXEC:
             max_connections = 1
         socket = node_socket.OutputSocket(self,
@@ -393,7 +575,7 @@ class Node(node_serializable.Serializable):
                                           *args,
                                           **kwargs)
         self.outputs.append(socket)
-        self.signals.num_sockets_changed.emit()
+        self.notify_sockets_changed()
         return socket
 
     def remove_socket(self, name, is_input=True):
@@ -411,7 +593,7 @@ class Node(node_serializable.Serializable):
                 for index, socket in enumerate(self.outputs):
                     socket.index = index
             socket_to_remove.remove()
-            self.signals.num_sockets_changed.emit()
+            self.notify_sockets_changed()
         except Exception:
             Logger.error('Failed to delete socket {0}'.format(name))
 
@@ -435,14 +617,7 @@ class Node(node_serializable.Serializable):
         return exec_children
 
     def get_exec_queue(self):
-        exec_queue = deque([self])
-
-        for exec_out in self.list_exec_outputs():
-            if not exec_out.list_connections():
-                continue
-            exec_queue.extend(exec_out.list_connections()[0].node.get_exec_queue())
-
-        return exec_queue
+        return self.scene.exec_plan.get_queue(self)
 
     def update_affected_outputs(self):
         for input in self.inputs:
@@ -450,17 +625,21 @@ class Node(node_serializable.Serializable):
 
     def _exec(self):
         Logger.debug('Executing {0}...'.format(self))
-        try:
-            self.execute()
-            self.update_affected_outputs()
-        except Exception:
-            Logger.exception('Failed to execute {0} {1}'.format(self.title, self))
-            self.append_tooltip('Execution error (Check script editor for details)\n')
-            self.set_invalid(True)
-            raise
+        self.scene.executor.signals.node_started.emit(self)
+        with self.scene.executor.profiler.record(self):
+            try:
+                self.execute()
+                self.update_affected_outputs()
+            except Exception:
+                Logger.exception('Failed to execute {0} {1}'.format(self.title, self))
+                self.append_tooltip('Execution error (Check script editor for details)\n')
+                self.set_invalid(True)
+                self.scene.executor.signals.node_finished.emit(self, False)
+                raise
 
         self.set_compiled(True)
         self.set_invalid(False)
+        self.scene.executor.signals.node_finished.emit(self, True)
         return 0
 
     def execute(self):
@@ -498,7 +677,7 @@ class Node(node_serializable.Serializable):
     def find_first_input_of_datatype(self, datatype):
         result = None
         for socket in self.inputs:
-            if issubclass(datatype.get('class', type(None)), socket.data_class):
+            if editor_conf.can_connect(datatype.get('class', type(None)), socket.data_class):
                 result = socket
                 break
         return result
@@ -514,7 +693,7 @@ class Node(node_serializable.Serializable):
     def find_first_output_of_datatype(self, datatype):
         result = None
         for socket in self.outputs:
-            if issubclass(socket.data_class, datatype.get('class', type(None))):
+            if editor_conf.can_connect(socket.data_class, datatype.get('class', type(None))):
                 result = socket
                 break
         return result
@@ -529,6 +708,13 @@ class Node(node_serializable.Serializable):
     def list_exec_outputs(self):
         return [socket for socket in self.outputs if socket.data_type == editor_conf.DataType.EXEC]
 
+    def list_all_exec_outputs(self):
+        """Exec outputs regardless of runtime state, used to compile branches of BRANCHING nodes."""
+        return self.list_exec_outputs()
+
+    def list_loop_outputs(self):
+        return []
+
     def list_non_exec_inputs(self):
         return [socket for socket in self.inputs if socket.data_type != editor_conf.DataType.EXEC]
 
@@ -178,10 +178,11 @@ class QLDragTreeWidget(QtWidgets.QTreeWidget):
     def add_registered_functions(self, search_filter=''):
         keys = list(editor_conf.FUNCTION_REGISTER.keys())
         keys.sort()
+        if self.nodes_palette.data_type_filter:
+            filtered_keys = set(editor_conf.list_function_datatypes(self.nodes_palette.data_type_filter))
+            filtered_keys.add(editor_conf.UNBOUND_FUNCTION_DATATYPE)
+            keys = [datatype_name for datatype_name in keys if datatype_name in filtered_keys]
         for datatype_name in keys:
-            if datatype_name != editor_conf.UNBOUND_FUNCTION_DATATYPE and self.nodes_palette.data_type_filter:
-                if not issubclass(self.nodes_palette.data_type_filter.get('class'), editor_conf.DataType.get_type(datatype_name).get('class')):
-                    continue
             func_map = editor_conf.FUNCTION_REGISTER[datatype_name]
             func_signatures_list = func_map.keys()
             func_signatures_list = list(func_signatures_list) if not isinstance(func_signatures_list, list) else func_signatures_list
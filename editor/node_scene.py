@@ -1,6 +1,7 @@
 import imp
 import json
 import os
+import contextlib
 import timeit
 import uuid
 from collections import OrderedDict
@@ -13,11 +14,16 @@ import luna_builder.editor.editor_conf as editor_conf
 import luna_builder.editor.node_node as node_node
 import luna_builder.editor.node_edge as node_edge
 import luna_builder.editor.graphics_scene as graphics_scene
+import luna_builder.editor.graphics_lod as graphics_lod
 import luna_builder.editor.node_serializable as node_serializable
 import luna_builder.editor.node_scene_history as scene_history
+import luna_builder.editor.node_scene_journal as scene_journal
+import luna_builder.editor.node_scene_format as scene_format
+import luna_builder.editor.node_scene_loader as scene_loader
 import luna_builder.editor.node_scene_clipboard as scene_clipboard
 import luna_builder.editor.node_scene_vars as node_scene_vars
 import luna_builder.editor.graph_executor as graph_executor
+import luna_builder.editor.graph_exec_plan as graph_exec_plan
 # imp.reload(node_scene_vars)
 imp.reload(scene_history)
 imp.reload(scene_clipboard)
@@ -36,18 +42,33 @@ class SceneSignals(QtCore.QObject):
 
 class Scene(node_serializable.Serializable):
 
-    def __init__(self):
+    def __init__(self, headless=False):
+        """Graph scene.
+
+        :param headless: Create scene without graphics items. Use attach_graphics to display it in the editor later.
+        :type headless: bool
+        """
         super(Scene, self).__init__()
         self.signals = SceneSignals()
         self._file_name = None
+        self.compact_format = False
+        self.loader = None  # type: scene_loader.SceneLoader
         self._has_been_modified = False
         self._items_are_being_deleted = False
         self._last_selected_items = []
+        # Nodes waiting for relayout
+        self._layout_depth = 0
+        self._layout_pending_nodes = OrderedDict()
 
         self.nodes = []
         self.edges = []
+        # Uid -> object indexes
+        self._nodes_map = {}
+        self._sockets_map = {}
+        self._edges_map = {}
         self.is_executing = False
         self.executor = self.executor = graph_executor.GraphExecutor(self)
+        self.exec_plan = graph_exec_plan.ExecPlan(self)
         self.vars = node_scene_vars.SceneVars(self)
         self.gr_scene = None  # type: graphics_scene.QLGraphicsScene
 
@@ -55,10 +76,31 @@ class Scene(node_serializable.Serializable):
         self.scene_height = 64000
         self._edge_type = node_edge.Edge.Type.BEZIER
 
-        self.init_ui()
+        if not headless:
+            self.init_ui()
+        self.journal = scene_journal.SceneJournal(self)
         self.history = scene_history.SceneHistory(self)
         self.clipboard = scene_clipboard.SceneClipboard(self)
+        if not headless:
+            self.create_connections()
+
+    @property
+    def has_graphics(self):
+        return self.gr_scene is not None
+
+    def attach_graphics(self):
+        """Create graphics scene and items for headless scene."""
+        if self.has_graphics:
+            return
+        start_time = timeit.default_timer()
+        self.init_ui()
         self.create_connections()
+        for node in self.nodes:
+            node.init_graphics()
+        for edge in self.edges:
+            edge.init_graphics()
+        self.history.update_enabled_state()
+        Logger.debug('Attached graphics in {0:.2f}s'.format(timeit.default_timer() - start_time))
 
     def init_ui(self):
         self.gr_scene = graphics_scene.QLGraphicsScene(self)
@@ -97,8 +139,16 @@ class Scene(node_serializable.Serializable):
 
     @ property
     def view(self):
+        if not self.has_graphics or not self.gr_scene.views():
+            return None
         return self.gr_scene.views()[0]
 
+    @ property
+    def lod_tier(self):
+        """Level of detail tier new graphics items are created with."""
+        view = self.view
+        return view.lod.tier if view is not None else graphics_lod.FULL
+
     @ property
     def has_been_modified(self):
         return self._has_been_modified
@@ -117,6 +167,10 @@ class Scene(node_serializable.Serializable):
         self._file_name = value
         self.signals.file_name_changed.emit(self._file_name)
 
+    @ property
+    def is_loading(self):
+        return self.loader is not None and self.loader.is_running
+
     @ property
     def file_base_name(self):
         if not self.file_name:
@@ -125,14 +179,20 @@ class Scene(node_serializable.Serializable):
 
     @ property
     def selected_items(self):
+        if not self.has_graphics:
+            return []
         return self.gr_scene.selectedItems()
 
     @ property
     def selected_nodes(self):
+        if not self.has_graphics:
+            return []
         return [node for node in self.nodes if node.gr_node.isSelected()]
 
     @ property
     def selected_edges(self):
+        if not self.has_graphics:
+            return []
         return [edge for edge in self.edges if edge.gr_edge.isSelected()]
 
     @ property
@@ -140,20 +200,73 @@ class Scene(node_serializable.Serializable):
         return self._last_selected_items
 
     def set_history_init_point(self):
-        Logger.debug('Store initial scene history (Size: {0})'.format(self.history.size))
+        Logger.debug('Store initial scene history (Budget: {0}MB)'.format(self.history.memory_budget_mb))
         self.history.store_history(self.history.SCENE_INIT_DESC)
 
     def add_node(self, node):
         self.nodes.append(node)
+        self._nodes_map[node.uid] = node
 
     def add_edge(self, edge):
         self.edges.append(edge)
+        self._edges_map[edge.uid] = edge
+
+    def add_socket(self, socket):
+        self._sockets_map[socket.uid] = socket
 
     def remove_node(self, node):
         self.nodes.remove(node)
+        if self._nodes_map.get(node.uid) is node:
+            del self._nodes_map[node.uid]
+        self.exec_plan.invalidate()
 
     def remove_edge(self, edge):
         self.edges.remove(edge)
+        if self._edges_map.get(edge.uid) is edge:
+            del self._edges_map[edge.uid]
+
+    def remove_socket(self, socket):
+        if self._sockets_map.get(socket.uid) is socket:
+            del self._sockets_map[socket.uid]
+
+    def reindex(self, item, old_uid):
+        """Update uid indexes after item uid has changed."""
+        for items_map in [self._nodes_map, self._sockets_map, self._edges_map]:
+            if items_map.get(old_uid) is item:
+                del items_map[old_uid]
+                items_map[item.uid] = item
+                return
+
+    def get_node(self, uid):
+        return self._nodes_map.get(uid)
+
+    def get_socket(self, uid):
+        return self._sockets_map.get(uid)
+
+    def get_edge(self, uid):
+        return self._edges_map.get(uid)
+
+    # ====== Deferred layout ====== #
+    @property
+    def is_layout_deferred(self):
+        return bool(self._layout_depth)
+
+    def defer_node_layout(self, node):
+        self._layout_pending_nodes[node] = None
+
+    @contextlib.contextmanager
+    def defer_layout(self):
+        """Create or deserialize multiple nodes with a single relayout of each node at the end."""
+        self._layout_depth += 1
+        try:
+            yield
+        finally:
+            self._layout_depth -= 1
+            if not self._layout_depth:
+                pending_nodes = self._layout_pending_nodes
+                self._layout_pending_nodes = OrderedDict()
+                for node in pending_nodes:
+                    node.flush_sockets_changed()
 
     def list_node_ids(self):
         return [node.uid for node in self.nodes]
@@ -186,10 +299,10 @@ class Scene(node_serializable.Serializable):
 
         # No current selection and existing previous selection (To avoid resetting selection after cut operation)
         if not current_selection:
-            self.history.store_history('Deselected everything', set_modified=False)
+            self.history.store_selection('Deselected everything')
             self.signals.items_deselected.emit()
         else:
-            self.history.store_history('Selection changed', set_modified=False)
+            self.history.store_selection('Selection changed')
             self.signals.item_selected.emit()
         self._last_selected_items = current_selection
 
@@ -201,6 +314,16 @@ class Scene(node_serializable.Serializable):
         sel = sel[-1]
         sel.edit_title()
 
+    def toggle_selected_checkpoints(self):
+        sel = self.selected_nodes
+        if not sel:
+            Logger.warning('Select nodes to toggle checkpoint.')
+            return
+        for node in sel:
+            node.checkpoint = not node.checkpoint
+            Logger.info('{0} checkpoint: {1}'.format(node.title, node.checkpoint))
+        self.history.store_history('Toggled checkpoints')
+
     # ====== Cut / Copy / Paste / Delete ====== #
     def copy_selected(self):
         if not self.selected_nodes:
@@ -257,11 +380,23 @@ class Scene(node_serializable.Serializable):
 
     # ====== File ====== #
 
-    def save_to_file(self, file_path):
+    def save_to_file(self, file_path, compact=None):
+        """Save build to file.
+
+        :param compact: Use compact binary format, format of the loaded file is used if not specified.
+        :type compact: bool
+        """
+        if compact is None:
+            compact = self.compact_format
         try:
-            fileFn.write_json(file_path, data=self.serialize(), sort_keys=False)
+            if compact:
+                scene_format.write_compact(file_path, self.serialize())
+            else:
+                fileFn.write_json(file_path, data=self.serialize(), sort_keys=False)
+            self.compact_format = compact
             Logger.info('Saved build {0}'.format(file_path))
             self.file_name = file_path
+            self.journal.discard()
             self.has_been_modified = False
             self.signals.modified.emit()
         except Exception:
@@ -271,17 +406,86 @@ class Scene(node_serializable.Serializable):
         try:
             self.clear()
             start_time = timeit.default_timer()
-            data = fileFn.load_json(file_path, object_pairs_hook=OrderedDict)
-            self.deserialize(data)
+            # Nodes of compact files are created while file is being decoded
+            self.compact_format = scene_format.is_compact(file_path)
+            self.deserialize_records(scene_format.read_records(file_path))
             Logger.info("Rig build loaded in {0:.2f}s".format(timeit.default_timer() - start_time))
+            self.finish_loading(file_path)
+            return True
+        except Exception:
+            Logger.exception('Failed to load rig build file')
+            return False
+
+    def load_from_file_async(self, file_path):
+        """Load build file without blocking the UI.
+        File is parsed in background thread and scene is populated in chunks on the main thread.
+
+        :return: Loader to track progress and cancel loading, None if loading failed to start.
+        :rtype: scene_loader.SceneLoader
+        """
+        if self.is_loading:
+            self.loader.cancel()
+        # Partial graph must never be saved over previously opened build
+        self.file_name = None
+        try:
+            self.clear()
+            self.compact_format = scene_format.is_compact(file_path)
+        except Exception:
+            Logger.exception('Failed to load rig build file')
+            return None
+        # Partially loaded scene shouldn't be recorded
+        self.history.enabled = False
+        self.loader = scene_loader.SceneLoader(self, file_path)
+        self.loader.signals.finished.connect(self.on_loading_finished)
+        self.loader.start()
+        return self.loader
+
+    def on_loading_finished(self, success):
+        if success:
+            self.finish_loading(self.loader.file_path)
+            return
+        # Don't leave partially loaded build bound to its file
+        self.clear()
+        self.history.clear()
+        self.history.update_enabled_state()
+        self.file_name = None
+        self.set_history_init_point()
+
+    def finish_loading(self, file_path):
+        self.history.clear()
+        self.history.update_enabled_state()
+        self.executor.reset_stepped_execution()
+        self.file_name = file_path
+        self.has_been_modified = False
+        self.set_history_init_point()
+        self.signals.file_load_finished.emit()
+
+    def recover_from_journal(self, file_path):
+        """Load build file state with unsaved changes replayed from its session journal."""
+        try:
+            self.clear()
+            start_time = timeit.default_timer()
+            snapshot, deltas = self.journal.read(file_path)
+            self.deserialize(snapshot)
+            self.history.enabled = False
+            for delta in deltas:
+                self.history.apply_delta(delta)
+            Logger.info('Recovered {0} unsaved changes in {1:.2f}s'.format(len(deltas), timeit.default_timer() - start_time))
             self.history.clear()
+            self.history.update_enabled_state()
             self.executor.reset_stepped_execution()
             self.file_name = file_path
-            self.has_been_modified = False
+            self.compact_format = os.path.isfile(file_path) and scene_format.is_compact(file_path)
             self.set_history_init_point()
+            # Recovered changes are still unsaved
+            self.journal.compact()
+            self.has_been_modified = True
             self.signals.file_load_finished.emit()
+            return True
         except Exception:
-            Logger.exception('Failed to load rig build file')
+            Logger.exception('Failed to recover build from session journal')
+            self.history.update_enabled_state()
+            return False
 
     # Creation
 
@@ -351,7 +555,44 @@ class Scene(node_serializable.Serializable):
             ('edge_type', self.edge_type.name)
         ])
 
+    def deserialize_records(self, records):
+        """Populate empty scene from stream of (kind, record) pairs.
+
+        :param records: Scene, node and edge records as produced by node_scene_format.iter_records
+        :type records: generator
+        """
+        hashmap = {}
+        with self.defer_layout():
+            for kind, record in records:
+                self.deserialize_record(kind, record, hashmap)
+
+    def deserialize_record(self, kind, record, hashmap):
+        """Create scene item from single record. Scene record is expected before any node and edge records.
+
+        :param kind: Record kind - "scene", "node" or "edge"
+        :type kind: str
+        :param record: Serialized item data
+        :type record: dict
+        :param hashmap: Uid -> deserialized socket map shared between records
+        :type hashmap: dict
+        """
+        if kind == 'node':
+            new_node = self.get_class_from_node_data(record)(self)
+            new_node.deserialize(record, hashmap, restore_id=True)
+        elif kind == 'edge':
+            new_edge = node_edge.Edge(self)
+            new_edge.deserialize(record, hashmap, True)
+        elif kind == 'scene':
+            self.uid = record['id']
+            self.vars.deserialize(record.get('vars') or OrderedDict())
+            # Set before edges are created
+            self.edge_type = record.get('edge_type') or node_edge.Edge.Type.BEZIER
+
     def deserialize(self, data, hashmap=None, restore_id=True):
+        with self.defer_layout():
+            return self._deserialize(data, hashmap=hashmap, restore_id=restore_id)
+
+    def _deserialize(self, data, hashmap=None, restore_id=True):
         if hashmap is None:
             hashmap = {}
 
@@ -360,48 +601,35 @@ class Scene(node_serializable.Serializable):
         self.vars.deserialize(data.get('vars', OrderedDict()))
 
         # Deserialize nodes
-        all_nodes = self.nodes[:]
+        unused_nodes = set(self.nodes)
         for node_data in data['nodes']:
-            found = False
-            for node in all_nodes:
-                if node.uid == node_data['id']:
-                    found = node
-                    break
-
-            if not found:
+            found = self.get_node(node_data['id'])
+            if found not in unused_nodes:
                 new_node = self.get_class_from_node_data(node_data)(self)
                 new_node.deserialize(node_data, hashmap, restore_id=restore_id)
             else:
                 found.deserialize(node_data, hashmap, restore_id=restore_id)
-                all_nodes.remove(found)
+                unused_nodes.remove(found)
 
-        while all_nodes:
-            node = all_nodes.pop()
-            node.remove()
+        for node in reversed(self.nodes[:]):
+            if node in unused_nodes:
+                node.remove()
 
         # Deserialize edges
-        all_edges = self.edges[:]
-
+        unused_edges = set(self.edges)
         for edge_data in data['edges']:
-            found = False
-            for edge in all_edges:
-                if edge.uid == edge_data['id']:
-                    found = edge
-                    break
-            if not found:
+            found = self.get_edge(edge_data['id'])
+            if found not in unused_edges:
                 new_edge = node_edge.Edge(self)
                 new_edge.deserialize(edge_data, hashmap, restore_id)
             else:
                 found.deserialize(edge_data, hashmap, restore_id)
-                all_edges.remove(found)
+                unused_edges.remove(found)
 
-        while all_edges:
-            edge = all_edges.pop()
-            try:
-                self.edges.index(edge)
-            except ValueError:
-                continue
-            edge.remove()
+        # Edges of removed nodes are already deleted
+        for edge in reversed(self.edges[:]):
+            if edge in unused_edges:
+                edge.remove()
 
         # Set edge type
         self.edge_type = data.get('edge_type', node_edge.Edge.Type.BEZIER)
@@ -62,22 +62,23 @@ class SceneClipboard(object):
             maxy = max(y, maxy)
 
         created_nodes = []
-        # Create each node
-        for node_data in data['nodes']:
-            node_class = self.scene.get_class_from_node_data(node_data)
-            new_node = node_class(self.scene)
-            new_node.deserialize(node_data, hashmap, restore_id=False)
-            created_nodes.append(new_node)
+        with self.scene.defer_layout():
+            # Create each node
+            for node_data in data['nodes']:
+                node_class = self.scene.get_class_from_node_data(node_data)
+                new_node = node_class(self.scene)
+                new_node.deserialize(node_data, hashmap, restore_id=False)
+                created_nodes.append(new_node)
 
-            # Adjust node position
-            pos_x, pos_y = new_node.position.x(), new_node.position.y()
-            new_x, new_y = mouse_x + pos_x - minx, mouse_y + pos_y - miny
-            new_node.set_position(new_x, new_y)
+                # Adjust node position
+                pos_x, pos_y = new_node.position.x(), new_node.position.y()
+                new_x, new_y = mouse_x + pos_x - minx, mouse_y + pos_y - miny
+                new_node.set_position(new_x, new_y)
 
-        # Create each edge
-        for edge_data in data['edges']:
-            new_edge = node_edge.Edge(self.scene)
-            new_edge.deserialize(edge_data, hashmap, restore_id=False)
+            # Create each edge
+            for edge_data in data['edges']:
+                new_edge = node_edge.Edge(self.scene)
+                new_edge.deserialize(edge_data, hashmap, restore_id=False)
 
         self.scene.history.store_history('Paste items', set_modified=True)
         return created_nodes
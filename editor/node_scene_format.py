@@ -0,0 +1,237 @@
+"""Compact build file format.
+
+File starts with MAGIC, format version and codec id bytes followed by compressed stream of frames.
+Each frame is 4 byte big endian length and compact json array:
+    [FRAME_STRINGS, [str, ...]] - interned datatype names, labels, titles
+    [FRAME_SCENE, id, vars, scene_width, scene_height, edge_type, items_count]
+    [FRAME_NODE, id, node_id, title, pos_x, pos_y, inputs, outputs, extra]
+    [FRAME_EDGE, id, start, end]
+Socket rows are [id, index, position, data_type, max_connections, label, value].
+Edge sockets are indices in the order sockets appear in node frames.
+"""
+import json
+import zlib
+import struct
+from collections import OrderedDict
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+MAGIC = b'LRIG'
+VERSION = 1
+CODEC_ZLIB = 0
+CODEC_LZMA = 1
+CHUNK_SIZE = 256 * 1024
+
+FRAME_STRINGS = 0
+FRAME_SCENE = 1
+FRAME_NODE = 2
+FRAME_EDGE = 3
+
+NODE_KEYS = ('id', 'node_id', 'title', 'pos_x', 'pos_y', 'inputs', 'outputs')
+SOCKET_KEYS = ('id', 'index', 'position', 'data_type', 'max_connections', 'label', 'value')
+
+
+class FormatError(Exception):
+    pass
+
+
+def is_compact(file_path):
+    with open(file_path, 'rb') as build_file:
+        return build_file.read(len(MAGIC)) == MAGIC
+
+
+def default_codec():
+    return CODEC_LZMA if lzma else CODEC_ZLIB
+
+
+def get_compressor(codec):
+    if codec == CODEC_LZMA:
+        if not lzma:
+            raise FormatError('LZMA compression is not available')
+        return lzma.LZMACompressor()
+    return zlib.compressobj(6)
+
+
+def get_decompressor(codec):
+    if codec == CODEC_LZMA:
+        if not lzma:
+            raise FormatError('LZMA compression is not available')
+        return lzma.LZMADecompressor()
+    return zlib.decompressobj()
+
+
+class StringTable(object):
+
+    def __init__(self):
+        self.strings = []
+        self._indexes = {}
+
+    def intern(self, text):
+        if text not in self._indexes:
+            self._indexes[text] = len(self.strings)
+            self.strings.append(text)
+        return self._indexes[text]
+
+
+# ====== Writing ====== #
+def encode_frames(data):
+    """Convert serialized scene data to compact frames.
+
+    :param data: Scene.serialize result
+    :type data: dict
+    :return: List of frames
+    :rtype: list
+    """
+    strings = StringTable()
+    socket_refs = {}
+    items_count = len(data['nodes']) + len(data['edges'])
+    frames = [[FRAME_SCENE, data['id'], data['vars'], data['scene_width'], data['scene_height'], data['edge_type'], items_count]]
+
+    for node_data in data['nodes']:
+        socket_rows = []
+        for side in ['inputs', 'outputs']:
+            rows = []
+            for socket_data in node_data[side]:
+                socket_refs[socket_data['id']] = len(socket_refs)
+                rows.append([socket_data['id'],
+                             socket_data['index'],
+                             socket_data['position'],
+                             strings.intern(socket_data['data_type']),
+                             socket_data['max_connections'],
+                             strings.intern(socket_data['label']),
+                             socket_data['value']])
+            socket_rows.append(rows)
+        extra = dict([(key, value) for key, value in node_data.items() if key not in NODE_KEYS])
+        frames.append([FRAME_NODE,
+                       node_data['id'],
+                       node_data['node_id'],
+                       strings.intern(node_data['title']),
+                       node_data['pos_x'],
+                       node_data['pos_y'],
+                       socket_rows[0],
+                       socket_rows[1],
+                       extra])
+
+    for edge_data in data['edges']:
+        frames.append([FRAME_EDGE,
+                       edge_data['id'],
+                       socket_refs.get(edge_data['start'], edge_data['start']),
+                       socket_refs.get(edge_data['end'], edge_data['end'])])
+
+    # String table has to be decoded first
+    frames.insert(0, [FRAME_STRINGS, strings.strings])
+    return frames
+
+
+def write_compact(file_path, data, codec=None):
+    codec = default_codec() if codec is None else codec
+    compressor = get_compressor(codec)
+    with open(file_path, 'wb') as build_file:
+        build_file.write(MAGIC + struct.pack('>BB', VERSION, codec))
+        for frame in encode_frames(data):
+            frame_bytes = json.dumps(frame, separators=(',', ':'), default=str).encode('utf-8')
+            build_file.write(compressor.compress(struct.pack('>I', len(frame_bytes)) + frame_bytes))
+        build_file.write(compressor.flush())
+
+
+# ====== Reading ====== #
+def iter_frames(file_path):
+    """Decompress and decode frames while file is being read."""
+    with open(file_path, 'rb') as build_file:
+        header = build_file.read(len(MAGIC) + 2)
+        if header[:len(MAGIC)] != MAGIC:
+            raise FormatError('Not a compact build file: {0}'.format(file_path))
+        version, codec = struct.unpack('>BB', header[len(MAGIC):])
+        if version > VERSION:
+            raise FormatError('Unsupported compact build version: {0}'.format(version))
+
+        decompressor = get_decompressor(codec)
+        buffer = b''
+        while True:
+            chunk = build_file.read(CHUNK_SIZE)
+            if chunk:
+                buffer += decompressor.decompress(chunk)
+            offset = 0
+            while len(buffer) - offset >= 4:
+                frame_size = struct.unpack('>I', buffer[offset:offset + 4])[0]
+                if len(buffer) - offset - 4 < frame_size:
+                    break
+                yield json.loads(buffer[offset + 4:offset + 4 + frame_size].decode('utf-8'), object_pairs_hook=OrderedDict)
+                offset += 4 + frame_size
+            buffer = buffer[offset:]
+            if not chunk:
+                break
+        if buffer:
+            raise FormatError('Unexpected end of compact build file: {0}'.format(file_path))
+
+
+def iter_records(file_path):
+    """Read compact build file as scene, node and edge records in json format.
+
+    :return: Generator of (kind, record) tuples, kind is one of "scene", "node", "edge".
+    :rtype: generator
+    """
+    strings = []
+    socket_ids = []
+    for frame in iter_frames(file_path):
+        frame_type = frame[0]
+        if frame_type == FRAME_STRINGS:
+            strings = frame[1]
+        elif frame_type == FRAME_SCENE:
+            yield 'scene', OrderedDict([('id', frame[1]),
+                                        ('vars', frame[2]),
+                                        ('scene_width', frame[3]),
+                                        ('scene_height', frame[4]),
+                                        ('edge_type', frame[5]),
+                                        ('items_count', frame[6] if len(frame) > 6 else 0)])
+        elif frame_type == FRAME_NODE:
+            sockets = []
+            for rows in [frame[6], frame[7]]:
+                side = []
+                for row in rows:
+                    socket_ids.append(row[0])
+                    side.append(OrderedDict([('id', row[0]),
+                                             ('index', row[1]),
+                                             ('position', row[2]),
+                                             ('data_type', strings[row[3]]),
+                                             ('max_connections', row[4]),
+                                             ('label', strings[row[5]]),
+                                             ('value', row[6])]))
+                sockets.append(side)
+            record = OrderedDict([('id', frame[1]),
+                                  ('node_id', frame[2]),
+                                  ('title', strings[frame[3]]),
+                                  ('pos_x', frame[4]),
+                                  ('pos_y', frame[5]),
+                                  ('inputs', sockets[0]),
+                                  ('outputs', sockets[1])])
+            record.update(frame[8])
+            yield 'node', record
+        elif frame_type == FRAME_EDGE:
+            start, end = [socket_ids[ref] if isinstance(ref, int) else ref for ref in frame[2:4]]
+            yield 'edge', OrderedDict([('id', frame[1]), ('start', start), ('end', end)])
+
+
+def iter_json_records(data):
+    """Same records as iter_records for already parsed json build data."""
+    record = OrderedDict([(key, data.get(key)) for key in ['id', 'vars', 'scene_width', 'scene_height', 'edge_type']])
+    record['items_count'] = len(data['nodes']) + len(data['edges'])
+    yield 'scene', record
+    for node_data in data['nodes']:
+        yield 'node', node_data
+    for edge_data in data['edges']:
+        yield 'edge', edge_data
+
+
+def read_records(file_path):
+    """Read build file of either format as records. Json files are parsed before returning.
+
+    :rtype: generator
+    """
+    if is_compact(file_path):
+        return iter_records(file_path)
+    with open(file_path, 'r') as build_file:
+        data = json.load(build_file, object_pairs_hook=OrderedDict)
+    return iter_json_records(data)
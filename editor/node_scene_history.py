@@ -1,13 +1,28 @@
-import itertools
+import json
+import zlib
+import timeit
+import contextlib
 from collections import deque
+from collections import OrderedDict
 from luna import Logger
 from luna import Config
 from luna import BuilderVars
+import luna_builder.editor.node_edge as node_edge
 
 
 class SceneHistory(object):
+    """Undo stack of scene deltas.
+
+    Each entry stores only nodes and edges records that were added, removed or changed since the previous entry.
+    Undo and redo apply these deltas to the scene in place.
+    Entries older than RAW_ENTRIES are kept as zlib compressed json, oldest entries are evicted when stack exceeds
+    either step count or memory budget.
+    """
 
     SCENE_INIT_DESC = 'SceneInit'
+    MEMORY_BUDGET_MB = 64
+    COALESCE_INTERVAL = 1.0
+    RAW_ENTRIES = 2
 
     def __len__(self):
         return len(self.stack)
@@ -15,10 +30,26 @@ class SceneHistory(object):
     def __init__(self, scene):
         self.scene = scene
 
-        self.enabled = Config.get(BuilderVars.history_enabled, default=True, cached=True)
+        self.enabled = False
+        self.update_enabled_state()
         self._size = Config.get(BuilderVars.history_size, default=32, cached=True)
-        self.stack = deque(maxlen=self._size)
+        self._memory_budget_mb = self.MEMORY_BUDGET_MB
+        # Budget var is not available in older luna versions
+        if hasattr(BuilderVars, 'history_memory_mb'):
+            self._memory_budget_mb = Config.get(BuilderVars.history_memory_mb, default=self.MEMORY_BUDGET_MB, cached=True)
+        self.stack = deque()
         self.current_step = -1
+        self.stack_bytes = 0
+        # Scene state at current step
+        self._state = None  # type: dict
+        # Last stored entry that can be merged with: key, store time, state before entry, entry
+        self._coalesce = None  # type: tuple
+        self._transaction_depth = 0
+        self._transaction_desc = None
+
+    def update_enabled_state(self):
+        """History is disabled for headless scenes, there is no user to undo anything."""
+        self.enabled = self.scene.has_graphics and Config.get(BuilderVars.history_enabled, default=True, cached=True)
 
     @property
     def size(self):
@@ -27,11 +58,27 @@ class SceneHistory(object):
     @size.setter
     def size(self, new_size):
         self._size = new_size
-        self.stack = deque(self.stack, maxlen=new_size)
+        self.evict()
+
+    @property
+    def memory_budget_mb(self):
+        return self._memory_budget_mb
+
+    @memory_budget_mb.setter
+    def memory_budget_mb(self, value):
+        self._memory_budget_mb = value
+        self.evict()
+
+    @property
+    def memory_budget(self):
+        return self._memory_budget_mb * 1024 * 1024
 
     def clear(self):
         self.stack.clear()
         self.current_step = -1
+        self.stack_bytes = 0
+        self._state = None
+        self._coalesce = None
 
     def undo(self):
         if not self.enabled:
@@ -40,8 +87,8 @@ class SceneHistory(object):
 
         if self.current_step > 0:
             Logger.info('> Undo {0}'.format(self.stack[self.current_step]['desc']))
+            self.restore_history(self.stack[self.current_step], self.stack[self.current_step - 1], undo=True)
             self.current_step -= 1
-            self.restore_history()
         else:
             Logger.warning('No more steps to undo')
 
@@ -52,31 +99,112 @@ class SceneHistory(object):
 
         if self.current_step + 1 < len(self.stack):
             self.current_step += 1
-            self.restore_history()
+            self.restore_history(self.stack[self.current_step], self.stack[self.current_step], undo=False)
         else:
             Logger.warning('No more steps to redo')
 
-    def restore_history(self):
-        self.enabled = False
-        # Logger.debug('Restoring history | \nStep: @{0} | Stack: {1}'.format(self.current_step, len(self)))
-        self.restore_stamp(self.stack[self.current_step])
-        self.scene.has_been_modified = True
-        self.enabled = True
+    def restore_history(self, entry, selection_entry, undo=False):
+        """Apply entry delta to the scene.
 
-    def store_history(self, description, set_modified=True):
-        if not self.enabled:
+        :param entry: Entry to apply or revert
+        :type entry: dict
+        :param selection_entry: Entry to restore selection from
+        :type selection_entry: dict
+        :param undo: Revert entry delta instead of applying it
+        :type undo: bool
+        """
+        self.enabled = False
+        if entry.get('selection_only'):
+            self.restore_selection(selection_entry)
+            self.update_enabled_state()
             return
 
+        try:
+            self.apply_delta(self.get_delta(entry), undo=undo)
+            self.restore_selection(selection_entry)
+        except Exception:
+            Logger.exception('Restore history exception.')
+            raise
+        finally:
+            new_state = self.capture_state()
+            self.scene.journal.record('Undo' if undo else 'Redo', self.create_delta(self._state, new_state))
+            self._state = new_state
+            self.scene.has_been_modified = True
+            self.update_enabled_state()
+
+    def truncate_redo(self):
         # if the pointer (current_step) is not at the end of stack
-        if self.current_step + 1 < len(self.stack):
-            self.stack = deque(itertools.islice(self.stack, self.current_step + 1))
+        while self.current_step + 1 < len(self.stack):
+            self.stack_bytes -= self.stack.pop()['bytes']
 
-        hs = self.create_stamp(description)
+    def store_selection(self, description):
+        """Store selection change without serializing the scene. Merged with previous selection entry."""
+        if not self.enabled or self._transaction_depth:
+            return
 
-        # Increment step if possible
-        self.stack.append(hs)
-        if not self.stack.maxlen or self.current_step + 1 < self.stack.maxlen:
+        self.truncate_redo()
+        selection = self.get_selection()
+        if self.stack and self.stack[-1].get('selection_only'):
+            self.stack[-1]['desc'] = description
+            self.stack[-1]['selection'] = selection
+        else:
+            self.stack.append({
+                'desc': description,
+                'delta': None,
+                'selection': selection,
+                'selection_only': True,
+                'bytes': 0
+            })
             self.current_step += 1
+            self.evict()
+        Logger.debug('> {0}'.format(description))
+
+    def store_history(self, description, set_modified=True, coalesce_key=None):
+        """Store scene changes since the last entry.
+
+        :param description: Entry description
+        :type description: str
+        :param set_modified: Mark scene as modified
+        :type set_modified: bool
+        :param coalesce_key: Entries with the same key stored within COALESCE_INTERVAL are merged into one.
+        :type coalesce_key: tuple
+        """
+        if not self.enabled or self._transaction_depth:
+            return
+
+        self.truncate_redo()
+        store_time = timeit.default_timer()
+        new_state = self.capture_state()
+        if self.can_coalesce(coalesce_key, store_time):
+            self.coalesce(description, coalesce_key, store_time, new_state)
+            if set_modified:
+                self.scene.has_been_modified = True
+            return
+
+        base_state = self._state
+        if description == SceneHistory.SCENE_INIT_DESC or base_state is None:
+            delta = None
+            self.scene.journal.start()
+        else:
+            delta = self.create_delta(base_state, new_state)
+            if self.is_empty_delta(delta):
+                return
+            self.scene.journal.record(description, delta)
+        self._state = new_state
+
+        entry = {
+            'desc': description,
+            'delta': delta,
+            'selection': self.get_selection(),
+            'bytes': self.delta_size(delta)
+        }
+        self.stack.append(entry)
+        self.stack_bytes += entry['bytes']
+        self.current_step += 1
+        self._coalesce = (coalesce_key, store_time, base_state, entry) if coalesce_key is not None else None
+        if len(self.stack) > self.RAW_ENTRIES:
+            self.compress_entry(self.stack[-self.RAW_ENTRIES - 1])
+        self.evict()
 
         # Log change
         if description != SceneHistory.SCENE_INIT_DESC:
@@ -87,40 +215,199 @@ class SceneHistory(object):
         if set_modified:
             self.scene.has_been_modified = True
 
-    def create_stamp(self, description):
-        sel_obj = {'nodes': [node.uid for node in self.scene.selected_nodes],
-                   'edges': [edge.uid for edge in self.scene.selected_edges]}
+    def can_coalesce(self, coalesce_key, store_time):
+        if coalesce_key is None or self._coalesce is None:
+            return False
+        key, last_time, base_state, entry = self._coalesce
+        return key == coalesce_key and store_time - last_time < self.COALESCE_INTERVAL and self.stack and self.stack[-1] is entry
 
-        stamp = {
-            'desc': description,
-            'snapshot': self.scene.serialize(),
-            'selection': sel_obj
-        }
+    def coalesce(self, description, coalesce_key, store_time, new_state):
+        """Replace last entry delta with delta from the state before it to the new state."""
+        key, last_time, base_state, entry = self._coalesce
+        self.scene.journal.record(description, self.create_delta(self._state, new_state))
+        delta = self.create_delta(base_state, new_state)
+        self._state = new_state
+        self.stack_bytes -= entry['bytes']
+        if self.is_empty_delta(delta):
+            # Changes were reverted
+            self.stack.pop()
+            self.current_step -= 1
+            self._coalesce = None
+            return
+
+        entry['desc'] = description
+        entry['delta'] = delta
+        entry['selection'] = self.get_selection()
+        entry['bytes'] = self.delta_size(delta)
+        self.stack_bytes += entry['bytes']
+        self._coalesce = (coalesce_key, store_time, base_state, entry)
+        self.evict()
 
-        return stamp
+    # ====== Transactions ====== #
+    def begin_transaction(self, description):
+        """Suppress history entries until matching end_transaction, then store all changes as single entry."""
+        if not self._transaction_depth:
+            self._transaction_desc = description
+        self._transaction_depth += 1
 
-    def restore_stamp(self, stamp):
+    def end_transaction(self, set_modified=True):
+        if not self._transaction_depth:
+            Logger.warning('No history transaction to end')
+            return
+        self._transaction_depth -= 1
+        if not self._transaction_depth:
+            self.store_history(self._transaction_desc, set_modified=set_modified)
+            self._transaction_desc = None
 
+    @contextlib.contextmanager
+    def transaction(self, description, set_modified=True):
+        self.begin_transaction(description)
         try:
-            self.scene.deserialize(stamp['snapshot'])
-            self.scene.gr_scene.clearSelection()
-
-            # Restore selection
-            for edge_uid in stamp['selection']['edges']:
-                for edge in self.scene.edges:
-                    if edge.uid == edge_uid:
-                        edge.gr_edge.setSelected(True)
-                        break
-
-            for node_uid in stamp['selection']['nodes']:
-                for node in self.scene.nodes:
-                    if node.uid == node_uid:
-                        node.gr_node.setSelected(True)
-                        break
-        except Exception:
-            Logger.exception('Restore history stamp exception.')
-            raise
+            yield
+        finally:
+            self.end_transaction(set_modified=set_modified)
+
+    def evict(self):
+        """Drop oldest entries while stack is over step count or memory budget. Current entry is always kept."""
+        while self.current_step > 0 and (len(self.stack) > self._size or self.stack_bytes > self.memory_budget):
+            entry = self.stack.popleft()
+            self.stack_bytes -= entry['bytes']
+            self.current_step -= 1
+            if self._coalesce and self._coalesce[3] is entry:
+                self._coalesce = None
+
+    def compress_entry(self, entry):
+        if entry['delta'] is None or entry.get('compressed'):
+            return
+        if self._coalesce and self._coalesce[3] is entry:
+            self._coalesce = None
+        data = zlib.compress(json.dumps(entry['delta'], separators=(',', ':'), default=str).encode('utf-8'))
+        self.stack_bytes += len(data) - entry['bytes']
+        entry['delta'] = data
+        entry['bytes'] = len(data)
+        entry['compressed'] = True
+
+    @classmethod
+    def get_delta(cls, entry):
+        """Entry delta, decompressed if needed. Compressed entries stay compressed in the stack."""
+        if not entry.get('compressed'):
+            return entry['delta']
+        return json.loads(zlib.decompress(entry['delta']).decode('utf-8'), object_pairs_hook=OrderedDict)
+
+    # ====== State and deltas ====== #
+    def capture_state(self):
+        """Records of every scene object at this moment. Records are cached by objects so this is mostly reuse."""
+        return {
+            'nodes': OrderedDict([(node.uid, node.serialize()) for node in self.scene.nodes]),
+            'edges': OrderedDict([(edge.uid, edge.serialize()) for edge in self.scene.edges if edge.start_socket and edge.end_socket]),
+            'vars': self.scene.vars.serialize(),
+            'edge_type': self.scene.edge_type.name
+        }
+
+    @classmethod
+    def diff_records(cls, old_records, new_records):
+        return {
+            'added': [(uid, record) for uid, record in new_records.items() if uid not in old_records],
+            'removed': [(uid, record) for uid, record in old_records.items() if uid not in new_records],
+            'changed': [(uid, old_records[uid], record) for uid, record in new_records.items()
+                        if uid in old_records and old_records[uid] is not record and old_records[uid] != record]
+        }
+
+    @classmethod
+    def create_delta(cls, old_state, new_state):
+        delta = {
+            'nodes': cls.diff_records(old_state['nodes'], new_state['nodes']),
+            'edges': cls.diff_records(old_state['edges'], new_state['edges']),
+            'vars': None,
+            'edge_type': None
+        }
+        if old_state['vars'] != new_state['vars']:
+            delta['vars'] = (old_state['vars'], new_state['vars'])
+        if old_state['edge_type'] != new_state['edge_type']:
+            delta['edge_type'] = (old_state['edge_type'], new_state['edge_type'])
+        return delta
+
+    @classmethod
+    def is_empty_delta(cls, delta):
+        for diff in [delta['nodes'], delta['edges']]:
+            if diff['added'] or diff['removed'] or diff['changed']:
+                return False
+        return not delta['vars'] and not delta['edge_type']
+
+    @classmethod
+    def delta_size(cls, delta):
+        return len(json.dumps(delta, default=str)) if delta else 0
+
+    @classmethod
+    def split_diff(cls, diff, undo):
+        """Get added, removed and changed records in direction of delta application.
+
+        :return: Added records, removed records, changed (uid, record) pairs
+        :rtype: tuple
+        """
+        if undo:
+            return diff['removed'], diff['added'], [(uid, old_record) for uid, old_record, new_record in diff['changed']]
+        return diff['added'], diff['removed'], [(uid, new_record) for uid, old_record, new_record in diff['changed']]
+
+    def apply_delta(self, delta, undo=False):
+        if not delta:
+            return
+        index = 0 if undo else 1
+        if delta['vars']:
+            # Copy values, scene vars are modified in place
+            self.scene.vars.deserialize(OrderedDict([(name, list(pair)) for name, pair in delta['vars'][index].items()]))
+
+        nodes_added, nodes_removed, nodes_changed = self.split_diff(delta['nodes'], undo)
+        edges_added, edges_removed, edges_changed = self.split_diff(delta['edges'], undo)
+
+        # Changed edges are recreated
+        for uid, record in edges_removed + edges_changed:
+            edge = self.scene.get_edge(uid)
+            if edge:
+                edge.remove()
+        for uid, record in nodes_removed:
+            node = self.scene.get_node(uid)
+            if node:
+                node.remove()
+
+        hashmap = {}
+        with self.scene.defer_layout():
+            for uid, record in nodes_added:
+                new_node = self.scene.get_class_from_node_data(record)(self.scene)
+                new_node.deserialize(record, hashmap, restore_id=True)
+            for uid, record in nodes_changed:
+                self.scene.get_node(uid).deserialize(record, hashmap, restore_id=True)
+
+            for uid, record in edges_added + edges_changed:
+                for socket_uid in [record['start'], record['end']]:
+                    if socket_uid not in hashmap:
+                        hashmap[socket_uid] = self.scene.get_socket(socket_uid)
+                new_edge = node_edge.Edge(self.scene)
+                new_edge.deserialize(record, hashmap, restore_id=True)
+
+        if delta['edge_type']:
+            self.scene.edge_type = delta['edge_type'][index]
+
+    # ====== Selection ====== #
+    def get_selection(self):
+        return {'nodes': [node.uid for node in self.scene.selected_nodes],
+                'edges': [edge.uid for edge in self.scene.selected_edges]}
+
+    def restore_selection(self, entry):
+        if not self.scene.has_graphics:
+            return
+        self.scene.gr_scene.clearSelection()
+        for edge_uid in entry['selection']['edges']:
+            edge = self.scene.get_edge(edge_uid)
+            if edge and edge.gr_edge:
+                edge.gr_edge.setSelected(True)
+
+        for node_uid in entry['selection']['nodes']:
+            node = self.scene.get_node(node_uid)
+            if node and node.gr_node:
+                node.gr_node.setSelected(True)
 
     def debug_varibles(self):
-        for step, stamp in enumerate(self.stack):
-            Logger.debug('Step {0} - {1}'.format(step, stamp['snapshot']['vars']))
+        for step, entry in enumerate(self.stack):
+            delta = self.get_delta(entry)
+            Logger.debug('Step {0} - {1}'.format(step, delta['vars'] if delta else None))
@@ -0,0 +1,196 @@
+import os
+import json
+import tempfile
+import threading
+from collections import OrderedDict
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+from luna import Logger
+
+
+class JournalWriter(threading.Thread):
+    """Background thread appending journal lines to disk. Lines are encoded by the caller."""
+
+    def __init__(self):
+        super(JournalWriter, self).__init__()
+        self.daemon = True
+        self.tasks = queue.Queue()
+
+    def run(self):
+        while True:
+            action, path, payload = self.tasks.get()
+            try:
+                if action == 'append':
+                    self.append(path, payload)
+                elif action == 'rewrite':
+                    self.rewrite(path, payload)
+                elif action == 'discard':
+                    if os.path.isfile(path):
+                        os.remove(path)
+            except Exception:
+                Logger.exception('Failed to write session journal {0}'.format(path))
+            finally:
+                self.tasks.task_done()
+
+    def append(self, path, lines):
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(path, 'a') as journal_file:
+            for line in lines:
+                journal_file.write(line + '\n')
+            journal_file.flush()
+
+    def rewrite(self, path, lines):
+        temp_path = path + '.tmp'
+        if os.path.isfile(temp_path):
+            os.remove(temp_path)
+        self.append(temp_path, lines)
+        if os.path.isfile(path):
+            os.remove(path)
+        os.rename(temp_path, path)
+
+
+class SceneJournal(object):
+    """Append-only log of scene deltas stored next to the build file.
+
+    Journal starts with a snapshot of the scene followed by deltas recorded by scene history.
+    It's written only when there are unsaved changes and removed once build is saved or changes are discarded.
+    Untitled scenes are not journaled, there is no build file to recover them for.
+    Every COMPACT_THRESHOLD deltas journal is folded into a single snapshot.
+    Records are encoded on the calling thread, scene records are live serialization caches.
+    """
+
+    EXTENSION = '.journal'
+    COMPACT_THRESHOLD = 200
+    # Untitled journals written by older versions
+    LEGACY_UNTITLED_DIR = os.path.join(tempfile.gettempdir(), 'luna_journals')
+    _writer = None  # type: JournalWriter
+
+    def __init__(self, scene):
+        self.scene = scene
+        self._base_snapshot = None
+        self._active_path = None
+        self._deltas_count = 0
+
+    @classmethod
+    def get_writer(cls):
+        if cls._writer is None or not cls._writer.is_alive():
+            cls._writer = JournalWriter()
+            cls._writer.start()
+            cls.remove_legacy_journals()
+        return cls._writer
+
+    @classmethod
+    def remove_legacy_journals(cls):
+        if not os.path.isdir(cls.LEGACY_UNTITLED_DIR):
+            return
+        for file_name in os.listdir(cls.LEGACY_UNTITLED_DIR):
+            if file_name.startswith('untitled_'):
+                cls._writer.tasks.put(('discard', os.path.join(cls.LEGACY_UNTITLED_DIR, file_name), None))
+
+    @classmethod
+    def journal_path(cls, file_path):
+        return file_path + cls.EXTENSION
+
+    @classmethod
+    def encode(cls, record):
+        return json.dumps(record, separators=(',', ':'), default=str)
+
+    @property
+    def path(self):
+        if not self.scene.file_name:
+            return None
+        return self.journal_path(self.scene.file_name)
+
+    def snapshot_line(self):
+        return self.encode({'type': 'snapshot', 'data': self.scene.serialize()})
+
+    def start(self):
+        """Set current scene state as journal base and remove stale journal. Nothing is written until the first delta."""
+        self.discard(rebase=False)
+        if self.path:
+            self.get_writer().tasks.put(('discard', self.path, None))
+        self._base_snapshot = self.snapshot_line()
+
+    def record(self, description, delta):
+        if self._base_snapshot is None:
+            return
+        if self._active_path != self.path:
+            if self._active_path:
+                self.get_writer().tasks.put(('discard', self._active_path, None))
+            self._active_path = self.path
+            self._deltas_count = 0
+            if self._active_path:
+                self.get_writer().tasks.put(('rewrite', self._active_path, [self._base_snapshot]))
+        if not self._active_path:
+            return
+
+        self._deltas_count += 1
+        if self._deltas_count >= self.COMPACT_THRESHOLD:
+            self.compact()
+        else:
+            self.get_writer().tasks.put(('append', self._active_path, [self.encode({'type': 'delta', 'desc': description, 'delta': delta})]))
+
+    def compact(self):
+        """Replace journal contents with snapshot of current scene state."""
+        self._active_path = self.path
+        self._base_snapshot = self.snapshot_line()
+        self._deltas_count = 0
+        if not self._active_path:
+            return
+        self.get_writer().tasks.put(('rewrite', self._active_path, [self._base_snapshot]))
+        Logger.debug('Compacted session journal {0}'.format(self._active_path))
+
+    def discard(self, rebase=True):
+        """Remove journal file.
+
+        :param rebase: Make current scene state new journal base.
+        :type rebase: bool
+        """
+        if self._active_path:
+            self.get_writer().tasks.put(('discard', self._active_path, None))
+        self._active_path = None
+        self._deltas_count = 0
+        if rebase and self._base_snapshot is not None:
+            self._base_snapshot = self.snapshot_line()
+
+    def flush(self):
+        if self._writer is not None:
+            self._writer.tasks.join()
+
+    # ====== Recovery ====== #
+    @classmethod
+    def has_recovery(cls, file_path):
+        """Check if there are unsaved changes journaled for build file."""
+        journal = cls.journal_path(file_path)
+        if not os.path.isfile(journal):
+            return False
+        return not os.path.isfile(file_path) or os.path.getmtime(journal) >= os.path.getmtime(file_path)
+
+    @classmethod
+    def read(cls, file_path):
+        """Read journal of build file.
+
+        :return: Scene snapshot and list of deltas recorded after it
+        :rtype: tuple
+        """
+        snapshot = None
+        deltas = []
+        with open(cls.journal_path(file_path), 'r') as journal_file:
+            for line in journal_file:
+                try:
+                    record = json.loads(line, object_pairs_hook=OrderedDict)
+                except ValueError:
+                    # Unfinished write
+                    Logger.warning('Skipped corrupted journal record')
+                    break
+                if record['type'] == 'snapshot':
+                    snapshot = record['data']
+                    deltas = []
+                else:
+                    deltas.append(record['delta'])
+        return snapshot, deltas
@@ -0,0 +1,137 @@
+import timeit
+import threading
+import traceback
+from PySide2 import QtCore
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+from luna import Logger
+import luna_builder.editor.node_scene_format as scene_format
+
+
+class LoaderSignals(QtCore.QObject):
+    progress = QtCore.Signal(int, int)
+    finished = QtCore.Signal(bool)
+
+
+class RecordsReader(threading.Thread):
+    """Reads and decodes build file records in background. Records are consumed by the main thread."""
+
+    def __init__(self, file_path):
+        super(RecordsReader, self).__init__()
+        self.daemon = True
+        self.file_path = file_path
+        self.records = queue.Queue()
+        self.error = None
+        self._stopped = threading.Event()
+
+    def run(self):
+        try:
+            for record in scene_format.read_records(self.file_path):
+                if self._stopped.is_set():
+                    break
+                self.records.put(record)
+        except Exception:
+            # Logged from the main thread
+            self.error = traceback.format_exc()
+        finally:
+            self.records.put(None)
+
+    def stop(self):
+        self._stopped.set()
+
+
+class SceneLoader(object):
+    """Two stage build file loader.
+
+    File is parsed by RecordsReader thread while nodes and edges are created on the main thread
+    in time slices, so editor stays responsive while large builds are opened.
+    """
+
+    TIME_SLICE = 0.02
+    POLL_INTERVAL = 10
+
+    def __init__(self, scene, file_path):
+        self.signals = LoaderSignals()
+        self.scene = scene
+        self.file_path = file_path
+        self.reader = RecordsReader(file_path)
+        self.hashmap = {}
+        self.loaded_count = 0
+        self.total_count = 0
+        self.is_running = False
+        self._start_time = 0.0
+
+        self.timer = QtCore.QTimer()
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self.populate_chunk)
+
+    def start(self):
+        self._start_time = timeit.default_timer()
+        self.is_running = True
+        self.reader.start()
+        self.timer.start()
+
+    def cancel(self):
+        if not self.is_running:
+            return
+        self.stop()
+        Logger.info('Cancelled loading {0}'.format(self.file_path))
+        self.signals.finished.emit(False)
+
+    def stop(self):
+        self.is_running = False
+        self.timer.stop()
+        self.reader.stop()
+
+    def populate_chunk(self):
+        end_time = timeit.default_timer() + self.TIME_SLICE
+        try:
+            # Nodes of the chunk are laid out once at the end
+            with self.scene.defer_layout():
+                done = self._populate_chunk(end_time)
+        except Exception:
+            Logger.exception('Failed to load rig build file')
+            self.stop()
+            self.signals.finished.emit(False)
+            return
+        if done:
+            self.finish()
+        else:
+            self.signals.progress.emit(self.loaded_count, self.total_count)
+
+    def _populate_chunk(self, end_time):
+        """Deserialize records until time slice ends.
+
+        :return: If all records were deserialized.
+        :rtype: bool
+        """
+        while timeit.default_timer() < end_time:
+            try:
+                record = self.reader.records.get_nowait()
+            except queue.Empty:
+                # Wait for reader without spinning event loop
+                self.timer.setInterval(self.POLL_INTERVAL)
+                return False
+            self.timer.setInterval(0)
+            if record is None:
+                return True
+            kind, data = record
+            if kind == 'scene':
+                self.total_count = data.get('items_count') or 0
+            else:
+                self.loaded_count += 1
+            self.scene.deserialize_record(kind, data, self.hashmap)
+        return False
+
+    def finish(self):
+        self.stop()
+        if self.reader.error:
+            Logger.error('Failed to load rig build file\n{0}'.format(self.reader.error))
+            self.signals.finished.emit(False)
+            return
+        Logger.info('Rig build loaded in {0:.2f}s'.format(timeit.default_timer() - self._start_time))
+        self.signals.progress.emit(self.loaded_count, self.loaded_count)
+        self.signals.finished.emit(True)
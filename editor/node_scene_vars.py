@@ -25,6 +25,7 @@ class SceneVars(node_serializable.Serializable):
     def create_connections(self):
         self.signals.data_type_changed.connect(self.update_setters)
         self.signals.data_type_changed.connect(self.update_getters)
+        self.signals.value_changed.connect(self.mark_getters_dependents_dirty)
 
     def get_value(self, name):
         return self._vars[name][0]
@@ -95,12 +96,19 @@ class SceneVars(node_serializable.Serializable):
         except Exception:
             Logger.exception('Failed to update setters')
 
+    def mark_getters_dependents_dirty(self, var_name):
+        # Setters update variables during build, their dependents are executed later in the chain
+        if self.scene.is_executing:
+            return
+        for getter_node in self.list_getters(var_name):
+            getter_node.mark_children_compiled(False)
+
     def serialize(self):
         try:
             result = OrderedDict()
             for var_name, value_type_pair in self._vars.items():
                 value, type_name = value_type_pair
-                if type_name in editor_conf.DataType.runtime_types(names=True):
+                if type_name in editor_conf.RUNTIME_DATATYPES:
                     result[var_name] = [editor_conf.DATATYPE_REGISTER[type_name]['default'], type_name]
                 else:
                     result[var_name] = [value, type_name]
@@ -314,7 +322,7 @@ class VarAttribWidget(QtWidgets.QGroupBox):
         self.data_type_box.setCurrentText(var_data_type_name)
 
         self.value_widget = None
-        if var_data_type['class'] in editor_conf.DataType.runtime_types(classes=True):
+        if editor_conf.DataType.is_runtime_type(var_data_type):
             self.value_widget = QtWidgets.QLineEdit()
             self.value_widget.setText(str(var_value))
             self.value_widget.setEnabled(False)
@@ -18,7 +18,21 @@ class Serializable(object):
         return meta_type_str
 
     def __init__(self):
-        self.uid = str(uuid.uuid4())
+        self._uid = str(uuid.uuid4())
+
+    @property
+    def uid(self):
+        return self._uid
+
+    @uid.setter
+    def uid(self, value):
+        old_uid = self._uid
+        self._uid = value
+        if old_uid != value:
+            self.on_uid_changed(old_uid)
+
+    def on_uid_changed(self, old_uid):
+        pass
 
     def serialize(self):
         raise NotImplementedError()
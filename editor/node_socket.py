@@ -1,4 +1,5 @@
 import imp
+import copy
 import pymel.core as pm
 from PySide2 import QtCore
 from collections import OrderedDict
@@ -37,36 +38,54 @@ class Socket(node_serializable.Serializable):
                  node,
                  index=0,
                  position=Position.LEFT_TOP,
-                 data_type=editor_conf.DataType.NUMERIC,
+                 data_type=None,
                  label=None,
                  max_connections=0,
                  value=None,
                  count_on_this_side=0):
         super(Socket, self).__init__()
         self.signals = SocketSignals()
+        self.gr_socket = None
+        self._serialized = None
+        self._index = index
         self.edges = []
         self._affected_sockets = []
 
         self.node = node
-        self.index = index
         self.node_position = position if isinstance(position, Socket.Position) else Socket.Position(position)
-        # self.data_type = editor_conf.DataType.get_type(data_type) if isinstance(data_type, int) else data_type
-        self.data_type = data_type
+        # Default is resolved at call time, class attribute is replaced once datatypes are registered
+        self.data_type = data_type if data_type is not None else editor_conf.DataType.NUMERIC
         self._label = label if label is not None else self.data_type.get('label')
         self.max_connections = max_connections
         self.count_on_this_side = count_on_this_side
         self._value = self.data_type.get('default') if value is None else value
         self._default_value = self.value()
 
+        self.node.scene.add_socket(self)
+
         # Graphics
-        self.gr_socket = graphics_socket.QLGraphicsSocket(self)
-        self.update_positions()
+        if self.node.gr_node is not None:
+            self.init_graphics()
 
         # Signals
         self.create_connections()
 
+    def init_graphics(self):
+        self.gr_socket = graphics_socket.QLGraphicsSocket(self)
+        self.update_positions()
+
     def create_connections(self):
-        pass
+        self.signals.value_changed.connect(self.invalidate_serialized)
+        self.signals.connection_changed.connect(self.invalidate_serialized)
+
+    @property
+    def index(self):
+        return self._index
+
+    @index.setter
+    def index(self, value):
+        self._index = value
+        self.invalidate_serialized()
 
     # ============ Properties ============= #
 
@@ -77,7 +96,9 @@ class Socket(node_serializable.Serializable):
     @label.setter
     def label(self, text):
         self._label = text
-        self.gr_socket.text_item.setPlainText(self._label)
+        self.invalidate_serialized()
+        if self.gr_socket is not None:
+            self.gr_socket.text_item.setPlainText(self._label)
 
     @property
     def default_value(self):
@@ -93,14 +114,14 @@ class Socket(node_serializable.Serializable):
 
     @data_type.setter
     def data_type(self, value):
-        if isinstance(value, str):
-            self._data_type = editor_conf.DATATYPE_REGISTER[value]
-        elif isinstance(value, dict):
-            self._data_type = value
+        if isinstance(value, (str, dict)):
+            # Plain dicts are swapped for registered datatypes so identity checks keep working
+            self._data_type = editor_conf.DataType.resolve(value)
         else:
             Logger.error('{0}: Can\'t set datatype to {0}'.format(value))
             raise ValueError
-        if hasattr(self, 'gr_socket'):
+        self.invalidate_serialized()
+        if self.gr_socket is not None:
             self.gr_socket._color_background = self._data_type.get('color')
             self.gr_socket.update()
         self.node.update_size()
@@ -109,16 +130,20 @@ class Socket(node_serializable.Serializable):
     def data_class(self):
         return self.data_type.get('class')
 
+    def is_exec(self):
+        return self.data_type == editor_conf.DataType.EXEC
+
     # ============ Basic methods ============= #
     def remove(self):
         self.remove_all_edges()
-        self.node.scene.gr_scene.removeItem(self.gr_socket)
+        self.node.scene.remove_socket(self)
+        if self.gr_socket is not None:
+            self.node.scene.gr_scene.removeItem(self.gr_socket)
 
     # ============ Datatype methods ============= #
 
     def is_runtime_data(self):
-        runtime_classes = editor_conf.DataType.runtime_types(classes=True)
-        return self.data_class in runtime_classes or self.value().__class__ in runtime_classes
+        return editor_conf.DataType.is_runtime_type(self.data_type) or editor_conf.DataType.is_runtime_class(self.value().__class__)
     # ============ Value methods ============= #
 
     def value(self):
@@ -144,6 +169,9 @@ class Socket(node_serializable.Serializable):
     # ============ Graphics objects methods ============= #
 
     def update_positions(self):
+        # Deferred node relayout will position socket
+        if self.gr_socket is None or self.node.is_layout_deferred:
+            return
         self.gr_socket.setPos(*self.node.get_socket_position(self.index, self.node_position, self.count_on_this_side))
         self.gr_socket.text_item.setPos(*self.get_label_position())
 
@@ -158,6 +186,8 @@ class Socket(node_serializable.Serializable):
             return [-text_width - self.node.gr_node.width / 25, Socket.LABEL_VERTICAL_PADDING]
 
     def get_label_width(self):
+        if self.gr_socket is None:
+            return 0
         return self.gr_socket.text_item.boundingRect().width()
 
     # ============ Edge Methods ============= #
@@ -173,6 +203,7 @@ class Socket(node_serializable.Serializable):
         if self.edges and self.max_connections and len(self.edges) >= self.max_connections:
             self.edges[-1].remove()
         self.edges.append(edge)
+        self.invalidate_serialized()
 
         if not silent:
             self.signals.connection_changed.emit()
@@ -187,6 +218,7 @@ class Socket(node_serializable.Serializable):
 
     def remove_edge(self, edge, silent=False):
         self.edges.remove(edge)
+        self.invalidate_serialized()
         if not silent:
             self.signals.connection_changed.emit()
 
@@ -220,13 +252,33 @@ class Socket(node_serializable.Serializable):
         return result
 
     # ============ (De)Serialization ============= #
+    def on_uid_changed(self, old_uid):
+        self.node.scene.reindex(self, old_uid)
+        self.invalidate_serialized()
+        for edge in self.edges:
+            edge.invalidate_serialized()
+
+    def invalidate_serialized(self):
+        self._serialized = None
+        self.node.invalidate_serialized()
+
+    def has_mutable_value(self):
+        """Lists and dicts can be changed in place without value_changed being emitted."""
+        return not self.is_runtime_data() and isinstance(self.value(), (list, dict))
+
     def serialize(self):
+        """Socket record. Not cached for mutable values, those are copied into every new record."""
+        if self._serialized is not None:
+            return self._serialized
+
         if self.is_runtime_data():
             value = None
+        elif self.has_mutable_value():
+            value = copy.deepcopy(self.value())
         else:
             value = self.value()
 
-        return OrderedDict([
+        result = OrderedDict([
             ('id', self.uid),
             ('index', self.index),
             ('position', self.node_position.value),
@@ -235,6 +287,9 @@ class Socket(node_serializable.Serializable):
             ('label', self.label),
             ('value', value)
         ])
+        if not self.has_mutable_value():
+            self._serialized = result
+        return result
 
     def deserialize(self, data, hashmap, restore_id=True):
         if restore_id:
@@ -257,10 +312,11 @@ class InputSocket(Socket):
         super(InputSocket, self).create_connections()
         self.signals.value_changed.connect(self.node.set_compiled)
         self.signals.connection_changed.connect(self.on_connection_changed)
+        self.signals.connection_changed.connect(self.node.set_compiled)
 
     def can_be_connected(self, other_socket):
         result = super(InputSocket, self).can_be_connected(other_socket)
-        if not issubclass(other_socket.data_class, self.data_class):
+        if not editor_conf.can_connect(other_socket.data_class, self.data_class):
             return False
         return result
 
@@ -283,7 +339,7 @@ class OutputSocket(Socket):
 
     def can_be_connected(self, other_socket):
         result = super(OutputSocket, self).can_be_connected(other_socket)
-        if not issubclass(self.data_class, other_socket.data_class):
+        if not editor_conf.can_connect(self.data_class, other_socket.data_class):
             return False
         return result
 
@@ -0,0 +1,119 @@
+"""Declarative socket layout of node classes.
+
+Node classes describe their sockets in define_sockets classmethod. Schema is resolved into a template
+once per class when plugins are registered and every node instance creates exactly the template sockets.
+"""
+from collections import OrderedDict
+
+import luna_builder.editor.editor_conf as editor_conf
+
+
+class _UseDefault(object):
+    def __repr__(self):
+        return 'USE_DEFAULT'
+
+
+#: Socket value is taken from its datatype
+USE_DEFAULT = _UseDefault()
+
+
+class SchemaError(Exception):
+    pass
+
+
+class SocketSpec(object):
+    """Description of a single socket. Attr is the node attribute socket instance is stored in."""
+
+    __slots__ = ('attr', 'is_input', 'data_type', 'label', 'value', 'max_connections', 'required', 'affects')
+
+    def __init__(self, attr, is_input, data_type, label=None, value=USE_DEFAULT, max_connections=0, required=False):
+        self.attr = attr
+        self.is_input = is_input
+        self.data_type = data_type
+        self.label = label
+        self.value = value
+        self.max_connections = max_connections
+        self.required = required
+        self.affects = []
+
+    def __repr__(self):
+        return '<SocketSpec {0} "{1}">'.format(self.attr, self.label)
+
+    def resolved(self):
+        """Copy of the spec with datatype, label and value taken from datatype register."""
+        data_type = editor_conf.DataType.resolve(self.data_type)
+        max_connections = self.max_connections
+        if self.is_input or data_type == editor_conf.DataType.EXEC:
+            max_connections = 1
+        spec = SocketSpec(self.attr,
+                          self.is_input,
+                          data_type,
+                          label=self.label if self.label is not None else data_type.get('label'),
+                          value=data_type.get('default') if self.value is USE_DEFAULT else self.value,
+                          max_connections=max_connections,
+                          required=self.required)
+        spec.affects = list(self.affects)
+        return spec
+
+
+class SocketSchema(object):
+    """Ordered input and output socket specs. Subclasses extend, remove or override specs of their base class."""
+
+    def __init__(self):
+        self.inputs = OrderedDict()
+        self.outputs = OrderedDict()
+
+    def add_input(self, attr, data_type, label=None, value=USE_DEFAULT, required=False):
+        self.inputs[attr] = SocketSpec(attr, True, data_type, label=label, value=value, required=required)
+        return self.inputs[attr]
+
+    def add_output(self, attr, data_type, label=None, value=USE_DEFAULT, max_connections=0):
+        self.outputs[attr] = SocketSpec(attr, False, data_type, label=label, value=value, max_connections=max_connections)
+        return self.outputs[attr]
+
+    def get(self, attr):
+        spec = self.inputs.get(attr) or self.outputs.get(attr)
+        if spec is None:
+            raise SchemaError('Socket {0} is not declared'.format(attr))
+        return spec
+
+    def remove(self, *attrs):
+        for attr in attrs:
+            spec = self.get(attr)
+            if spec.is_input:
+                del self.inputs[attr]
+            else:
+                del self.outputs[attr]
+            for input_spec in self.inputs.values():
+                if attr in input_spec.affects:
+                    input_spec.affects.remove(attr)
+
+    def set_value(self, attr, value):
+        self.get(attr).value = value
+
+    def set_data_type(self, attr, data_type):
+        self.get(attr).data_type = data_type
+
+    def set_required(self, *attrs):
+        for attr in attrs:
+            self.get(attr).required = True
+
+    def affects(self, input_attr, output_attr):
+        self.get(input_attr).affects.append(output_attr)
+
+    def resolve(self):
+        """Resolve datatypes and defaults.
+
+        :return: Schema to create node sockets from
+        :rtype: SocketSchema
+        """
+        template = SocketSchema()
+        for attr, spec in self.inputs.items():
+            template.inputs[attr] = spec.resolved()
+        for attr, spec in self.outputs.items():
+            template.outputs[attr] = spec.resolved()
+        for spec in template.inputs.values():
+            missing = [attr for attr in spec.affects if attr not in template.outputs]
+            if missing:
+                raise SchemaError('{0} affects undeclared outputs: {1}'.format(spec.attr, missing))
+        return template
@@ -14,12 +14,14 @@ import luna_builder.menus as menus
 import luna_builder.editor.node_editor as node_editor
 import luna_builder.editor.node_nodes_palette as node_nodes_palette
 import luna_builder.editor.node_scene_vars as node_scene_vars
+import luna_builder.editor.graph_profiler as graph_profiler
 
 imp.reload(node_scene_vars)
 imp.reload(node_editor)
 imp.reload(attributes_editor)
 imp.reload(workspace_widget)
 imp.reload(node_nodes_palette)
+imp.reload(graph_profiler)
 
 
 class BuilderMainWindow(QtWidgets.QMainWindow):
@@ -112,6 +114,7 @@ class BuilderMainWindow(QtWidgets.QMainWindow):
         # Nodes palette, vars widget
         self.nodes_palette = node_nodes_palette.NodesPalette()
         self.vars_widget = node_scene_vars.SceneVarsWidget(self)
+        self.profiler_widget = graph_profiler.ProfilerWidget(self)
 
         # Mdis
         self.mdi_area = QtWidgets.QMdiArea()
@@ -142,11 +145,17 @@ class BuilderMainWindow(QtWidgets.QMainWindow):
         self.vars_dock = QtWidgets.QDockWidget('Variables')
         self.vars_dock.setWidget(self.vars_widget)
         self.vars_dock.setAllowedAreas(QtCore.Qt.LeftDockWidgetArea)
+        # Profiler
+        self.profiler_dock = QtWidgets.QDockWidget('Profiler')
+        self.profiler_dock.setWidget(self.profiler_widget)
+        self.profiler_dock.setAllowedAreas(QtCore.Qt.RightDockWidgetArea | QtCore.Qt.BottomDockWidgetArea)
 
         # Add docks right
         self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.workspace_dock)
         self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.attrib_editor_dock)
+        self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.profiler_dock)
         self.tabifyDockWidget(self.workspace_dock, self.attrib_editor_dock)
+        self.tabifyDockWidget(self.attrib_editor_dock, self.profiler_dock)
         self.workspace_dock.raise_()
         # Add docks left
         self.addDockWidget(QtCore.Qt.LeftDockWidgetArea, self.nodes_palette_dock)
@@ -165,6 +174,7 @@ class BuilderMainWindow(QtWidgets.QMainWindow):
         self.update_button.clicked.connect(self.nodes_palette.update_node_tree)
         self.mdi_area.subWindowActivated.connect(self.update_title)
         self.mdi_area.subWindowActivated.connect(self.vars_widget.update_var_list)
+        self.mdi_area.subWindowActivated.connect(self.profiler_widget.update_profiler)
         self.vars_widget.var_list.itemClicked.connect(self.attrib_editor.update_current_var_widget)
 
     @property
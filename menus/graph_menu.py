@@ -24,6 +24,11 @@ class GraphMenu(QtWidgets.QMenu):
             return None
         return editor.scene.executor
 
+    @property
+    def can_execute(self):
+        """Partially loaded build shouldn't be executed."""
+        return self.executor is not None and not self.node_scene.is_loading
+
     @property
     def node_scene(self):
         editor = self.main_window.current_editor
@@ -57,9 +62,14 @@ class GraphMenu(QtWidgets.QMenu):
         self.reset_stepped_execution = QtWidgets.QAction("&Reset stepped execution", self)
         self.execute_step_action = QtWidgets.QAction("&Execute Step", self)
         self.execute_action = QtWidgets.QAction(pysideFn.get_QIcon('execute.png'), "&Execute", self)
+        self.execute_incremental_action = QtWidgets.QAction("Execute &Incremental", self)
+        self.use_checkpoints_action = QtWidgets.QAction("Use checkpoints", self)
+        self.clear_checkpoints_action = QtWidgets.QAction("Clear checkpoints", self)
+        self.use_checkpoints_action.setCheckable(True)
 
         self.execute_step_action.setShortcut(QtGui.QKeySequence(QtCore.Qt.Key_F6))
         self.execute_action.setShortcut(QtGui.QKeySequence(QtCore.Qt.Key_F5))
+        self.execute_incremental_action.setShortcut(QtGui.QKeySequence(QtCore.Qt.SHIFT + QtCore.Qt.Key_F5))
 
     def create_connections(self):
         self.main_window.mdi_area.subWindowActivated.connect(self.update_actions_state)
@@ -74,6 +84,9 @@ class GraphMenu(QtWidgets.QMenu):
         self.reset_stepped_execution.triggered.connect(self.on_reset_stepped_execution)
         self.execute_step_action.triggered.connect(self.on_execute_step)
         self.execute_action.triggered.connect(self.on_execute)
+        self.execute_incremental_action.triggered.connect(self.on_execute_incremental)
+        self.use_checkpoints_action.toggled.connect(self.on_use_checkpoints_toggled)
+        self.clear_checkpoints_action.triggered.connect(self.on_clear_checkpoints)
 
     def create_sub_menus(self):
         self.scene_edge_type_menu = QtWidgets.QMenu("Edge style")
@@ -88,7 +101,11 @@ class GraphMenu(QtWidgets.QMenu):
         self.addAction(self.reset_stepped_execution)
         self.addAction(self.execute_step_action)
         self.addSeparator()
+        self.addAction(self.use_checkpoints_action)
+        self.addAction(self.clear_checkpoints_action)
+        self.addSeparator()
         self.addAction(self.execute_action)
+        self.addAction(self.execute_incremental_action)
 
     def update_actions_state(self):
         is_scene_set = self.node_scene is not None
@@ -96,6 +113,11 @@ class GraphMenu(QtWidgets.QMenu):
         self.reset_stepped_execution.setEnabled(is_scene_set)
         self.execute_step_action.setEnabled(is_scene_set)
         self.execute_action.setEnabled(is_scene_set)
+        self.execute_incremental_action.setEnabled(is_scene_set)
+        self.use_checkpoints_action.setEnabled(is_scene_set)
+        self.clear_checkpoints_action.setEnabled(is_scene_set)
+        if is_scene_set:
+            self.use_checkpoints_action.setChecked(self.executor.use_checkpoints)
 
     def update_edge_type_menu(self):
         if not self.main_window.current_editor:
@@ -130,11 +152,23 @@ class GraphMenu(QtWidgets.QMenu):
         self.node_scene.edge_type = node_edge.Edge.Type.SQUARE
 
     def on_execute(self):
-        if self.executor is not None:
+        if self.can_execute:
             self.executor.execute_graph()
 
-    def on_execute_step(self):
+    def on_execute_incremental(self):
+        if self.can_execute:
+            self.executor.execute_incremental()
+
+    def on_use_checkpoints_toggled(self, state):
+        if self.executor is not None:
+            self.executor.use_checkpoints = state
+
+    def on_clear_checkpoints(self):
         if self.executor is not None:
+            self.executor.checkpoints.clear()
+
+    def on_execute_step(self):
+        if self.can_execute:
             self.executor.execute_step()
 
     def on_reset_stepped_execution(self):
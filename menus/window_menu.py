@@ -36,6 +36,7 @@ class WindowMenu(QtWidgets.QMenu):
         self.addAction(self.main_window.vars_dock.toggleViewAction())
         self.addAction(self.main_window.workspace_dock.toggleViewAction())
         self.addAction(self.main_window.attrib_editor_dock.toggleViewAction())
+        self.addAction(self.main_window.profiler_dock.toggleViewAction())
 
         self.addSeparator()
         self.addAction(self.close_current_action)
@@ -14,30 +14,27 @@ class ComponentNode(luna_node.LunaNode):
         super(ComponentNode, self).__init__(scene, title=title)
         self.component_instance = None
 
-    def init_sockets(self, reset=True):
-        super(ComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(ComponentNode, cls).define_sockets(schema)
         # Inputs
-        self.in_meta_parent = self.add_input(editor_conf.DataType.COMPONENT, label='Parent', value=None)
-        self.in_side = self.add_input(editor_conf.DataType.STRING, label='Side', value='c')
-        self.in_name = self.add_input(editor_conf.DataType.STRING, label='Name', value='component')
-        self.in_tag = self.add_input(editor_conf.DataType.STRING, label='Tag', value='')
-
-        self.mark_input_as_required(self.in_name)
-        self.mark_input_as_required(self.in_side)
+        schema.add_input('in_meta_parent', editor_conf.DataType.COMPONENT, label='Parent')
+        schema.add_input('in_side', editor_conf.DataType.STRING, label='Side', value='c', required=True)
+        schema.add_input('in_name', editor_conf.DataType.STRING, label='Name', value='component', required=True)
+        schema.add_input('in_tag', editor_conf.DataType.STRING, label='Tag', value='')
 
         # Outputs
-        # Inputs
-        self.out_self = self.add_output(editor_conf.DataType.COMPONENT, label='Self', value=None)
-        self.out_meta_parent = self.add_output(editor_conf.DataType.COMPONENT, label='Parent', value=None)
-        self.out_meta_children = self.add_output(editor_conf.DataType.LIST, label='Children')
-        self.out_side = self.add_output(editor_conf.DataType.STRING, label='Side', value='c')
-        self.out_name = self.add_output(editor_conf.DataType.STRING, label='Name', value='component')
-        self.out_tag = self.add_output(editor_conf.DataType.STRING, label='Tag', value='')
+        schema.add_output('out_self', editor_conf.DataType.COMPONENT, label='Self')
+        schema.add_output('out_meta_parent', editor_conf.DataType.COMPONENT, label='Parent')
+        schema.add_output('out_meta_children', editor_conf.DataType.LIST, label='Children')
+        schema.add_output('out_side', editor_conf.DataType.STRING, label='Side', value='c')
+        schema.add_output('out_name', editor_conf.DataType.STRING, label='Name', value='component')
+        schema.add_output('out_tag', editor_conf.DataType.STRING, label='Tag', value='')
 
-        self.in_meta_parent.affects(self.out_meta_parent)
-        self.in_side.affects(self.out_side)
-        self.in_name.affects(self.out_name)
-        self.in_tag.affects(self.in_tag)
+        schema.affects('in_meta_parent', 'out_meta_parent')
+        schema.affects('in_side', 'out_side')
+        schema.affects('in_name', 'out_name')
+        schema.affects('in_tag', 'out_tag')
 
 
 class AnimComponentNode(ComponentNode):
@@ -45,28 +42,26 @@ class AnimComponentNode(ComponentNode):
     DEFAULT_TITLE = 'Anim Component'
     COMPONENT_CLASS = luna_rig.AnimComponent
 
-    def init_sockets(self, reset=True):
-        super(AnimComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(AnimComponentNode, cls).define_sockets(schema)
         # Override types
-        self.out_self.data_type = editor_conf.DataType.ANIM_COMPONENT
-        self.in_meta_parent.data_type = self.out_meta_parent.data_type = editor_conf.DataType.ANIM_COMPONENT
-        self.in_name.set_value('anim_component')
+        schema.set_data_type('out_self', editor_conf.DataType.ANIM_COMPONENT)
+        schema.set_data_type('in_meta_parent', editor_conf.DataType.ANIM_COMPONENT)
+        schema.set_data_type('out_meta_parent', editor_conf.DataType.ANIM_COMPONENT)
+        schema.set_value('in_name', 'anim_component')
 
         # Inputs
-        self.in_character = self.add_input(editor_conf.DataType.CHARACTER, label='Character')
-        self.in_hook = self.add_input(editor_conf.DataType.NUMERIC, label='In Hook')
-        self.mark_input_as_required(self.in_character)
+        schema.add_input('in_character', editor_conf.DataType.CHARACTER, label='Character', required=True)
+        schema.add_input('in_hook', editor_conf.DataType.NUMERIC, label='In Hook', value=None)
 
         # Outputs
-        self.out_character = self.add_output(editor_conf.DataType.CHARACTER, label='Character')
-        self.out_in_hook = self.add_output(editor_conf.DataType.NUMERIC, label='In Hook')
+        schema.add_output('out_character', editor_conf.DataType.CHARACTER, label='Character')
+        schema.add_output('out_in_hook', editor_conf.DataType.NUMERIC, label='In Hook')
 
         # Affects
-        self.in_character.affects(self.out_character)
-        self.in_hook.affects(self.out_in_hook)
-
-        # Set default
-        self.in_hook.set_value(None)
+        schema.affects('in_character', 'out_character')
+        schema.affects('in_hook', 'out_in_hook')
 
 
 class GetComponentAsNode(luna_node.LunaNode):
@@ -3,20 +3,31 @@ from PySide2 import QtCore
 from PySide2 import QtGui
 import luna.static.directories as directories
 import luna_builder.editor.node_node as node_node
+import luna_builder.editor.graphics_lod as graphics_lod
 import luna_builder.editor.graphics_node as graphics_node
 
 
 class LunaGraphicsNode(graphics_node.QLGraphicsNode):
 
-    ICON_DRAW_ZOOM_LIMIT = 2
+    # Coarsest level of detail status icon is drawn at
+    ICON_LOD = graphics_lod.FULL
+    STATUS_ICON_RECT = QtCore.QRectF(-13.0, -13.0, 24.0, 24.0)
+    _status_icons = None  # type: QtGui.QImage
+
+    @classmethod
+    def get_status_icons(cls):
+        """Status icons atlas shared by all luna nodes."""
+        if LunaGraphicsNode._status_icons is None:
+            LunaGraphicsNode._status_icons = QtGui.QImage(directories.get_icon_path('status_icons.png'))
+        return LunaGraphicsNode._status_icons
 
     def init_assets(self):
         super(LunaGraphicsNode, self).init_assets()
-        self.status_icons = QtGui.QImage(directories.get_icon_path('status_icons.png'))
+        self.status_icons = self.get_status_icons()
 
     def paint(self, painter, option, widget=None):
         super(LunaGraphicsNode, self).paint(painter, option, widget=widget)
-        if self.node.scene.view.zoom < self.ICON_DRAW_ZOOM_LIMIT:
+        if self.lod > self.ICON_LOD:
             return
 
         if self.node.is_invalid():
@@ -29,9 +40,12 @@ class LunaGraphicsNode(graphics_node.QLGraphicsNode):
                 icon_offset = 0.0
             self.paint_status_icon(painter, icon_offset)
 
+    def boundingRect(self):
+        return super(LunaGraphicsNode, self).boundingRect().united(self.STATUS_ICON_RECT)
+
     def paint_status_icon(self, painter, offset):
         painter.drawImage(
-            QtCore.QRectF(-13.0, -13.0, 24.0, 24.0),
+            self.STATUS_ICON_RECT,
             self.status_icons,
             QtCore.QRectF(offset, 0, 24.0, 24.0)
         )
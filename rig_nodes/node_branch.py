@@ -6,18 +6,23 @@ class BranchNode(luna_node.LunaNode):
     ID = 1
     IS_EXEC = True
     AUTO_INIT_EXECS = False
+    BRANCHING = True
     ICON = 'branch.png'
     DEFAULT_TITLE = 'Branch'
     CATEGORY = 'Utils'
 
+    @classmethod
+    def define_sockets(cls, schema):
+        super(BranchNode, cls).define_sockets(schema)
+        schema.add_input('exec_in_socket', editor_conf.DataType.EXEC)
+        schema.add_input('in_condition', editor_conf.DataType.BOOLEAN)
+
+        schema.add_output('exec_out_socket', editor_conf.DataType.EXEC, label='True')
+        schema.add_output('out_false', editor_conf.DataType.EXEC, label='False')
+
     def init_sockets(self, reset=True):
         super(BranchNode, self).init_sockets(reset=reset)
-        self.exec_in_socket = self.add_input(editor_conf.DataType.EXEC)
-        self.in_condition = self.add_input(editor_conf.DataType.BOOLEAN)
-
-        self.exec_out_socket = self.add_output(editor_conf.DataType.EXEC, label='True')
         self.out_true = self.exec_out_socket
-        self.out_false = self.add_output(editor_conf.DataType.EXEC, label='False')
         self.update_title()
 
     def create_connections(self):
@@ -27,6 +32,9 @@ class BranchNode(luna_node.LunaNode):
     def update_title(self):
         self.title = '{0}: {1}'.format(self.DEFAULT_TITLE, self.in_condition.value())
 
+    def list_all_exec_outputs(self):
+        return [self.out_true, self.out_false]
+
     def list_exec_outputs(self):
         if self.in_condition.value():
             return [self.out_true]
@@ -14,16 +14,17 @@ class CharacterNode(base_component.ComponentNode):
     UNIQUE = True
     COMPONENT_CLASS = luna_rig.components.Character
 
-    def init_sockets(self, reset=True):
-        super(CharacterNode, self).init_sockets(reset=reset)
-        self.out_self.data_type = editor_conf.DataType.CHARACTER
-        self.in_name.set_value('character')
-        self.in_tag.set_value('character')
+    @classmethod
+    def define_sockets(cls, schema):
+        super(CharacterNode, cls).define_sockets(schema)
+        schema.set_data_type('out_self', editor_conf.DataType.CHARACTER)
+        schema.set_value('in_name', 'character')
+        schema.set_value('in_tag', 'character')
 
-        self.out_root_control = self.add_output(editor_conf.DataType.CONTROL, label='Root Control')
-        self.out_deform_rig = self.add_output(editor_conf.DataType.STRING, label='Deformation Rig')
-        self.out_control_rig = self.add_output(editor_conf.DataType.STRING, label='Control Rig')
-        self.out_geometry_grp = self.add_output(editor_conf.DataType.STRING, label='Geometry Group')
+        schema.add_output('out_root_control', editor_conf.DataType.CONTROL, label='Root Control')
+        schema.add_output('out_deform_rig', editor_conf.DataType.STRING, label='Deformation Rig')
+        schema.add_output('out_control_rig', editor_conf.DataType.STRING, label='Control Rig')
+        schema.add_output('out_geometry_grp', editor_conf.DataType.STRING, label='Geometry Group')
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(self.in_meta_parent.value(), name=self.in_name.value(), tag=self.in_tag.value())
@@ -13,34 +13,33 @@ class ControlNode(luna_node.LunaNode):
     CATEGORY = 'Utils'
     UNIQUE = False
 
-    def init_sockets(self, reset=True):
-        super(ControlNode, self).init_sockets(reset=reset)
-
-        self.in_name = self.add_input(editor_conf.DataType.STRING, label='Name', value='control')
-        self.in_side = self.add_input(editor_conf.DataType.STRING, label='Side', value='c')
-        self.in_guide = self.add_input(editor_conf.DataType.STRING, label='Guide')
-        self.in_delete_guide = self.add_input(editor_conf.DataType.BOOLEAN, label='Delete Guide', value=False)
-        self.in_parent = self.add_input(editor_conf.DataType.STRING, label='Parent')
-        self.in_attribs = self.add_input(editor_conf.DataType.STRING, label='Attributes', value='tr')
-        self.in_match_pos = self.add_input(editor_conf.DataType.BOOLEAN, label='Match Position', value=True)
-        self.in_match_orient = self.add_input(editor_conf.DataType.BOOLEAN, label='Match Orient', value=True)
-        self.in_match_pivot = self.add_input(editor_conf.DataType.BOOLEAN, label='Match Pivot', value=True)
-        self.in_color_index = self.add_input(editor_conf.DataType.NUMERIC, label='Color', value=0)
-        self.in_offset_grp = self.add_input(editor_conf.DataType.BOOLEAN, label='Offset Group', value=True)
-        self.in_joint = self.add_input(editor_conf.DataType.BOOLEAN, label='Joint', value=True)
-        self.in_shape = self.add_input(editor_conf.DataType.STRING, label='Shape', value='cube')
-        self.in_tag = self.add_input(editor_conf.DataType.STRING, label='Tag', value='')
-        self.in_component = self.add_input(editor_conf.DataType.ANIM_COMPONENT, label='Component', value=None)
-        self.in_orient_axis = self.add_input(editor_conf.DataType.STRING, label='Orient Axis', value='x')
-        self.in_scale = self.add_input(editor_conf.DataType.NUMERIC, label='Scale', value=1.0)
-
-        self.out_control = self.add_output(editor_conf.DataType.CONTROL, label='Control')
-        self.out_transform = self.add_output(editor_conf.DataType.STRING, label='Transform', value='')
+    @classmethod
+    def define_sockets(cls, schema):
+        super(ControlNode, cls).define_sockets(schema)
+
+        schema.add_input('in_name', editor_conf.DataType.STRING, label='Name', value='control')
+        schema.add_input('in_side', editor_conf.DataType.STRING, label='Side', value='c')
+        schema.add_input('in_guide', editor_conf.DataType.STRING, label='Guide')
+        schema.add_input('in_delete_guide', editor_conf.DataType.BOOLEAN, label='Delete Guide', value=False)
+        schema.add_input('in_parent', editor_conf.DataType.STRING, label='Parent')
+        schema.add_input('in_attribs', editor_conf.DataType.STRING, label='Attributes', value='tr')
+        schema.add_input('in_match_pos', editor_conf.DataType.BOOLEAN, label='Match Position', value=True)
+        schema.add_input('in_match_orient', editor_conf.DataType.BOOLEAN, label='Match Orient', value=True)
+        schema.add_input('in_match_pivot', editor_conf.DataType.BOOLEAN, label='Match Pivot', value=True)
+        schema.add_input('in_color_index', editor_conf.DataType.NUMERIC, label='Color', value=0)
+        schema.add_input('in_offset_grp', editor_conf.DataType.BOOLEAN, label='Offset Group', value=True)
+        schema.add_input('in_joint', editor_conf.DataType.BOOLEAN, label='Joint', value=True)
+        schema.add_input('in_shape', editor_conf.DataType.STRING, label='Shape', value='cube')
+        schema.add_input('in_tag', editor_conf.DataType.STRING, label='Tag', value='')
+        schema.add_input('in_component', editor_conf.DataType.ANIM_COMPONENT, label='Component')
+        schema.add_input('in_orient_axis', editor_conf.DataType.STRING, label='Orient Axis', value='x')
+        schema.add_input('in_scale', editor_conf.DataType.NUMERIC, label='Scale', value=1.0)
+
+        schema.add_output('out_control', editor_conf.DataType.CONTROL, label='Control')
+        schema.add_output('out_transform', editor_conf.DataType.STRING, label='Transform', value='')
 
         # Mark required
-        self.mark_inputs_required([self.in_name,
-                                   self.in_side,
-                                   self.in_orient_axis])
+        schema.set_required('in_name', 'in_side', 'in_orient_axis')
 
     def execute(self):
         attribs = self.in_attribs.value()
@@ -13,17 +13,18 @@ class SDKCorrectiveComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.CorrectiveComponent
 
-    def init_sockets(self, reset=True):
-        super(SDKCorrectiveComponentNode, self).init_sockets(reset=reset)
-        self.remove_socket('In Hook')
-        self.remove_socket('In Hook', is_input=False)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(SDKCorrectiveComponentNode, cls).define_sockets(schema)
+        schema.remove('in_hook')
+        schema.remove('out_in_hook')
 
         # Override inputs
-        self.in_name.set_value('sdk_corrective')
-        self.in_tag.set_value('corrective')
+        schema.set_value('in_name', 'sdk_corrective')
+        schema.set_value('in_tag', 'corrective')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.SDK_CORRECTIVE_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.SDK_CORRECTIVE_COMPONENT)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(meta_parent=self.in_meta_parent.value(),
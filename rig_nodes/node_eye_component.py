@@ -12,20 +12,21 @@ class EyeComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.EyeComponent
 
-    def init_sockets(self, reset=True):
-        super(EyeComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(EyeComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('eye')
+        schema.set_value('in_name', 'eye')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.EYE_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.EYE_COMPONENT)
 
         # Create new inputs
-        self.in_aim_locator = self.add_input(editor_conf.DataType.STRING, label='Aim Locator')
-        self.in_eye_joint = self.add_input(editor_conf.DataType.STRING, label='Eye Joint')
-        self.in_aim_vector = self.add_input(editor_conf.DataType.STRING, label='Aim Vector', value='z')
-        self.in_up_vector = self.add_input(editor_conf.DataType.STRING, label='Up Vector', value='y')
-        self.in_target_wire = self.add_input(editor_conf.DataType.BOOLEAN, label='Target Lines', value=False)
+        schema.add_input('in_aim_locator', editor_conf.DataType.STRING, label='Aim Locator')
+        schema.add_input('in_eye_joint', editor_conf.DataType.STRING, label='Eye Joint')
+        schema.add_input('in_aim_vector', editor_conf.DataType.STRING, label='Aim Vector', value='z')
+        schema.add_input('in_up_vector', editor_conf.DataType.STRING, label='Up Vector', value='y')
+        schema.add_input('in_target_wire', editor_conf.DataType.BOOLEAN, label='Target Lines', value=False)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(self.in_aim_locator.value(),
@@ -13,19 +13,20 @@ class FKComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.FKComponent
 
-    def init_sockets(self, reset=True):
-        super(FKComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(FKComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('fk_component')
+        schema.set_value('in_name', 'fk_component')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.FK_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.FK_COMPONENT)
 
         # Create new inputs
-        self.in_start_joint = self.add_input(editor_conf.DataType.STRING, label='Start Joint', value=None)
-        self.in_end_joint = self.add_input(editor_conf.DataType.STRING, label='End Joint', value=None)
-        self.in_lock_translate = self.add_input(editor_conf.DataType.BOOLEAN, label='Lock Translation', value=True)
-        self.in_add_end_ctl = self.add_input(editor_conf.DataType.BOOLEAN, label='End Control', value=True)
+        schema.add_input('in_start_joint', editor_conf.DataType.STRING, label='Start Joint')
+        schema.add_input('in_end_joint', editor_conf.DataType.STRING, label='End Joint')
+        schema.add_input('in_lock_translate', editor_conf.DataType.BOOLEAN, label='Lock Translation', value=True)
+        schema.add_input('in_add_end_ctl', editor_conf.DataType.BOOLEAN, label='End Control', value=True)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(meta_parent=self.in_meta_parent.value(),
@@ -50,20 +51,21 @@ class HeadComponentNode(FKComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.HeadComponent
 
-    def init_sockets(self, reset=True):
-        super(HeadComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(HeadComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('head')
+        schema.set_value('in_name', 'head')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.HEAD_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.HEAD_COMPONENT)
 
         # Create new inputs
-        self.remove_socket('End Control', is_input=True)
-        self.in_head_joint_index = self.add_input(editor_conf.DataType.NUMERIC, label='Head Index', value=-2)
+        schema.remove('in_add_end_ctl')
+        schema.add_input('in_head_joint_index', editor_conf.DataType.NUMERIC, label='Head Index', value=-2)
         # Create new outputs
-        self.out_head_hook = self.add_output(editor_conf.DataType.NUMERIC, label='Hook Head', value=self.COMPONENT_CLASS.Hooks.HEAD)
-        self.out_base_hook = self.add_output(editor_conf.DataType.NUMERIC, label='Hook Base', value=self.COMPONENT_CLASS.Hooks.NECK_BASE)
+        schema.add_output('out_head_hook', editor_conf.DataType.NUMERIC, label='Hook Head', value=cls.COMPONENT_CLASS.Hooks.HEAD)
+        schema.add_output('out_base_hook', editor_conf.DataType.NUMERIC, label='Hook Base', value=cls.COMPONENT_CLASS.Hooks.NECK_BASE)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(meta_parent=self.in_meta_parent.value(),
@@ -12,28 +12,29 @@ class FKDynamicsComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.FKDynamicsComponent
 
-    def init_sockets(self, reset=True):
-        super(FKDynamicsComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(FKDynamicsComponentNode, cls).define_sockets(schema)
 
         # Remove unused sockets
-        self.remove_socket('Side')
-        self.remove_socket('In Hook')
-        self.remove_socket('Side', is_input=False)
-        self.remove_socket('In Hook', is_input=False)
+        schema.remove('in_side')
+        schema.remove('in_hook')
+        schema.remove('out_side')
+        schema.remove('out_in_hook')
 
         # Override inputs
-        self.in_meta_parent.data_type = 'FK_COMPONENT'
-        self.in_name.set_value('fk_dynamics')
+        schema.set_data_type('in_meta_parent', 'FK_COMPONENT')
+        schema.set_value('in_name', 'fk_dynamics')
 
         # Override Outputs
-        self.out_meta_parent.data_type = 'FK_COMPONENT'
-        self.out_self.data_type = editor_conf.DataType.FK_DYNAMICS_COMPONENT
+        schema.set_data_type('out_meta_parent', 'FK_COMPONENT')
+        schema.set_data_type('out_self', editor_conf.DataType.FK_DYNAMICS_COMPONENT)
 
         # Create new inputs
-        self.in_unique_solver = self.add_input(editor_conf.DataType.BOOLEAN, label='Unique Nucleus', value=False)
+        schema.add_input('in_unique_solver', editor_conf.DataType.BOOLEAN, label='Unique Nucleus', value=False)
 
         # Mark required
-        self.mark_input_as_required(self.in_meta_parent)
+        schema.set_required('in_meta_parent')
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(meta_parent=self.in_meta_parent.value(),
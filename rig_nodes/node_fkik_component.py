@@ -13,19 +13,20 @@ class FKIKComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.FKIKComponent
 
-    def init_sockets(self, reset=True):
-        super(FKIKComponentNode, self).init_sockets(reset=reset)
-        self.out_self.data_type = editor_conf.DataType.FKIK_COMPONENT
+    @classmethod
+    def define_sockets(cls, schema):
+        super(FKIKComponentNode, cls).define_sockets(schema)
+        schema.set_data_type('out_self', editor_conf.DataType.FKIK_COMPONENT)
 
-        self.in_name.set_value('fkik_component')
-        self.in_start_joint = self.add_input(editor_conf.DataType.STRING, label='Start Joint', value=None)
-        self.in_end_joint = self.add_input(editor_conf.DataType.STRING, label='End Joint', value=None)
-        self.in_ik_world_orient = self.add_input(editor_conf.DataType.BOOLEAN, label='IK World Orient', value=False)
-        self.in_default_state = self.add_input(editor_conf.DataType.BOOLEAN, label='Default to IK', value=True)
-        self.in_param_locator = self.add_input(editor_conf.DataType.STRING, 'Param Locator')
+        schema.set_value('in_name', 'fkik_component')
+        schema.add_input('in_start_joint', editor_conf.DataType.STRING, label='Start Joint')
+        schema.add_input('in_end_joint', editor_conf.DataType.STRING, label='End Joint')
+        schema.add_input('in_ik_world_orient', editor_conf.DataType.BOOLEAN, label='IK World Orient', value=False)
+        schema.add_input('in_default_state', editor_conf.DataType.BOOLEAN, label='Default to IK', value=True)
+        schema.add_input('in_param_locator', editor_conf.DataType.STRING, label='Param Locator')
 
-        self.out_hook_start_jnt = self.add_output(editor_conf.DataType.NUMERIC, label='Hook Start', value=self.COMPONENT_CLASS.Hooks.START_JNT.value)
-        self.out_hook_end_jnt = self.add_output(editor_conf.DataType.NUMERIC, label='Hook End', value=self.COMPONENT_CLASS.Hooks.END_JNT.value)
+        schema.add_output('out_hook_start_jnt', editor_conf.DataType.NUMERIC, label='Hook Start', value=cls.COMPONENT_CLASS.Hooks.START_JNT.value)
+        schema.add_output('out_hook_end_jnt', editor_conf.DataType.NUMERIC, label='Hook End', value=cls.COMPONENT_CLASS.Hooks.END_JNT.value)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(meta_parent=self.in_meta_parent.value(),
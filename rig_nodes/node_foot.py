@@ -13,30 +13,26 @@ class FootComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.FootComponent
 
-    def init_sockets(self, reset=True):
-        super(FootComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(FootComponentNode, cls).define_sockets(schema)
 
         # Override inputs
-        self.in_name.set_value('foot')
-        self.in_tag.set_value('body')
+        schema.set_value('in_name', 'foot')
+        schema.set_value('in_tag', 'body')
         # Override outputs
-        self.in_meta_parent.data_type = 'FKIK_COMPONENT'
-        self.out_self.data_type = editor_conf.DataType.FOOT_COMPONENT
+        schema.set_data_type('in_meta_parent', 'FKIK_COMPONENT')
+        schema.set_data_type('out_self', editor_conf.DataType.FOOT_COMPONENT)
 
         # Create new inputs
-        self.in_start_joint = self.add_input(editor_conf.DataType.STRING, label='Start Joint', value=None)
-        self.in_end_joint = self.add_input(editor_conf.DataType.STRING, label='End Joint', value=None)
-        self.in_rv_chain = self.add_input(editor_conf.DataType.STRING, label='Reverse Chain', value=None)
-        self.in_foot_loc_grp = self.add_input(editor_conf.DataType.STRING, label='Foot Locators', value=None)
-        self.in_roll_axis = self.add_input(editor_conf.DataType.STRING, label='Rotate Axis', value='ry')
+        schema.add_input('in_start_joint', editor_conf.DataType.STRING, label='Start Joint')
+        schema.add_input('in_end_joint', editor_conf.DataType.STRING, label='End Joint')
+        schema.add_input('in_rv_chain', editor_conf.DataType.STRING, label='Reverse Chain')
+        schema.add_input('in_foot_loc_grp', editor_conf.DataType.STRING, label='Foot Locators')
+        schema.add_input('in_roll_axis', editor_conf.DataType.STRING, label='Rotate Axis', value='ry')
 
         # Mark required
-        self.mark_inputs_required((self.in_meta_parent,
-                                   self.in_start_joint,
-                                   self.in_end_joint,
-                                   self.in_rv_chain,
-                                   self.in_foot_loc_grp,
-                                   self.in_roll_axis))
+        schema.set_required('in_meta_parent', 'in_start_joint', 'in_end_joint', 'in_rv_chain', 'in_foot_loc_grp', 'in_roll_axis')
 
     def execute(self):
         super(FootComponentNode, self).execute()
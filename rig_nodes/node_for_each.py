@@ -1,4 +1,3 @@
-from collections import deque
 import luna_builder.rig_nodes.luna_node as luna_node
 import luna_builder.editor.editor_conf as editor_conf
 
@@ -11,21 +10,27 @@ class ForEachNode(luna_node.LunaNode):
     CATEGORY = 'Collections'
     COLLECTION_DATATYPE = None
 
-    def init_sockets(self, reset=True):
-        super(ForEachNode, self).init_sockets(reset=reset)
-        self.in_collection = self.add_input(editor_conf.DataType.LIST, label='List')
-        self.out_loop_body = self.add_output(editor_conf.DataType.EXEC, label='Loop body', max_connections=1)
-        self.out_item = self.add_output(self.COLLECTION_DATATYPE, label='Item')
-        self.mark_input_as_required(self.in_collection)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(ForEachNode, cls).define_sockets(schema)
+        schema.add_input('in_collection', editor_conf.DataType.LIST, label='List')
+        schema.add_output('out_loop_body', editor_conf.DataType.EXEC, label='Loop body', max_connections=1)
+        schema.add_output('out_item', cls.COLLECTION_DATATYPE, label='Item')
+        schema.set_required('in_collection')
 
     def list_exec_outputs(self):
         return [self.exec_out_socket]
 
+    def list_loop_outputs(self):
+        return [self.out_loop_body]
+
     def get_loop_body(self):
-        loop_body = deque()
-        if self.out_loop_body.list_connections():
-            loop_body.extend(self.out_loop_body.list_connections()[0].node.get_exec_queue())
-        return loop_body
+        return self.scene.exec_plan.get_loop_body(self)
+
+    def is_dirty(self):
+        if super(ForEachNode, self).is_dirty():
+            return True
+        return any([node.is_dirty() for node in self.get_loop_body()])
 
     def verify(self):
         result = super(ForEachNode, self).verify()
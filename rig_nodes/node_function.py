@@ -1,4 +1,5 @@
 import sys
+from collections import OrderedDict
 from luna import Logger
 import luna_builder.editor.editor_conf as editor_conf
 import luna_builder.rig_nodes.luna_node as luna_node
@@ -43,7 +44,8 @@ class FunctionNode(luna_node.LunaNode):
     @func_signature.setter
     def func_signature(self, value):
         self.set_signature_without_reinit(value)
-        self.init_sockets(reset=True)
+        with self.bulk_sockets():
+            self.init_sockets(reset=True)
 
     @property
     def func_ref(self):
@@ -53,6 +55,7 @@ class FunctionNode(luna_node.LunaNode):
     def set_signature_without_reinit(self, signature):
         self._func_signature = signature
         self._func_desc = editor_conf.get_function_from_signature(signature)
+        self.invalidate_serialized()
         if not self._func_signature:
             Logger.warning('{0}: Missing function signature!'.format(self))
 
@@ -61,10 +64,8 @@ class FunctionNode(luna_node.LunaNode):
         return self._func_desc
 
     def serialize(self):
-        try:
-            res = super(FunctionNode, self).serialize()
-        except TypeError:
-            pass
+        # Base record is cached, extend a copy
+        res = OrderedDict(super(FunctionNode, self).serialize())
         res['func_signature'] = self.func_signature
         return res
 
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from luna import Logger
 import luna_builder.rig_nodes.luna_node as luna_node
 import luna_builder.editor.editor_conf as editor_conf
@@ -20,6 +21,7 @@ class VarNode(luna_node.LunaNode):
 
     def set_var_name(self, name, init_sockets=False):
         self._var_name = name
+        self.invalidate_serialized()
         var_exists = name in self.scene.vars._vars.keys()
         self.set_invalid(not var_exists)
         if not var_exists:
@@ -28,7 +30,8 @@ class VarNode(luna_node.LunaNode):
 
         self.title = '{0} {1}'.format(self.DEFAULT_TITLE, self._var_name)
         if init_sockets:
-            self.init_sockets()
+            with self.bulk_sockets():
+                self.init_sockets()
 
     def get_var_value(self):
         try:
@@ -54,7 +57,8 @@ class VarNode(luna_node.LunaNode):
         return result
 
     def serialize(self):
-        result = super(VarNode, self).serialize()
+        # Base record is cached, extend a copy
+        result = OrderedDict(super(VarNode, self).serialize())
         result['var_name'] = self.var_name
         return result
 
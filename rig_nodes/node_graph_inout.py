@@ -1,4 +1,5 @@
 
+import os
 import pymel.core as pm
 import luna.workspace
 from luna import Logger
@@ -17,10 +18,11 @@ class GraphInputNode(luna_node.LunaNode):
     CATEGORY = 'Utils'
     UNIQUE = True
 
-    def init_sockets(self, reset=True):
-        self.exec_in_socket = None
-        self.exec_out_socket = self.add_output(editor_conf.DataType.EXEC)
-        self.out_asset_name = self.add_output(editor_conf.DataType.STRING, label='Asset Name', value='')
+    @classmethod
+    def define_sockets(cls, schema):
+        super(GraphInputNode, cls).define_sockets(schema)
+        schema.add_output('exec_out_socket', editor_conf.DataType.EXEC)
+        schema.add_output('out_asset_name', editor_conf.DataType.STRING, label='Asset Name', value='')
 
     def execute(self):
         if not luna.workspace.Asset.get():
@@ -32,6 +34,15 @@ class GraphInputNode(luna_node.LunaNode):
         asset_files.import_model()
         asset_files.import_skeleton()
 
+    def get_checkpoint_data(self):
+        asset = luna.workspace.Asset.get()
+        if not asset:
+            return None
+        files_data = []
+        for path in [asset.model_path, asset.latest_skeleton_path]:
+            files_data.append([path, os.path.getmtime(path) if path and os.path.isfile(path) else None])
+        return [asset.name, files_data]
+
 
 class GraphOutputNode(luna_node.LunaNode):
     ID = editor_conf.OUTPUT_NODE_ID
@@ -42,12 +53,12 @@ class GraphOutputNode(luna_node.LunaNode):
     CATEGORY = 'Utils'
     UNIQUE = True
 
-    def init_sockets(self, reset=True):
-        self.exec_in_socket = self.add_input(editor_conf.DataType.EXEC)
-        self.in_character = self.add_input(editor_conf.DataType.CHARACTER, label='Character')
-        self.mark_input_as_required(self.in_character)
-
-        self.exec_out_socket = None
+    @classmethod
+    def define_sockets(cls, schema):
+        super(GraphOutputNode, cls).define_sockets(schema)
+        schema.add_input('exec_in_socket', editor_conf.DataType.EXEC)
+        schema.add_input('in_character', editor_conf.DataType.CHARACTER, label='Character')
+        schema.set_required('in_character')
 
     def execute(self):
         try:
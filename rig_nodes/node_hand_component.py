@@ -13,13 +13,14 @@ class HandComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.HandComponent
 
-    def init_sockets(self, reset=True):
-        super(HandComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(HandComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('hand')
+        schema.set_value('in_name', 'hand')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.HAND_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.HAND_COMPONENT)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(meta_parent=self.in_meta_parent.value(),
@@ -12,18 +12,19 @@ class IKComponentNode(base_component.AnimComponentNode):
     CATEGORY = 'Components'
     COMPONENT_CLASS = luna_rig.components.IKComponent
 
-    def init_sockets(self, reset=True):
-        super(IKComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(IKComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('ik_component')
+        schema.set_value('in_name', 'ik_component')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.IK_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.IK_COMPONENT)
 
         # Create new inputs
-        self.in_start_joint = self.add_input(editor_conf.DataType.STRING, label='Start Joint')
-        self.in_end_joint = self.add_input(editor_conf.DataType.STRING, label='End Joint')
-        self.in_world_orient = self.add_input(editor_conf.DataType.BOOLEAN, label='World Orient', value=False)
+        schema.add_input('in_start_joint', editor_conf.DataType.STRING, label='Start Joint')
+        schema.add_input('in_end_joint', editor_conf.DataType.STRING, label='End Joint')
+        schema.add_input('in_world_orient', editor_conf.DataType.BOOLEAN, label='World Orient', value=False)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(character=self.in_character.value(),
@@ -46,19 +47,20 @@ class IKSplineComponentNode(base_component.AnimComponentNode):
     CATEGORY = 'Components'
     COMPONENT_CLASS = luna_rig.components.IKSplineComponent
 
-    def init_sockets(self, reset=True):
-        super(IKSplineComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(IKSplineComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('ik_spline')
+        schema.set_value('in_name', 'ik_spline')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.IK_SPLINE_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.IK_SPLINE_COMPONENT)
 
         # Create new inputs
-        self.in_start_joint = self.add_input(editor_conf.DataType.STRING, label='Start Joint')
-        self.in_end_joint = self.add_input(editor_conf.DataType.STRING, label='End Joint')
-        self.in_curve = self.add_input(editor_conf.DataType.STRING, label='Curve')
-        self.in_num_controls = self.add_input(editor_conf.DataType.NUMERIC, label='Num Controls', value=0)
+        schema.add_input('in_start_joint', editor_conf.DataType.STRING, label='Start Joint')
+        schema.add_input('in_end_joint', editor_conf.DataType.STRING, label='End Joint')
+        schema.add_input('in_curve', editor_conf.DataType.STRING, label='Curve')
+        schema.add_input('in_num_controls', editor_conf.DataType.NUMERIC, label='Num Controls', value=0)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(character=self.in_character.value(),
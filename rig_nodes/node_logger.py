@@ -11,12 +11,16 @@ class LoggerNode(luna_node.LunaNode):
     DEFAULT_TITLE = 'Log'
     CATEGORY = 'Utils'
 
+    @classmethod
+    def define_sockets(cls, schema):
+        super(LoggerNode, cls).define_sockets(schema)
+        schema.add_input('in_message', editor_conf.DataType.STRING, label='Message')
+        schema.add_input('in_info', editor_conf.DataType.BOOLEAN, label='As Info', value=True)
+        schema.add_input('in_warning', editor_conf.DataType.BOOLEAN, label='As Warning', value=False)
+        schema.add_input('in_error', editor_conf.DataType.BOOLEAN, label='As Error', value=False)
+
     def init_sockets(self, reset=True):
         super(LoggerNode, self).init_sockets(reset=reset)
-        self.in_message = self.add_input(editor_conf.DataType.STRING, 'Message')
-        self.in_info = self.add_input(editor_conf.DataType.BOOLEAN, 'As Info', value=True)
-        self.in_warning = self.add_input(editor_conf.DataType.BOOLEAN, 'As Warning', value=False)
-        self.in_error = self.add_input(editor_conf.DataType.BOOLEAN, 'As Error', value=False)
         self.update_title()
 
     def create_connections(self):
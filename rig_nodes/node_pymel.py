@@ -12,17 +12,15 @@ class ConnectAttribNode(luna_node.LunaNode):
     DEFAULT_TITLE = 'Connect Attributes'
     CATEGORY = 'Functions/Pymel'
 
-    def init_sockets(self, reset=True):
-        super(ConnectAttribNode, self).init_sockets(reset=reset)
-        self.in_source_node_name = self.add_input(editor_conf.DataType.STRING, label='Source Node')
-        self.in_source_attr_name = self.add_input(editor_conf.DataType.STRING, label='Source Attribute')
-        self.in_dest_node_name = self.add_input(editor_conf.DataType.STRING, label='Destination Node')
-        self.in_dest_attr_name = self.add_input(editor_conf.DataType.STRING, label='Destination Attribute')
-
-        self.mark_inputs_required((self.in_source_node_name,
-                                   self.in_source_attr_name,
-                                   self.in_dest_node_name,
-                                   self.in_dest_attr_name))
+    @classmethod
+    def define_sockets(cls, schema):
+        super(ConnectAttribNode, cls).define_sockets(schema)
+        schema.add_input('in_source_node_name', editor_conf.DataType.STRING, label='Source Node')
+        schema.add_input('in_source_attr_name', editor_conf.DataType.STRING, label='Source Attribute')
+        schema.add_input('in_dest_node_name', editor_conf.DataType.STRING, label='Destination Node')
+        schema.add_input('in_dest_attr_name', editor_conf.DataType.STRING, label='Destination Attribute')
+
+        schema.set_required('in_source_node_name', 'in_source_attr_name', 'in_dest_node_name', 'in_dest_attr_name')
 
     def execute(self):
         pm.connectAttr('{0}.{1}'.format(self.in_source_node_name.value(), self.in_source_attr_name.value()),
@@ -37,11 +35,12 @@ class AddToggleAttribNode(luna_node.LunaNode):
     DEFAULT_TITLE = 'Add Toggle Attribute'
     CATEGORY = 'Functions/Pymel'
 
-    def init_sockets(self, reset=True):
-        super(AddToggleAttribNode, self).init_sockets(reset=reset)
-        self.in_node_name = self.add_input(editor_conf.DataType.STRING, label='Node')
-        self.in_attr_name = self.add_input(editor_conf.DataType.STRING, label='Name', value='newAttr')
-        self.in_default_value = self.add_input(editor_conf.DataType.BOOLEAN, label='Value', value=False)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(AddToggleAttribNode, cls).define_sockets(schema)
+        schema.add_input('in_node_name', editor_conf.DataType.STRING, label='Node')
+        schema.add_input('in_attr_name', editor_conf.DataType.STRING, label='Name', value='newAttr')
+        schema.add_input('in_default_value', editor_conf.DataType.BOOLEAN, label='Value', value=False)
 
     def execute(self):
         pm.addAttr(self.in_node_name.value(), ln=self.in_attr_name.value(), at='bool', k=True, dv=self.in_default_value.value())
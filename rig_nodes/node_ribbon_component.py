@@ -12,26 +12,26 @@ class RibbonComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.RibbonComponent
 
-    def init_sockets(self, reset=True):
-        super(RibbonComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(RibbonComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('ribbon')
+        schema.set_value('in_name', 'ribbon')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.RIBBON_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.RIBBON_COMPONENT)
 
         # Create new inputs
-        self.in_surface = self.add_input(editor_conf.DataType.STRING, label='Surface')
-        self.in_num_controls = self.add_input(editor_conf.DataType.NUMERIC, label='Num Controls', value=3)
-        self.in_skel_joint_parent = self.add_input(editor_conf.DataType.STRING, label='Parent Skeleton Joint')
-        self.in_span = self.add_input(editor_conf.DataType.STRING, label='Span', value='u')
-        self.in_num_rivets_override = self.add_input(editor_conf.DataType.NUMERIC, label='Override rivets number', value=0)
-        self.in_fk_hierachy = self.add_input(editor_conf.DataType.BOOLEAN, label='FK Hierachy', value=False)
-        self.in_flip_rivets_normal = self.add_input(editor_conf.DataType.BOOLEAN, label='Flip Rivets Normal', value=False)
+        schema.add_input('in_surface', editor_conf.DataType.STRING, label='Surface')
+        schema.add_input('in_num_controls', editor_conf.DataType.NUMERIC, label='Num Controls', value=3)
+        schema.add_input('in_skel_joint_parent', editor_conf.DataType.STRING, label='Parent Skeleton Joint')
+        schema.add_input('in_span', editor_conf.DataType.STRING, label='Span', value='u')
+        schema.add_input('in_num_rivets_override', editor_conf.DataType.NUMERIC, label='Override rivets number', value=0)
+        schema.add_input('in_fk_hierachy', editor_conf.DataType.BOOLEAN, label='FK Hierachy', value=False)
+        schema.add_input('in_flip_rivets_normal', editor_conf.DataType.BOOLEAN, label='Flip Rivets Normal', value=False)
 
         # Mark required
-        self.mark_inputs_required((self.in_surface,
-                                   self.in_span))
+        schema.set_required('in_surface', 'in_span')
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(character=self.in_character.value(),
@@ -11,11 +11,13 @@ class SequenceNode(luna_node.LunaNode):
     DEFAULT_TITLE = 'Sequence'
     CATEGORY = 'Utils'
 
-    def init_sockets(self, reset=True):
-        self.exec_in_socket = self.add_input(editor_conf.DataType.EXEC)
-        self.exec_out_socket = self.add_output(editor_conf.DataType.EXEC, label='Then 0')
+    @classmethod
+    def define_sockets(cls, schema):
+        super(SequenceNode, cls).define_sockets(schema)
+        schema.add_input('exec_in_socket', editor_conf.DataType.EXEC)
+        schema.add_output('exec_out_socket', editor_conf.DataType.EXEC, label='Then 0')
         for i in range(1, 6):
-            self.add_output(editor_conf.DataType.EXEC, label='Then {0}'.format(i))
+            schema.add_output('out_then_{0}'.format(i), editor_conf.DataType.EXEC, label='Then {0}'.format(i))
 
 
 def register_plugin():
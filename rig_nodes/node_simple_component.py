@@ -13,13 +13,14 @@ class SimpleComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.SimpleComponent
 
-    def init_sockets(self, reset=True):
-        super(SimpleComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(SimpleComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('simple')
+        schema.set_value('in_name', 'simple')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.SIMPLE_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.SIMPLE_COMPONENT)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(meta_parent=self.in_meta_parent.value(),
@@ -15,11 +15,12 @@ class SpineNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = spine_component.SpineComponent
 
-    def init_sockets(self, reset=True):
-        super(SpineNode, self).init_sockets(reset=reset)
-        self.in_name.set_value('spine')
-        self.in_tag.set_value('body')
-        self.out_self.data_type = editor_conf.DataType.SPINE_COMPONENT
+    @classmethod
+    def define_sockets(cls, schema):
+        super(SpineNode, cls).define_sockets(schema)
+        schema.set_value('in_name', 'spine')
+        schema.set_value('in_tag', 'body')
+        schema.set_data_type('out_self', editor_conf.DataType.SPINE_COMPONENT)
 
 
 class FKIKSpineNode(SpineNode):
@@ -27,20 +28,21 @@ class FKIKSpineNode(SpineNode):
     DEFAULT_TITLE = 'FKIK Spine'
     COMPONENT_CLASS = luna_rig.components.FKIKSpineComponent
 
-    def init_sockets(self, reset=True):
-        super(FKIKSpineNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(FKIKSpineNode, cls).define_sockets(schema)
         # Override types
-        self.out_self.data_type = editor_conf.DataType.FKIK_SPINE_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.FKIK_SPINE_COMPONENT)
 
         # Add inputs
-        self.in_start_joint = self.add_input(editor_conf.DataType.STRING, label='Start Joint', value=None)
-        self.in_end_joint = self.add_input(editor_conf.DataType.STRING, label='End Joint', value=None)
-        self.mark_input_as_required(self.in_start_joint)
-
-        self.out_hook_root = self.add_output(editor_conf.DataType.NUMERIC, label='Hook Root', value=self.COMPONENT_CLASS.Hooks.ROOT.value)
-        self.out_hook_hips = self.add_output(editor_conf.DataType.NUMERIC, label='Hook Hips', value=self.COMPONENT_CLASS.Hooks.HIPS.value)
-        self.out_hook_mid = self.add_output(editor_conf.DataType.NUMERIC, label='Hook Mid', value=self.COMPONENT_CLASS.Hooks.MID.value)
-        self.out_hook_chest = self.add_output(editor_conf.DataType.NUMERIC, label='Hook Chest', value=self.COMPONENT_CLASS.Hooks.CHEST.value)
+        schema.add_input('in_start_joint', editor_conf.DataType.STRING, label='Start Joint')
+        schema.add_input('in_end_joint', editor_conf.DataType.STRING, label='End Joint')
+        schema.set_required('in_start_joint')
+
+        schema.add_output('out_hook_root', editor_conf.DataType.NUMERIC, label='Hook Root', value=cls.COMPONENT_CLASS.Hooks.ROOT.value)
+        schema.add_output('out_hook_hips', editor_conf.DataType.NUMERIC, label='Hook Hips', value=cls.COMPONENT_CLASS.Hooks.HIPS.value)
+        schema.add_output('out_hook_mid', editor_conf.DataType.NUMERIC, label='Hook Mid', value=cls.COMPONENT_CLASS.Hooks.MID.value)
+        schema.add_output('out_hook_chest', editor_conf.DataType.NUMERIC, label='Hook Chest', value=cls.COMPONENT_CLASS.Hooks.CHEST.value)
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(meta_parent=self.in_meta_parent.value(),
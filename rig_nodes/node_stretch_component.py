@@ -12,23 +12,22 @@ class IKSplineStretchComponentNode(base_component.ComponentNode):
     CATEGORY = 'Components'
     COMPONENT_CLASS = luna_rig.components.IKSplineStretchComponent
 
-    def init_sockets(self, reset=True):
-        super(IKSplineStretchComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(IKSplineStretchComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('stretch')
+        schema.set_value('in_name', 'stretch')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.IK_SPLINE_STRETCH_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.IK_SPLINE_STRETCH_COMPONENT)
 
-        self.in_switch_control = self.add_input(editor_conf.DataType.CONTROL, label='Switch Control')
-        self.in_default_state = self.add_input(editor_conf.DataType.BOOLEAN, label='Default State', value=False)
-        self.in_switch_attr_name = self.add_input(editor_conf.DataType.STRING, label='Stretch Attribute', value='stretch')
-        self.in_stretch_axis = self.add_input(editor_conf.DataType.STRING, label='Stretch Axis', value='x')
+        schema.add_input('in_switch_control', editor_conf.DataType.CONTROL, label='Switch Control')
+        schema.add_input('in_default_state', editor_conf.DataType.BOOLEAN, label='Default State', value=False)
+        schema.add_input('in_switch_attr_name', editor_conf.DataType.STRING, label='Stretch Attribute', value='stretch')
+        schema.add_input('in_stretch_axis', editor_conf.DataType.STRING, label='Stretch Axis', value='x')
 
         # Mark required
-        self.mark_inputs_required((self.in_meta_parent,
-                                   self.in_switch_attr_name,
-                                   self.in_stretch_axis))
+        schema.set_required('in_meta_parent', 'in_switch_attr_name', 'in_stretch_axis')
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(self.in_meta_parent.value(),
@@ -50,20 +49,21 @@ class IKStretchComponentNode(base_component.ComponentNode):
     CATEGORY = 'Components'
     COMPONENT_CLASS = luna_rig.components.IKStretchComponent
 
-    def init_sockets(self, reset=True):
-        super(IKStretchComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(IKStretchComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('stretch')
+        schema.set_value('in_name', 'stretch')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.IK_STRETCH_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.IK_STRETCH_COMPONENT)
 
-        self.in_switch_control = self.add_input(editor_conf.DataType.CONTROL, label='Switch Control')
-        self.in_default_state = self.add_input(editor_conf.DataType.BOOLEAN, label='Default State', value=False)
-        self.in_toggle_attr_name = self.add_input(editor_conf.DataType.STRING, label='Stretch Attribute', value='stretch')
-        self.in_stretch_axis = self.add_input(editor_conf.DataType.STRING, label='Stretch Axis', value='x')
-        self.in_threshold = self.add_input(editor_conf.DataType.NUMERIC, label='Threshold', value=0.0)
-        self.in_threshold_attr_name = self.add_input(editor_conf.DataType.STRING, label='Threshold Attribute', value='stretchThreshold')
+        schema.add_input('in_switch_control', editor_conf.DataType.CONTROL, label='Switch Control')
+        schema.add_input('in_default_state', editor_conf.DataType.BOOLEAN, label='Default State', value=False)
+        schema.add_input('in_toggle_attr_name', editor_conf.DataType.STRING, label='Stretch Attribute', value='stretch')
+        schema.add_input('in_stretch_axis', editor_conf.DataType.STRING, label='Stretch Axis', value='x')
+        schema.add_input('in_threshold', editor_conf.DataType.NUMERIC, label='Threshold', value=0.0)
+        schema.add_input('in_threshold_attr_name', editor_conf.DataType.STRING, label='Threshold Attribute', value='stretchThreshold')
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(self.in_meta_parent.value(),
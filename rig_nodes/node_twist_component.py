@@ -13,28 +13,29 @@ class TwistComponentNode(base_component.AnimComponentNode):
     UNIQUE = False
     COMPONENT_CLASS = luna_rig.components.TwistComponent
 
-    def init_sockets(self, reset=True):
-        super(TwistComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(TwistComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('twist')
+        schema.set_value('in_name', 'twist')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.TWIST_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.TWIST_COMPONENT)
 
         # Delete sockets
-        self.remove_socket('In Hook', is_input=True)
-        self.remove_socket('In Hook', is_input=False)
+        schema.remove('in_hook')
+        schema.remove('out_in_hook')
 
         # # Create new inputs
-        self.in_start_joint = self.add_input(editor_conf.DataType.STRING, label='Start Joint', value=None)
-        self.in_end_joint = self.add_input(editor_conf.DataType.STRING, label='End Joint', value=None)
-        self.in_start_object = self.add_input(editor_conf.DataType.STRING, label='Start Object', value=None)
-        self.in_end_object = self.add_input(editor_conf.DataType.STRING, label='End Object', value=None)
-        self.in_num_joints = self.add_input(editor_conf.DataType.NUMERIC, label='Num Joints', value=2)
-        self.in_is_mirrored = self.add_input(editor_conf.DataType.BOOLEAN, label='Is Mirrored', value=False)
+        schema.add_input('in_start_joint', editor_conf.DataType.STRING, label='Start Joint')
+        schema.add_input('in_end_joint', editor_conf.DataType.STRING, label='End Joint')
+        schema.add_input('in_start_object', editor_conf.DataType.STRING, label='Start Object')
+        schema.add_input('in_end_object', editor_conf.DataType.STRING, label='End Object')
+        schema.add_input('in_num_joints', editor_conf.DataType.NUMERIC, label='Num Joints', value=2)
+        schema.add_input('in_is_mirrored', editor_conf.DataType.BOOLEAN, label='Is Mirrored', value=False)
 
         # Mark required
-        self.mark_input_as_required(self.in_start_joint)
+        schema.set_required('in_start_joint')
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(self.in_meta_parent.value(),
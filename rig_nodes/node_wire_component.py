@@ -12,23 +12,24 @@ class WireComponentNode(base_component.AnimComponentNode):
     CATEGORY = 'Components'
     COMPONENT_CLASS = luna_rig.components.WireComponent
 
-    def init_sockets(self, reset=True):
-        super(WireComponentNode, self).init_sockets(reset=reset)
+    @classmethod
+    def define_sockets(cls, schema):
+        super(WireComponentNode, cls).define_sockets(schema)
         # Override inputs
-        self.in_name.set_value('wire')
+        schema.set_value('in_name', 'wire')
 
         # Override Outputs
-        self.out_self.data_type = editor_conf.DataType.WIRE_COMPONENT
+        schema.set_data_type('out_self', editor_conf.DataType.WIRE_COMPONENT)
 
         # Create new inputs
-        self.in_curve = self.add_input(editor_conf.DataType.STRING, label='Curve')
-        self.in_geometry = self.add_input(editor_conf.DataType.STRING, label='Geometry')
-        self.in_dropoff_distance = self.add_input(editor_conf.DataType.NUMERIC, label='Dropoff', value=100.0)
-        self.in_num_controls = self.add_input(editor_conf.DataType.NUMERIC, label='Number Controls', value=4)
-        self.in_control_lines = self.add_input(editor_conf.DataType.BOOLEAN, label='Control Lines', value=True)
+        schema.add_input('in_curve', editor_conf.DataType.STRING, label='Curve')
+        schema.add_input('in_geometry', editor_conf.DataType.STRING, label='Geometry')
+        schema.add_input('in_dropoff_distance', editor_conf.DataType.NUMERIC, label='Dropoff', value=100.0)
+        schema.add_input('in_num_controls', editor_conf.DataType.NUMERIC, label='Number Controls', value=4)
+        schema.add_input('in_control_lines', editor_conf.DataType.BOOLEAN, label='Control Lines', value=True)
 
         # Mark required
-        self.mark_inputs_required((self.in_curve, self.in_geometry))
+        schema.set_required('in_curve', 'in_geometry')
 
     def execute(self):
         self.component_instance = self.COMPONENT_CLASS.create(character=self.in_character.value(),
@@ -0,0 +1,21 @@
+"""Tests cover editor modules that don't need Maya or a running Qt application.
+
+Editor directory is added to import path so these modules are imported without luna_builder package init,
+which builds the main window. Run them from this directory, pytest imports the package init when started from repo root.
+"""
+import os
+import sys
+import types
+import logging
+
+EDITOR_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'editor')
+if EDITOR_DIR not in sys.path:
+    sys.path.insert(0, EDITOR_DIR)
+
+# Pure editor modules only need luna Logger, provide it when luna is not installed
+try:
+    import luna  # noqa: F401
+except ImportError:
+    luna_stub = types.ModuleType('luna')
+    luna_stub.Logger = logging.getLogger('luna')
+    sys.modules['luna'] = luna_stub
@@ -0,0 +1,98 @@
+import pytest
+
+node_socket = pytest.importorskip('luna_builder.editor.node_socket')
+editor_conf = pytest.importorskip('luna_builder.editor.editor_conf')
+
+
+class CustomData(object):
+    pass
+
+
+class FakeScene(object):
+
+    def add_socket(self, socket):
+        pass
+
+
+class FakeNode(object):
+    """Minimal socket owner in headless scene."""
+
+    def __init__(self):
+        self.scene = FakeScene()
+        self.gr_node = None
+
+    def update_size(self):
+        pass
+
+    def invalidate_serialized(self):
+        pass
+
+    def set_compiled(self, *args):
+        pass
+
+
+@pytest.fixture
+def custom_type():
+    type_name = 'TEST_CUSTOM_DATA'
+    editor_conf.DataType.register_datatype(type_name, CustomData, '#123456', label='Custom')
+    yield type_name
+    desc = editor_conf.DATATYPE_REGISTER.pop(type_name)
+    editor_conf._INTERNED_DATATYPES.pop(type_name, None)
+    if editor_conf.DATATYPE_CLASS_INDEX.get(CustomData) is desc:
+        del editor_conf.DATATYPE_CLASS_INDEX[CustomData]
+
+
+def plain_copy(type_name):
+    return dict(editor_conf.DATATYPE_REGISTER[type_name])
+
+
+def test_plain_dict_resolves_to_registered(custom_type):
+    desc = editor_conf.DataType.resolve(plain_copy(custom_type))
+    assert desc is editor_conf.DATATYPE_REGISTER[custom_type]
+    assert editor_conf.DataType.resolve(custom_type) is desc
+
+
+def test_type_name_of_plain_dict(custom_type):
+    assert editor_conf.DataType.get_type_name(plain_copy(custom_type)) == custom_type
+
+
+def test_unregistered_dict_raises():
+    with pytest.raises(IndexError):
+        editor_conf.DataType.get_type_name({'class': CustomData, 'label': 'Unknown', 'default': None})
+
+
+def test_descriptors_equal_by_name(custom_type):
+    desc = editor_conf.DATATYPE_REGISTER[custom_type]
+    assert desc == editor_conf.DataType.get_type(custom_type)
+    assert hash(desc) == hash(custom_type)
+    assert desc != plain_copy(custom_type)
+
+
+def test_socket_interns_plain_dict(custom_type):
+    socket = node_socket.InputSocket(FakeNode(), data_type=plain_copy(custom_type))
+    assert socket.data_type is editor_conf.DATATYPE_REGISTER[custom_type]
+    assert socket.serialize()['data_type'] == custom_type
+
+
+def test_socket_default_datatype_is_registered():
+    socket = node_socket.InputSocket(FakeNode())
+    assert socket.data_type is editor_conf.DATATYPE_REGISTER['NUMERIC']
+
+
+def test_exec_identity_from_plain_dict():
+    socket = node_socket.OutputSocket(FakeNode(), data_type=plain_copy('EXEC'))
+    assert socket.data_type == editor_conf.DataType.EXEC
+    assert socket.is_exec()
+
+
+def test_list_value_changed_in_place_is_serialized():
+    socket = node_socket.InputSocket(FakeNode(), data_type=editor_conf.DataType.LIST, value=[1])
+    first = socket.serialize()
+    socket.value().append(2)
+    assert first['value'] == [1]
+    assert socket.serialize()['value'] == [1, 2]
+
+
+def test_plain_value_record_is_cached():
+    socket = node_socket.InputSocket(FakeNode(), data_type=editor_conf.DataType.STRING, value='name')
+    assert socket.serialize() is socket.serialize()
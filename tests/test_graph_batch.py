@@ -0,0 +1,36 @@
+import io
+import json
+
+import graph_batch
+
+
+class FakeProcess(object):
+
+    def __init__(self, output):
+        self.stdout = io.StringIO(output)
+
+
+def read(output):
+    worker = graph_batch.WorkerProcess('mayapy')
+    worker.process = FakeProcess(output)
+    log_lines = []
+    result = worker.read_until(graph_batch.RESULT_PREFIX, log_lines)
+    return result, log_lines
+
+
+def test_result_at_line_start():
+    result, log_lines = read(u'building\n{0}{1}\n'.format(graph_batch.RESULT_PREFIX, json.dumps({'status': 'ok'})))
+    assert result == {'status': 'ok'}
+    assert log_lines == ['building\n']
+
+
+def test_result_after_unterminated_output():
+    result, log_lines = read(u'# Warning: no newline{0}{1}\n'.format(graph_batch.RESULT_PREFIX, json.dumps({'status': 'ok'})))
+    assert result == {'status': 'ok'}
+    assert log_lines == ['# Warning: no newline\n']
+
+
+def test_missing_result():
+    result, log_lines = read(u'crashed\n')
+    assert result is None
+    assert log_lines == ['crashed\n']
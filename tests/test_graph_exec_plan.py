@@ -0,0 +1,218 @@
+import pytest
+
+import graph_exec_plan
+
+
+class FakeSocket(object):
+
+    def __init__(self, node, name):
+        self.node = node
+        self.name = name
+        self.connections = []
+
+    def list_connections(self):
+        return self.connections
+
+    def connect(self, other):
+        self.connections = [other]
+        other.connections = [self]
+
+
+class FakeNode(object):
+    """Exec graph node with named exec outputs. Branching nodes activate one of them."""
+
+    def __init__(self, title, outputs=('out',), branching=False, loop_output=None):
+        self.title = title
+        self.BRANCHING = branching
+        self.exec_in = FakeSocket(self, 'in')
+        self.exec_outputs = [FakeSocket(self, name) for name in outputs]
+        self.loop_output = FakeSocket(self, loop_output) if loop_output else None
+        self.active = self.exec_outputs[0] if branching else None
+
+    def __repr__(self):
+        return self.title
+
+    def output(self, name):
+        return [socket for socket in self.exec_outputs if socket.name == name][0]
+
+    def list_all_exec_outputs(self):
+        return self.exec_outputs
+
+    def list_exec_outputs(self):
+        if self.BRANCHING:
+            return [self.active]
+        return self.exec_outputs
+
+    def list_loop_outputs(self):
+        return [self.loop_output] if self.loop_output else []
+
+
+def chain(*nodes):
+    for node, next_node in zip(nodes, nodes[1:]):
+        node.exec_outputs[-1].connect(next_node.exec_in)
+
+
+@pytest.fixture
+def plan():
+    return graph_exec_plan.ExecPlan(scene=None)
+
+
+def test_linear_chain(plan):
+    nodes = [FakeNode('n{0}'.format(index)) for index in range(4)]
+    chain(*nodes)
+    assert list(plan.get_queue(nodes[0])) == nodes
+
+
+def test_sequence_outputs_run_in_order(plan):
+    sequence = FakeNode('sequence', outputs=('then_0', 'then_1'))
+    first, second = FakeNode('first'), FakeNode('second')
+    sequence.output('then_0').connect(first.exec_in)
+    sequence.output('then_1').connect(second.exec_in)
+    assert list(plan.get_queue(sequence)) == [sequence, first, second]
+
+
+def test_branch_compiles_segment_per_output(plan):
+    start = FakeNode('start')
+    branch = FakeNode('branch', outputs=('true', 'false'), branching=True)
+    on_true, on_false = FakeNode('on_true'), FakeNode('on_false')
+    after = FakeNode('after')
+    chain(start, branch)
+    branch.output('true').connect(on_true.exec_in)
+    branch.output('false').connect(on_false.exec_in)
+    chain(on_true, after)
+
+    segment = plan.get_segment(start)
+    assert segment[0] is start
+    step = segment[1]
+    assert isinstance(step, graph_exec_plan.BranchStep)
+    assert step.node is branch
+    assert list(step.segments.keys()) == branch.exec_outputs
+    assert step.segments[branch.output('true')] == [on_true, after]
+    assert step.segments[branch.output('false')] == [on_false]
+
+
+def test_branch_resolved_at_flatten_without_recompile(plan):
+    branch = FakeNode('branch', outputs=('true', 'false'), branching=True)
+    on_true, on_false = FakeNode('on_true'), FakeNode('on_false')
+    branch.output('true').connect(on_true.exec_in)
+    branch.output('false').connect(on_false.exec_in)
+
+    segment = plan.get_segment(branch)
+    assert list(plan.get_queue(branch)) == [branch, on_true]
+    branch.active = branch.output('false')
+    assert list(plan.get_queue(branch)) == [branch, on_false]
+    assert plan.get_segment(branch) is segment
+
+
+def test_unconnected_branch_output(plan):
+    branch = FakeNode('branch', outputs=('true', 'false'), branching=True)
+    branch.active = branch.output('false')
+    assert list(plan.get_queue(branch)) == [branch]
+
+
+def test_loop_body_is_separate_segment(plan):
+    loop = FakeNode('for_each', outputs=('completed',), loop_output='body')
+    body_a, body_b = FakeNode('body_a'), FakeNode('body_b')
+    after = FakeNode('after')
+    loop.loop_output.connect(body_a.exec_in)
+    chain(body_a, body_b)
+    chain(loop, after)
+
+    assert list(plan.get_queue(loop)) == [loop, after]
+    assert list(plan.get_loop_body(loop)) == [body_a, body_b]
+
+
+def test_loop_body_compiled_on_request(plan):
+    loop = FakeNode('for_each', outputs=('completed',), loop_output='body')
+    body = FakeNode('body')
+    loop.loop_output.connect(body.exec_in)
+    assert list(plan.get_loop_body(loop)) == [body]
+
+
+def test_empty_loop_body(plan):
+    loop = FakeNode('for_each', outputs=('completed',), loop_output='body')
+    assert list(plan.get_loop_body(loop)) == []
+
+
+def test_segments_are_cached(plan):
+    first, second = FakeNode('first'), FakeNode('second')
+    chain(first, second)
+    segment = plan.get_segment(first)
+    assert plan.get_segment(first) is segment
+
+    # Rewiring without invalidation keeps cached result
+    third = FakeNode('third')
+    chain(second, third)
+    assert list(plan.get_queue(first)) == [first, second]
+
+
+def test_invalidate_recompiles(plan):
+    first, second = FakeNode('first'), FakeNode('second')
+    loop = FakeNode('for_each', outputs=('completed',), loop_output='body')
+    body = FakeNode('body')
+    chain(first, second)
+    loop.loop_output.connect(body.exec_in)
+    plan.get_queue(first)
+    plan.get_loop_body(loop)
+
+    third, new_body = FakeNode('third'), FakeNode('new_body')
+    chain(second, third)
+    loop.loop_output.connect(new_body.exec_in)
+    plan.invalidate()
+    assert list(plan.get_queue(first)) == [first, second, third]
+    assert list(plan.get_loop_body(loop)) == [new_body]
+
+
+def test_cycle_is_broken(plan):
+    first, second = FakeNode('first'), FakeNode('second')
+    chain(first, second, first)
+    assert list(plan.get_queue(first)) == [first, second]
+
+
+def test_branch_cycle_is_broken(plan):
+    start = FakeNode('start')
+    body = FakeNode('body')
+    branch = FakeNode('branch', outputs=('true', 'false'), branching=True)
+    chain(start, body, branch)
+    branch.output('true').connect(body.exec_in)
+
+    segment = plan.get_segment(start)
+    assert segment[-1].segments[branch.output('true')] == []
+    assert list(plan.get_queue(start)) == [start, body, branch]
+
+
+def test_branch_cycle_to_segment_start(plan):
+    branch = FakeNode('branch', outputs=('true', 'false'), branching=True)
+    after = FakeNode('after')
+    branch.output('true').connect(after.exec_in)
+    chain(after, branch)
+    assert list(plan.get_queue(branch)) == [branch, after]
+
+
+def test_loop_cycle_is_broken(plan):
+    loop = FakeNode('for_each', outputs=('completed',), loop_output='body')
+    body = FakeNode('body')
+    loop.loop_output.connect(body.exec_in)
+    chain(body, loop)
+    assert list(plan.get_queue(loop)) == [loop]
+    assert list(plan.get_loop_body(loop)) == [body]
+
+
+def test_convergent_paths_run_node_for_each_path(plan):
+    sequence = FakeNode('sequence', outputs=('then_0', 'then_1'))
+    first, second, shared = FakeNode('first'), FakeNode('second'), FakeNode('shared')
+    sequence.output('then_0').connect(first.exec_in)
+    sequence.output('then_1').connect(second.exec_in)
+    first.exec_outputs[0].connections = [shared.exec_in]
+    second.exec_outputs[0].connections = [shared.exec_in]
+    assert list(plan.get_queue(sequence)) == [sequence, first, shared, second, shared]
+
+
+def test_convergent_branch_outputs(plan):
+    branch = FakeNode('branch', outputs=('true', 'false'), branching=True)
+    shared = FakeNode('shared')
+    branch.output('true').connections = [shared.exec_in]
+    branch.output('false').connections = [shared.exec_in]
+    assert list(plan.get_queue(branch)) == [branch, shared]
+    branch.active = branch.output('false')
+    assert list(plan.get_queue(branch)) == [branch, shared]
@@ -0,0 +1,71 @@
+import pytest
+
+import graphics_lod
+
+
+ENTER_REDUCED, LEAVE_REDUCED = graphics_lod.LevelOfDetail.THRESHOLDS[graphics_lod.REDUCED]
+ENTER_OVERVIEW, LEAVE_OVERVIEW = graphics_lod.LevelOfDetail.THRESHOLDS[graphics_lod.OVERVIEW]
+
+
+def zoom_through(lod, zooms):
+    tiers = []
+    for zoom in zooms:
+        lod.update(zoom)
+        tiers.append(lod.tier)
+    return tiers
+
+
+def test_thresholds_leave_gap():
+    assert ENTER_REDUCED < LEAVE_REDUCED
+    assert ENTER_OVERVIEW < LEAVE_OVERVIEW
+    assert LEAVE_OVERVIEW <= ENTER_REDUCED
+
+
+def test_initial_tier_from_zoom():
+    assert graphics_lod.LevelOfDetail(10).tier == graphics_lod.FULL
+    assert graphics_lod.LevelOfDetail(ENTER_REDUCED).tier == graphics_lod.REDUCED
+    assert graphics_lod.LevelOfDetail(ENTER_OVERVIEW).tier == graphics_lod.OVERVIEW
+
+
+def test_enter_reduced_at_threshold():
+    lod = graphics_lod.LevelOfDetail(10)
+    assert lod.tier_for_zoom(ENTER_REDUCED + 1) == graphics_lod.FULL
+    assert lod.tier_for_zoom(ENTER_REDUCED) == graphics_lod.REDUCED
+
+
+def test_leave_reduced_only_at_leave_threshold():
+    lod = graphics_lod.LevelOfDetail(ENTER_REDUCED)
+    tiers = zoom_through(lod, range(ENTER_REDUCED, LEAVE_REDUCED + 1))
+    assert tiers[:-1] == [graphics_lod.REDUCED] * (len(tiers) - 1)
+    assert tiers[-1] == graphics_lod.FULL
+
+
+def test_leave_overview_only_at_leave_threshold():
+    lod = graphics_lod.LevelOfDetail(ENTER_OVERVIEW)
+    tiers = zoom_through(lod, range(ENTER_OVERVIEW, LEAVE_OVERVIEW + 1))
+    assert tiers[:-1] == [graphics_lod.OVERVIEW] * (len(tiers) - 1)
+    assert tiers[-1] == graphics_lod.REDUCED
+
+
+@pytest.mark.parametrize('zoom', [ENTER_REDUCED + 1, LEAVE_REDUCED - 1])
+def test_no_flicker_between_thresholds(zoom):
+    lod = graphics_lod.LevelOfDetail(ENTER_REDUCED)
+    for _ in range(3):
+        assert not lod.update(zoom)
+        assert not lod.update(zoom - 1)
+    assert lod.tier == graphics_lod.REDUCED
+
+
+def test_jump_skips_tiers():
+    lod = graphics_lod.LevelOfDetail(10)
+    assert lod.update(ENTER_OVERVIEW - 1)
+    assert lod.tier == graphics_lod.OVERVIEW
+    assert lod.update(10)
+    assert lod.tier == graphics_lod.FULL
+
+
+def test_update_reports_change():
+    lod = graphics_lod.LevelOfDetail(10)
+    assert not lod.update(10)
+    assert lod.update(ENTER_REDUCED)
+    assert not lod.update(ENTER_REDUCED)
@@ -0,0 +1,171 @@
+import json
+import zlib
+import struct
+from collections import OrderedDict
+
+import pytest
+
+import node_scene_format as scene_format
+
+
+def make_socket(socket_id, index, data_type='Numeric', label='Value', value=0.0):
+    return OrderedDict([('id', socket_id),
+                        ('index', index),
+                        ('position', 1),
+                        ('data_type', data_type),
+                        ('max_connections', 1),
+                        ('label', label),
+                        ('value', value)])
+
+
+def make_node(node_id, title, inputs, outputs, **extra):
+    data = OrderedDict([('id', node_id),
+                        ('node_id', 100),
+                        ('title', title),
+                        ('pos_x', 10.0),
+                        ('pos_y', -20.0),
+                        ('inputs', inputs),
+                        ('outputs', outputs)])
+    data.update(extra)
+    return data
+
+
+@pytest.fixture
+def scene_data():
+    nodes = [make_node('node_a', 'Constant', [], [make_socket('a_out', 0, label='Value', value=3.5)]),
+             make_node('node_b', 'Constant', [], [make_socket('b_out', 0, label='Value', value=1.0)]),
+             make_node('node_c', 'Add', [make_socket('c_in1', 0, label='Value'), make_socket('c_in2', 1, label='Value')],
+                       [make_socket('c_out', 0, data_type='String', label='Result', value='')],
+                       var_name='total')]
+    edges = [OrderedDict([('id', 'edge_1'), ('start', 'a_out'), ('end', 'c_in1')]),
+             OrderedDict([('id', 'edge_2'), ('start', 'b_out'), ('end', 'c_in2')])]
+    return OrderedDict([('id', 'scene'),
+                        ('vars', OrderedDict([('total', [0.0, 'Numeric'])])),
+                        ('scene_width', 64000),
+                        ('scene_height', 64000),
+                        ('edge_type', 'BEZIER'),
+                        ('nodes', nodes),
+                        ('edges', edges)])
+
+
+def json_roundtrip(value):
+    return json.loads(json.dumps(value), object_pairs_hook=OrderedDict)
+
+
+@pytest.mark.parametrize('codec', [scene_format.CODEC_ZLIB, scene_format.CODEC_LZMA])
+def test_roundtrip_matches_json_records(tmp_path, scene_data, codec):
+    if codec == scene_format.CODEC_LZMA and not scene_format.lzma:
+        pytest.skip('LZMA is not available')
+    file_path = str(tmp_path / 'build.rig')
+    scene_format.write_compact(file_path, scene_data, codec=codec)
+
+    assert scene_format.is_compact(file_path)
+    expected = [(kind, json_roundtrip(record)) for kind, record in scene_format.iter_json_records(scene_data)]
+    assert list(scene_format.read_records(file_path)) == expected
+
+
+def test_read_records_of_json_file(tmp_path, scene_data):
+    file_path = str(tmp_path / 'build.rig')
+    with open(file_path, 'w') as build_file:
+        json.dump(scene_data, build_file)
+
+    assert not scene_format.is_compact(file_path)
+    records = list(scene_format.read_records(file_path))
+    assert [kind for kind, record in records] == ['scene', 'node', 'node', 'node', 'edge', 'edge']
+    assert records[0][1]['items_count'] == 5
+
+
+def test_string_table_interns_repeated_strings(scene_data):
+    frames = scene_format.encode_frames(scene_data)
+    assert frames[0][0] == scene_format.FRAME_STRINGS
+    strings = frames[0][1]
+    assert len(strings) == len(set(strings))
+    assert sorted(strings) == sorted(['Constant', 'Add', 'Numeric', 'String', 'Value', 'Result'])
+
+    node_frames = [frame for frame in frames if frame[0] == scene_format.FRAME_NODE]
+    assert strings[node_frames[0][3]] == 'Constant'
+    assert node_frames[0][3] == node_frames[1][3]
+    assert strings[node_frames[2][6][1][5]] == 'Value'
+
+
+def test_scene_frame_counts_items(scene_data):
+    scene_frame = scene_format.encode_frames(scene_data)[1]
+    assert scene_frame[0] == scene_format.FRAME_SCENE
+    assert scene_frame[6] == 5
+
+
+def test_edge_sockets_stored_as_refs(tmp_path, scene_data):
+    frames = scene_format.encode_frames(scene_data)
+    edge_frames = [frame for frame in frames if frame[0] == scene_format.FRAME_EDGE]
+    # Sockets are numbered in node frames order: a_out, b_out, c_in1, c_in2, c_out
+    assert [frame[2:4] for frame in edge_frames] == [[0, 2], [1, 3]]
+
+    file_path = str(tmp_path / 'build.rig')
+    scene_format.write_compact(file_path, scene_data, codec=scene_format.CODEC_ZLIB)
+    edges = [record for kind, record in scene_format.iter_records(file_path) if kind == 'edge']
+    assert [(edge['start'], edge['end']) for edge in edges] == [('a_out', 'c_in1'), ('b_out', 'c_in2')]
+
+
+def test_unknown_socket_id_is_kept(tmp_path, scene_data):
+    scene_data['edges'].append(OrderedDict([('id', 'edge_3'), ('start', 'c_out'), ('end', 'missing_socket')]))
+    file_path = str(tmp_path / 'build.rig')
+    scene_format.write_compact(file_path, scene_data, codec=scene_format.CODEC_ZLIB)
+    edges = [record for kind, record in scene_format.iter_records(file_path) if kind == 'edge']
+    assert (edges[-1]['start'], edges[-1]['end']) == ('c_out', 'missing_socket')
+
+
+def test_extra_node_keys_are_kept(tmp_path, scene_data):
+    file_path = str(tmp_path / 'build.rig')
+    scene_format.write_compact(file_path, scene_data, codec=scene_format.CODEC_ZLIB)
+    nodes = [record for kind, record in scene_format.iter_records(file_path) if kind == 'node']
+    assert nodes[2]['var_name'] == 'total'
+    assert 'var_name' not in nodes[0]
+
+
+def write_raw(file_path, payload, version=scene_format.VERSION):
+    with open(file_path, 'wb') as build_file:
+        build_file.write(scene_format.MAGIC + struct.pack('>BB', version, scene_format.CODEC_ZLIB))
+        build_file.write(zlib.compress(payload))
+
+
+def test_truncated_frame_raises(tmp_path):
+    file_path = str(tmp_path / 'build.rig')
+    frame = json.dumps([scene_format.FRAME_STRINGS, ['Constant']]).encode('utf-8')
+    write_raw(file_path, struct.pack('>I', len(frame)) + frame[:-4])
+    with pytest.raises(scene_format.FormatError):
+        list(scene_format.iter_frames(file_path))
+
+
+def test_truncated_file_raises(tmp_path, scene_data):
+    file_path = str(tmp_path / 'build.rig')
+    scene_data['nodes'] *= 50
+    scene_format.write_compact(file_path, scene_data, codec=scene_format.CODEC_ZLIB)
+    with open(file_path, 'rb') as build_file:
+        data = build_file.read()
+    with open(file_path, 'wb') as build_file:
+        build_file.write(data[:len(data) // 2])
+    with pytest.raises(scene_format.FormatError):
+        list(scene_format.iter_frames(file_path))
+
+
+def test_frames_are_decoded_progressively(tmp_path, scene_data):
+    file_path = str(tmp_path / 'build.rig')
+    scene_format.write_compact(file_path, scene_data, codec=scene_format.CODEC_ZLIB)
+    frames = scene_format.iter_frames(file_path)
+    assert next(frames)[0] == scene_format.FRAME_STRINGS
+    assert next(frames)[0] == scene_format.FRAME_SCENE
+
+
+def test_rejects_other_files(tmp_path):
+    file_path = str(tmp_path / 'build.rig')
+    with open(file_path, 'wb') as build_file:
+        build_file.write(b'{"nodes": []}')
+    with pytest.raises(scene_format.FormatError):
+        list(scene_format.iter_frames(file_path))
+
+
+def test_rejects_newer_version(tmp_path):
+    file_path = str(tmp_path / 'build.rig')
+    write_raw(file_path, b'', version=scene_format.VERSION + 1)
+    with pytest.raises(scene_format.FormatError):
+        list(scene_format.iter_frames(file_path))